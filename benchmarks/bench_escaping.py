@@ -0,0 +1,80 @@
+"""
+Measure the cost of escaping special LaTeX characters when rendering.
+
+Renders a table of one million cells with escaping enabled and disabled,
+once with plain text and once with a special character in every tenth
+cell, and compares both against escaping every cell up front with a chain
+of `str.replace` calls.
+
+Run with `python benchmarks/bench_escaping.py [--rows N] [--cols N]`.
+"""
+
+import argparse
+import time
+
+from texable import Table
+from texable.escaping import LATEX_ESCAPES
+
+
+def make_data(num_rows: int, num_cols: int, dirty: bool) -> list[list[str]]:
+    return [
+        [
+            f"item_{i} & {j}%" if dirty and (i + j) % 10 == 0 else f"item {i} {j}"
+            for j in range(num_cols)
+        ]
+        for i in range(num_rows)
+    ]
+
+
+def replace_chain(text: str) -> str:
+    # Backslashes are swapped out first, since the other escapes add them
+    text = text.replace("\\", "\x01")
+    for char in "{}&%$#_~^":
+        text = text.replace(char, LATEX_ESCAPES[char])
+    return text.replace("\x01", LATEX_ESCAPES["\\"])
+
+
+def best_of(repeat: int, func) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def render(data: list[list[str]], escape: bool) -> str:
+    table = Table(data)
+    table.escape = escape
+    return table.to_latex()
+
+
+def render_pre_escaped(data: list[list[str]]) -> str:
+    table = Table([[replace_chain(value) for value in row] for row in data])
+    table.escape = False
+    return table.to_latex()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--cols", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{args.rows * args.cols:,} cells, best of {args.repeat}")
+    for dirty in (False, True):
+        data = make_data(args.rows, args.cols, dirty)
+        unescaped = best_of(args.repeat, lambda: render(data, escape=False))
+        escaped = best_of(args.repeat, lambda: render(data, escape=True))
+        chained = best_of(args.repeat, lambda: render_pre_escaped(data))
+
+        label = "10% special characters" if dirty else "plain text"
+        print(f"\n{label}:")
+        print(f"  unescaped          {unescaped:8.3f} s")
+        print(f"  escaped            {escaped:8.3f} s  (+{escaped / unescaped - 1:.0%})")
+        print(f"  str.replace chain  {chained:8.3f} s  (+{chained / unescaped - 1:.0%})")
+
+
+if __name__ == "__main__":
+    main()
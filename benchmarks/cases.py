@@ -0,0 +1,167 @@
+"""
+Benchmark cases.
+
+Every `bench_*` function takes the number of cells and a scratch directory,
+does its setup and returns the function to measure. It is called again
+before every measurement, so the measured function may modify its table.
+
+Cases that do not depend on the table size set `size_independent` and are
+run once. A measured function that measures itself, e.g. in a subprocess,
+returns a `Measurement`.
+"""
+
+import os
+import subprocess
+import sys
+from typing import Any, Callable, NamedTuple
+
+import generators
+from texable import Table
+from texable.formatters import bold, cell_color, text_color
+from texable.grid import Grid
+from texable.rules import ColorScale, HighlightMax, Threshold
+
+Benchmark = Callable[[], Any]
+
+
+class Measurement(NamedTuple):
+    """Time and peak memory measured by a benchmark itself."""
+
+    time: float
+    peak_memory: int
+
+
+_IMPORT_TIME_SCRIPT = """
+import time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+_IMPORT_MEMORY_SCRIPT = """
+import tracemalloc
+tracemalloc.start()
+import {module}
+print(tracemalloc.get_traced_memory()[1])
+"""
+
+
+def _data_file(num_cells: int, workdir: str, extension: str) -> str:
+    """Return a CSV or TSV file of mixed data, generating it on first use."""
+    path = os.path.join(workdir, f"mixed_{num_cells}.{extension}")
+    if not os.path.exists(path):
+        delimiter = "\t" if extension == "tsv" else ","
+        generators.write_delimited(path, generators.mixed_rows(num_cells), delimiter)
+    return path
+
+
+def bench_grid_construction(num_cells: int, workdir: str) -> Benchmark:
+    data = generators.mixed_rows(num_cells)
+    return lambda: Grid(data)
+
+
+def bench_from_csv(num_cells: int, workdir: str) -> Benchmark:
+    path = _data_file(num_cells, workdir, "csv")
+    return lambda: Table.from_file(path)
+
+
+def bench_from_tsv(num_cells: int, workdir: str) -> Benchmark:
+    path = _data_file(num_cells, workdir, "tsv")
+    return lambda: Table.from_file(path)
+
+
+def bench_from_csv_infer_dtypes(num_cells: int, workdir: str) -> Benchmark:
+    path = _data_file(num_cells, workdir, "csv")
+    return lambda: Table.from_file(path, infer_dtypes=True)
+
+
+def bench_row_add_formatters(num_cells: int, workdir: str) -> Benchmark:
+    table = Table(generators.mixed_rows(num_cells))
+
+    def run() -> None:
+        for row in table.rows[::2]:
+            row.add_formatters(bold)
+
+    return run
+
+
+def bench_append_rows(num_cells: int, workdir: str) -> Benchmark:
+    rows = list(generators.mixed_rows(num_cells))
+
+    def run() -> None:
+        table = Table(rows[:1])
+        table.horizontal_borders.all()
+        for row in rows[1:]:
+            table.append_row(row)
+
+    return run
+
+
+def bench_to_latex_plain(num_cells: int, workdir: str) -> Benchmark:
+    table = Table(generators.mixed_rows(num_cells))
+    return table.to_latex
+
+
+def bench_to_latex_headers_borders(num_cells: int, workdir: str) -> Benchmark:
+    table = Table(generators.mixed_rows(num_cells))
+    table.headers = [f"Column {j}" for j in range(table.num_columns)]
+    table.horizontal_borders.all()
+    table.vertical_borders.all()
+    return table.to_latex
+
+
+def bench_to_latex_colors(num_cells: int, workdir: str) -> Benchmark:
+    table = Table(generators.mixed_rows(num_cells))
+    for row in table.rows[::3]:
+        row.add_formatters(text_color("red"))
+    table.columns[0].add_formatters(cell_color("gray"))
+    return table.to_latex
+
+
+def bench_to_latex_rules(num_cells: int, workdir: str) -> Benchmark:
+    table = Table(generators.mixed_rows(num_cells))
+    table.columns[1].add_rules(HighlightMax(), ColorScale())
+    table.columns[2].add_rules(Threshold(text_color("red"), above=0.5))
+    return table.to_latex
+
+
+def bench_to_latex_special_chars(num_cells: int, workdir: str) -> Benchmark:
+    table = Table(generators.special_char_rows(num_cells))
+    return table.to_latex
+
+
+def bench_to_text(num_cells: int, workdir: str) -> Benchmark:
+    table = Table(generators.mixed_rows(num_cells))
+    table.headers = [f"Column {j}" for j in range(table.num_columns)]
+    return lambda: str(table)
+
+
+def _run_python(script: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+
+
+def _import_benchmark(module: str) -> Benchmark:
+    # Time and memory are measured in separate interpreters, as tracing
+    # allocations slows the import down
+    def run() -> Measurement:
+        elapsed = float(_run_python(_IMPORT_TIME_SCRIPT.format(module=module)))
+        peak = int(_run_python(_IMPORT_MEMORY_SCRIPT.format(module=module)))
+        return Measurement(elapsed, peak)
+
+    return run
+
+
+def bench_import(num_cells: int, workdir: str) -> Benchmark:
+    """Time of a cold `import texable` in a fresh interpreter."""
+    return _import_benchmark("texable")
+
+
+def bench_import_table(num_cells: int, workdir: str) -> Benchmark:
+    """Time of importing everything needed to build and render a table."""
+    return _import_benchmark("texable.table")
+
+
+bench_import.size_independent = True  # type: ignore[attr-defined]
+bench_import_table.size_independent = True  # type: ignore[attr-defined]
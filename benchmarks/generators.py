@@ -0,0 +1,73 @@
+"""
+Deterministic synthetic data for the benchmarks.
+"""
+
+import csv
+import random
+import string
+from typing import Any
+
+# Number of columns of every generated table
+NUM_COLS = 10
+
+
+def shape_for(num_cells: int, num_cols: int = NUM_COLS) -> tuple[int, int]:
+    """Return the number of rows and columns of a table with about `num_cells` cells."""
+    return max(num_cells // num_cols, 1), num_cols
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10)))
+
+
+def text_rows(num_cells: int, seed: int = 0) -> list[list[str]]:
+    """Rows of short lowercase words."""
+    rng = random.Random(seed)
+    num_rows, num_cols = shape_for(num_cells)
+    return [[_word(rng) for _ in range(num_cols)] for _ in range(num_rows)]
+
+
+def numeric_rows(num_cells: int, seed: int = 0) -> list[list[Any]]:
+    """Rows alternating between integer and float columns."""
+    rng = random.Random(seed)
+    num_rows, num_cols = shape_for(num_cells)
+    return [
+        [
+            rng.randint(0, 10**6) if j % 2 == 0 else rng.uniform(-1e3, 1e3)
+            for j in range(num_cols)
+        ]
+        for _ in range(num_rows)
+    ]
+
+
+def mixed_rows(num_cells: int, seed: int = 0) -> list[list[Any]]:
+    """Rows with a text column followed by integer and float columns."""
+    rng = random.Random(seed)
+    num_rows, num_cols = shape_for(num_cells)
+    rows = []
+    for i in range(num_rows):
+        row: list[Any] = [f"{_word(rng)} {i}"]
+        for j in range(1, num_cols):
+            row.append(rng.randint(0, 10**6) if j % 2 else round(rng.random(), 4))
+        rows.append(row)
+    return rows
+
+
+def special_char_rows(num_cells: int, seed: int = 0) -> list[list[str]]:
+    """Rows of words where about one cell in ten holds special LaTeX characters."""
+    rng = random.Random(seed)
+    num_rows, num_cols = shape_for(num_cells)
+    return [
+        [
+            f"{_word(rng)}_{j} & 5%" if rng.random() < 0.1 else _word(rng)
+            for j in range(num_cols)
+        ]
+        for _ in range(num_rows)
+    ]
+
+
+def write_delimited(path: str, rows: list[list[Any]], delimiter: str = ",") -> str:
+    """Write rows to a CSV or TSV file and return its path."""
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        csv.writer(file, delimiter=delimiter).writerows(rows)
+    return path
@@ -0,0 +1,186 @@
+"""
+Run the texable benchmark suite.
+
+Every case in `cases.py` is run for each table size. The wall time is the
+best of several runs; the peak memory is measured by tracemalloc in a
+separate run, since tracing slows the code down.
+
+Examples:
+    Run everything at the default sizes and store the results as a baseline:
+
+        python benchmarks/run.py --save baseline.json
+
+    Later, compare against it, failing if anything got more than 10% slower
+    or bigger:
+
+        python benchmarks/run.py --compare baseline.json --threshold 0.1
+
+    Only the `from_csv` cases, up to ten million cells:
+
+        python benchmarks/run.py -k from_csv --cells 10000,1000000,10000000
+"""
+
+import argparse
+import gc
+import inspect
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+import cases
+
+DEFAULT_CELLS = [10_000, 100_000, 1_000_000]
+
+CaseFactory = Callable[[int, str], cases.Benchmark]
+
+
+def discover(pattern: Optional[str]) -> dict[str, CaseFactory]:
+    """Return the benchmark cases whose name contains `pattern`."""
+    return {
+        name.removeprefix("bench_"): func
+        for name, func in inspect.getmembers(cases, inspect.isfunction)
+        if name.startswith("bench_") and (pattern is None or pattern in name)
+    }
+
+
+def measure(factory: CaseFactory, num_cells: int, workdir: str, repeat: int) -> dict[str, float]:
+    """Return the best wall time in seconds and the peak memory in bytes of a case."""
+    best = float("inf")
+    for _ in range(repeat):
+        run = factory(num_cells, workdir)
+        gc.collect()
+        start = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - start
+        if isinstance(result, cases.Measurement):
+            elapsed = result.time
+        best = min(best, elapsed)
+
+    if isinstance(result, cases.Measurement):
+        return {"time": best, "peak_memory": result.peak_memory}
+
+    run = factory(num_cells, workdir)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"time": best, "peak_memory": peak}
+
+
+def _format_bytes(num_bytes: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(num_bytes) < 1024:
+            return f"{num_bytes:.0f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} GiB"
+
+
+def _ratio(value: float, baseline: Optional[float]) -> str:
+    if not baseline:
+        return ""
+    return f"{value / baseline:5.2f}x"
+
+
+def report(
+    results: dict[str, dict[str, float]],
+    baseline: Optional[dict[str, dict[str, float]]],
+    threshold: float,
+) -> list[str]:
+    """Print the results, compared to the baseline if given, and return the regressions."""
+    baseline = baseline or {}
+    regressions = []
+    width = max(map(len, results), default=0)
+    print(f"{'case':<{width}}  {'time':>10} {'vs base':>7}  {'peak memory':>11} {'vs base':>7}")
+    for key, result in results.items():
+        base = baseline.get(key, {})
+        flags = [
+            metric
+            for metric in ("time", "peak_memory")
+            if base.get(metric) and result[metric] > base[metric] * (1 + threshold)
+        ]
+        if flags:
+            regressions.append(f"{key} ({', '.join(flags)})")
+        print(
+            f"{key:<{width}}  {result['time']:>9.4f}s {_ratio(result['time'], base.get('time')):>7}"
+            f"  {_format_bytes(result['peak_memory']):>11}"
+            f" {_ratio(result['peak_memory'], base.get('peak_memory')):>7}"
+            + ("  <- regression" if flags else "")
+        )
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the texable benchmark suite.")
+    parser.add_argument(
+        "--cells",
+        default=",".join(map(str, DEFAULT_CELLS)),
+        help="Comma-separated table sizes in cells (default: %(default)s).",
+    )
+    parser.add_argument("-k", dest="pattern", help="Only run cases whose name contains this.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case.")
+    parser.add_argument("--save", metavar="FILE", help="Write the results as JSON.")
+    parser.add_argument("--compare", metavar="FILE", help="Baseline JSON to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative slowdown or memory growth reported as a regression.",
+    )
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.cells.split(",")]
+    factories = discover(args.pattern)
+    if not factories:
+        parser.error(f"No benchmark cases match {args.pattern!r}.")
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, factory in factories.items():
+            if getattr(factory, "size_independent", False):
+                print(f"running {name}...", file=sys.stderr)
+                results[name] = measure(factory, 0, workdir, args.repeat)
+                continue
+            for num_cells in sizes:
+                key = f"{name}[{num_cells}]"
+                print(f"running {key}...", file=sys.stderr)
+                results[key] = measure(factory, num_cells, workdir, args.repeat)
+
+    regressions = report(results, baseline, args.threshold)
+
+    if args.save:
+        document: dict[str, Any] = {
+            "meta": {
+                "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "repeat": args.repeat,
+            },
+            "results": results,
+        }
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(document, file, indent=2)
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
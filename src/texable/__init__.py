@@ -1,8 +1,52 @@
-from texable.logger_config import setup_logging
+"""
+Easily generate LaTeX tables from Python.
 
-setup_logging()
+Submodules are imported on first use of the names below (PEP 562), so
+`import texable` is cheap. Logging is left alone unless `setup_logging`
+is called explicitly.
+"""
 
-from texable.table import Table
-from texable.custom_types import Alignment
+import importlib
 
-__all__ = ["Table", "Alignment"]
+# Type checkers treat this as True; importing `typing` would slow down import
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from texable.batch import render_many, write_many
+    from texable.custom_types import Alignment, Pagination
+    from texable.document import Document
+    from texable.logger_config import setup_logging
+    from texable.table import Table
+
+# Public name -> module that defines it
+_LAZY_ATTRIBUTES = {
+    "Table": "texable.table",
+    "Alignment": "texable.custom_types",
+    "Pagination": "texable.custom_types",
+    "Document": "texable.document",
+    "render_many": "texable.batch",
+    "write_many": "texable.batch",
+    "setup_logging": "texable.logger_config",
+}
+
+__all__ = [
+    "Table",
+    "Alignment",
+    "Pagination",
+    "Document",
+    "render_many",
+    "write_many",
+    "setup_logging",
+]
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
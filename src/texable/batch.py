@@ -0,0 +1,161 @@
+import os
+from typing import Iterable, Iterator, Optional, Sequence
+
+from texable.packages import Package, package_scope, require_package
+from texable.table import Table
+
+# Packages are sent between processes as plain (name, options) pairs
+PackageSpec = tuple[str, list[str]]
+
+
+def _render(table: Table) -> tuple[str, list[PackageSpec]]:
+    """Render one table, returning its LaTeX and the packages it required."""
+    with package_scope() as packages:
+        latex = table.to_latex()
+    return latex, _package_specs(packages)
+
+
+def _write(table: Table, file_path: str) -> list[PackageSpec]:
+    """Write one table to a file, returning the packages it required."""
+    with package_scope() as packages:
+        table.write_to_file(file_path)
+    return _package_specs(packages)
+
+
+def _package_specs(packages: Iterable[Package]) -> list[PackageSpec]:
+    return [(pkg.name, sorted(pkg.options)) for pkg in packages]
+
+
+def _merge_packages(specs: Iterable[PackageSpec]) -> None:
+    for name, options in specs:
+        require_package(name, options)
+
+
+def _resolve_workers(workers: Optional[int]) -> int:
+    if workers is None:
+        return os.cpu_count() or 1
+    if not isinstance(workers, int) or workers <= 0:
+        raise ValueError("Number of workers must be a positive integer.")
+    return workers
+
+
+def _chunksize(num_tables: int, workers: int) -> int:
+    # A few chunks per worker balances the load without one round trip per table
+    return max(1, num_tables // (workers * 4))
+
+
+def iter_render_many(
+    tables: Iterable[Table], workers: Optional[int] = None
+) -> Iterator[str]:
+    """
+    Render many tables to LaTeX, yielding the results in input order.
+
+    Tables are pickled and rendered in a pool of worker processes. Each
+    result's preamble lists only the packages needed by that table. All
+    required packages are merged, with their options combined, into the
+    caller's active `package_scope`, or `texable.packages.required_packages`
+    outside of one.
+
+    Args:
+        tables (Iterable[Table]): The tables to render. All formatters used
+            must be picklable, e.g. module-level functions or the built-in
+            formatters from `texable.formatters`.
+        workers (Optional[int]): Number of worker processes. Defaults to the
+            number of CPUs; 1 renders in the current process.
+
+    Yields:
+        str: The LaTeX code of each table, in the order of `tables`.
+    """
+    tables = list(tables)
+    workers = _resolve_workers(workers)
+
+    if workers == 1:
+        results: Iterable[tuple[str, list[PackageSpec]]] = map(_render, tables)
+        for latex, specs in results:
+            _merge_packages(specs)
+            yield latex
+        return
+
+    # Imported here, since it pulls in multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            _render, tables, chunksize=_chunksize(len(tables), workers)
+        )
+        for latex, specs in results:
+            _merge_packages(specs)
+            yield latex
+
+
+def render_many(tables: Iterable[Table], workers: Optional[int] = None) -> list[str]:
+    """
+    Render many tables to LaTeX using a pool of worker processes.
+
+    See `iter_render_many` for details.
+
+    Args:
+        tables (Iterable[Table]): The tables to render.
+        workers (Optional[int]): Number of worker processes. Defaults to the
+            number of CPUs; 1 renders in the current process.
+
+    Returns:
+        list[str]: The LaTeX code of each table, in the order of `tables`.
+    """
+    return list(iter_render_many(tables, workers))
+
+
+def write_many(
+    tables: Iterable[Table],
+    out_dir: str,
+    names: Optional[Sequence[str]] = None,
+    workers: Optional[int] = None,
+) -> list[str]:
+    """
+    Write many tables to LaTeX files using a pool of worker processes.
+
+    Each worker streams its table straight to its own file, so rendered
+    LaTeX is never sent back to the calling process. Required packages are
+    merged as in `iter_render_many`.
+
+    Args:
+        tables (Iterable[Table]): The tables to write.
+        out_dir (str): Directory to write the files to. Created if missing.
+        names (Optional[Sequence[str]]): File names, one per table. Defaults
+            to `table_<index>.tex`, with the index zero-padded.
+        workers (Optional[int]): Number of worker processes. Defaults to the
+            number of CPUs; 1 writes from the current process.
+
+    Returns:
+        list[str]: The paths of the written files, in the order of `tables`.
+
+    Raises:
+        ValueError: If the number of names does not match the number of tables.
+    """
+    tables = list(tables)
+    workers = _resolve_workers(workers)
+
+    if names is None:
+        width = len(str(max(len(tables) - 1, 0)))
+        names = [f"table_{i:0{width}d}.tex" for i in range(len(tables))]
+    elif len(names) != len(tables):
+        raise ValueError(
+            f"Number of names ({len(names)}) must match number of tables ({len(tables)})."
+        )
+
+    os.makedirs(out_dir, exist_ok=True)
+    paths = [os.path.join(out_dir, name) for name in names]
+
+    if workers == 1:
+        for table, path in zip(tables, paths):
+            _merge_packages(_write(table, path))
+        return paths
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for specs in executor.map(
+            _write, tables, paths, chunksize=_chunksize(len(tables), workers)
+        ):
+            _merge_packages(specs)
+    return paths
@@ -1,6 +1,9 @@
 from typing import Any, Callable
 from functools import total_ordering
 
+from texable.escaping import escape
+from texable.packages import require_formatter_packages
+
 
 @total_ordering
 class Cell:
@@ -17,6 +20,7 @@ class Cell:
         """
         self._value = value
         self._formatters: list[Callable[[str], str]] = []
+        self._escape = True
 
     @property
     def value(self) -> Any:
@@ -39,6 +43,19 @@ class Cell:
 
         self._value = value
 
+    @property
+    def escape(self) -> bool:
+        """
+        Get or set whether special LaTeX characters in the content are escaped.
+
+        Escaping happens before any formatters are applied. Enabled by default.
+        """
+        return self._escape
+
+    @escape.setter
+    def escape(self, escape: bool) -> None:
+        self._escape = bool(escape)
+
     def add_formatters(self, *formatters: Callable[[str], str]) -> None:
         """
         Adds formatters to the cell's content.
@@ -66,15 +83,22 @@ class Cell:
         """
         return f"Cell({self._value})"
 
+    def _content_str(self) -> str:
+        """Convert the cell's value to the string that formatters are applied to."""
+        if self._escape:
+            return escape(str(self._value))
+        return str(self._value)
+
     def to_latex(self) -> str:
         """
         Converts the cell's content to a LaTeX string, applying any formatters.
         Returns:
             str: The LaTeX representation of the cell's content.
         """
-        content_str = str(self._value)
+        content_str = self._content_str()
         for formatter in self._formatters:
             content_str = formatter(content_str)
+            require_formatter_packages(formatter)
         return content_str
 
     def __eq__(self, other: Any) -> bool:
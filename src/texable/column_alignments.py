@@ -13,6 +13,7 @@ class ColumnAlignments:
         self._alignments: list[Alignment] = [
             Alignment.CENTER  # Default alignment is center
         ] * num_columns  # Default to center alignment for all columns
+        self._version = 0  # Incremented on every change
 
     @property
     def alignments(self) -> list[str]:
@@ -35,6 +36,7 @@ class ColumnAlignments:
             ValueError: If the alignment value is not one of 'l', 'c', or 'r', or if the length of the value list does not match the number of indices.
             IndexError: If the index is out of range.
         """
+        self._version += 1
 
         if isinstance(index, int):
             if not isinstance(value, Alignment):
@@ -0,0 +1,145 @@
+from typing import Any, Callable, Iterator, Optional, Union
+
+from texable.grid import Grid
+from texable.number_format import NumberFormat
+from texable.rules import Rule
+
+
+class Column:
+    """
+    A view of a single column of a table.
+
+    Formatters added to a column are stored once for the whole column and
+    applied to all of its cells in one pass when the table is rendered.
+    """
+
+    def __init__(self, grid: Grid, index: int) -> None:
+        """
+        Initializes a Column view.
+
+        Args:
+            grid (Grid): The grid that holds the column.
+            index (int): The index of the column.
+        """
+        self._grid = grid
+        self._index = index
+
+    @property
+    def index(self) -> int:
+        """Get the index of the column."""
+        return self._index
+
+    @property
+    def number_format(self) -> Optional[NumberFormat]:
+        """
+        Get or set how the numbers in the column are converted to LaTeX.
+
+        The number format replaces `str` for numeric values, before any
+        formatters are applied. Set it to None to go back to `str`.
+
+        Examples:
+            >>> from texable.number_format import NumberFormat
+            >>> table.columns[1].number_format = NumberFormat(decimals=2, thousands=",")
+        """
+        return self._grid.number_format(self._index)
+
+    @number_format.setter
+    def number_format(self, number_format: Optional[NumberFormat]) -> None:
+        self._grid.set_number_format(self._index, number_format)
+
+    @property
+    def escape(self) -> bool:
+        """
+        Get or set whether special LaTeX characters in the column are escaped.
+
+        Disabling escaping also leaves the column's header as is, e.g. for a
+        column holding LaTeX math. Columns with a number format are never
+        escaped.
+        """
+        return self._grid.column_escaped(self._index)
+
+    @escape.setter
+    def escape(self, escape: bool) -> None:
+        self._grid.set_column_escaped(self._index, escape)
+
+    def add_formatters(self, *formatters: Callable[[str], str]) -> None:
+        """
+        Adds formatters to every cell in the column.
+
+        Args:
+            *formatters (Callable[[str], str]): Formatters to apply to the column's cells.
+        """
+        self._grid.add_column_formatters(self._index, formatters)
+
+    @property
+    def rules(self) -> list[Rule]:
+        """
+        Get the conditional formatting rules of the column, in the order they apply.
+        """
+        return self._grid.column_rules(self._index)
+
+    def add_rules(self, *rules: Rule) -> None:
+        """
+        Adds conditional formatting rules to the column.
+
+        Rules are evaluated on all values of the column at once when the
+        table is rendered, and format the cells they select.
+
+        Examples:
+            >>> from texable.rules import ColorScale, HighlightMax
+            >>> table.columns[2].add_rules(HighlightMax(), ColorScale("white", "green"))
+
+        Args:
+            *rules (Rule): The rules to add.
+        """
+        self._grid.add_column_rules(self._index, rules)
+
+    def clear_rules(self) -> None:
+        """
+        Removes all conditional formatting rules of the column.
+        """
+        self._grid.clear_column_rules(self._index)
+
+    def __len__(self) -> int:
+        return self._grid.num_rows
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the values of the column."""
+        return self._grid.iter_column_values(self._index)
+
+    def __repr__(self) -> str:
+        return f"Column(index={self._index})"
+
+
+class Columns:
+    """
+    The columns of a table, accessible by index, slice or tuple of indices.
+    """
+
+    def __init__(self, grid: Grid) -> None:
+        self._grid = grid
+
+    def __getitem__(
+        self, index: Union[int, slice, tuple]
+    ) -> Union[Column, list[Column]]:
+        """Get a column by index, or a list of columns for a slice or tuple."""
+        num_cols = self._grid.num_cols
+        if isinstance(index, int):
+            if index < 0:
+                index += num_cols
+            if index < 0 or index >= num_cols:
+                raise IndexError("Index out of range.")
+            return Column(self._grid, index)
+        elif isinstance(index, slice):
+            return [Column(self._grid, i) for i in range(*index.indices(num_cols))]
+        elif isinstance(index, tuple):
+            return [self[i] for i in index]  # type: ignore[misc]
+        raise TypeError(
+            f"Index must be an integer, a slice or a tuple, got {type(index).__name__}."
+        )
+
+    def __len__(self) -> int:
+        return self._grid.num_cols
+
+    def __iter__(self) -> Iterator[Column]:
+        return (Column(self._grid, i) for i in range(self._grid.num_cols))
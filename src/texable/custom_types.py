@@ -29,3 +29,14 @@ class Alignment(Enum):
                 return "\\raggedright"
             case _:
                 raise ValueError("Invalid alignment type.")
+
+
+class Pagination(Enum):
+    """How a table is laid out when it may span several pages."""
+
+    NONE = 0
+    """A single `tabular` inside a `table` float."""
+    LONGTABLE = 1
+    """A `longtable`, which LaTeX breaks across pages by itself."""
+    CHUNKS = 2
+    """Several `table` floats, each holding a fixed number of rows."""
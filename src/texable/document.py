@@ -0,0 +1,314 @@
+from typing import Iterable, Iterator, Literal, Optional, TextIO, Union
+
+from texable.batch import (
+    PackageSpec,
+    _chunksize,
+    _package_specs,
+    _resolve_workers,
+)
+from texable.escaping import escape
+from texable.instrumentation import timed
+from texable.packages import PackageSet, package_scope
+from texable.table import Table
+
+Executor = Literal["process", "thread"]
+SectionLevel = Literal["part", "chapter", "section", "subsection", "subsubsection"]
+
+_SECTION_LEVELS = ("part", "chapter", "section", "subsection", "subsubsection")
+
+
+def _render_body(table: Table) -> tuple[str, list[PackageSpec]]:
+    """Render the `table` environment of one table, returning its packages."""
+    # A scope of our own keeps worker threads from requiring packages globally
+    with package_scope(propagate=False):
+        latex, packages = table.render()
+    return latex, _package_specs(packages)
+
+
+class Document:
+    """
+    A LaTeX document made of many tables, with a single shared preamble.
+
+    Every package required by any of the tables is listed once in the
+    preamble, with the options of all tables merged. Table bodies are
+    rendered one after the other, or on request in a pool of worker
+    processes or threads, and assembled in the order they were added.
+
+    Examples:
+        An appendix with one section per table:
+
+        >>> document = Document(document_class="report")
+        >>> for name, table in results.items():
+        ...     document.add_section(name)
+        ...     document.add_table(table)
+        >>> document.write_to_file("appendix.tex", workers=8)
+    """
+
+    def __init__(
+        self,
+        tables: Iterable[Table] = (),
+        document_class: str = "article",
+        class_options: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Initializes a Document.
+
+        Args:
+            tables (Iterable[Table]): Tables to add, in order.
+            document_class (str): The LaTeX document class.
+            class_options (Optional[Iterable[str]]): Options of the document class.
+
+        Raises:
+            TypeError: If any of `tables` is not a Table.
+        """
+        self.document_class = document_class
+        self.class_options = list(class_options) if class_options else []
+        self._parts: list[Union[Table, str]] = []
+        self._packages = PackageSet()  # Packages required explicitly for the document
+        self.extend(tables)
+
+    @property
+    def tables(self) -> list[Table]:
+        """
+        Get the tables of the document, in order.
+
+        Returns:
+            list[Table]: The tables.
+        """
+        return [part for part in self._parts if isinstance(part, Table)]
+
+    def add_table(self, table: Table) -> None:
+        """
+        Add a table at the end of the document.
+
+        The table is rendered when the document is, so later changes to it
+        show up in the document.
+
+        Args:
+            table (Table): The table to add.
+
+        Raises:
+            TypeError: If `table` is not a Table.
+        """
+        if not isinstance(table, Table):
+            raise TypeError(f"Expected a Table, got {type(table).__name__}.")
+        self._parts.append(table)
+
+    def extend(self, tables: Iterable[Table]) -> None:
+        """
+        Add several tables at the end of the document.
+
+        Args:
+            tables (Iterable[Table]): The tables to add, in order.
+
+        Raises:
+            TypeError: If any of `tables` is not a Table.
+        """
+        for table in tables:
+            self.add_table(table)
+
+    def add_section(self, title: str, level: SectionLevel = "section") -> None:
+        """
+        Add a sectioning command, such as `\\section{title}`.
+
+        Args:
+            title (str): The title, escaped like headers are.
+            level (SectionLevel): The sectioning command to use.
+
+        Raises:
+            ValueError: If the level is unknown.
+        """
+        if level not in _SECTION_LEVELS:
+            raise ValueError(f"Unknown section level: {level!r}.")
+        self._parts.append(f"\\{level}{{{escape(title)}}}\n")
+
+    def add_latex(self, latex: str) -> None:
+        """
+        Add raw LaTeX code, inserted as is between the tables.
+
+        Args:
+            latex (str): The LaTeX code.
+        """
+        self._parts.append(latex if latex.endswith("\n") else latex + "\n")
+
+    def require_package(self, name: str, options: Optional[Iterable[str]] = None) -> None:
+        """
+        Require a LaTeX package in the preamble, in addition to those of the tables.
+
+        Args:
+            name (str): The name of the package.
+            options (Optional[Iterable[str]]): Optional list of options for the package.
+        """
+        self._packages.add(name, options)
+
+    def packages(self) -> PackageSet:
+        """
+        Get the packages declared by the document and its tables, without rendering.
+
+        These are the packages required explicitly and those declared by
+        formatters with `texable.packages.requires`, as the built-in
+        formatters do.
+
+        Returns:
+            PackageSet: The packages, with the options of all tables merged.
+        """
+        with package_scope(propagate=False) as packages:
+            packages.update(self._packages)
+            for table in self.tables:
+                table._collect_packages(packages)
+        return packages
+
+    def _iter_bodies(
+        self, workers: Optional[int], executor: Executor
+    ) -> Iterator[tuple[str, list[PackageSpec]]]:
+        """Render the tables, yielding the results in order."""
+        if executor not in ("process", "thread"):
+            raise ValueError(f"Unknown executor: {executor!r}.")
+        tables = self.tables
+        workers = min(_resolve_workers(workers), max(len(tables), 1))
+        if workers == 1:
+            yield from map(_render_body, tables)
+            return
+
+        # Imported here, since they pull in multiprocessing and threading
+        if executor == "process":
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                yield from pool.map(
+                    _render_body, tables, chunksize=_chunksize(len(tables), workers)
+                )
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                yield from pool.map(_render_body, tables)
+
+    def _iter_parts(
+        self,
+        bodies: Iterator[tuple[str, list[PackageSpec]]],
+        packages: Optional[PackageSet] = None,
+    ) -> Iterator[str]:
+        """Yield the parts of the document body, adding the packages of the tables to `packages`."""
+        for k, part in enumerate(self._parts):
+            if k:
+                yield "\n"
+            if isinstance(part, Table):
+                part, specs = next(bodies)
+                if packages is not None:
+                    for name, options in specs:
+                        packages.add(name, options)
+            yield part
+
+    def _render_parts(self, workers: Optional[int], executor: Executor) -> tuple[PackageSet, str]:
+        """Render the document body, returning the packages it requires and the body."""
+        with package_scope() as packages:
+            packages.update(self.packages())
+            body = "".join(self._iter_parts(self._iter_bodies(workers, executor), packages))
+        return packages, body
+
+    def _iter_document(self, packages: PackageSet, parts: Iterable[str]) -> Iterator[str]:
+        options = f"[{','.join(self.class_options)}]" if self.class_options else ""
+        yield f"\\documentclass{options}{{{self.document_class}}}\n"
+        for pkg in packages:
+            yield str(pkg) + "\n"
+        yield "\n\\begin{document}\n\n"
+        yield from parts
+        yield "\n\\end{document}\n"
+
+    def iter_latex(
+        self, workers: Optional[int] = 1, executor: Executor = "process"
+    ) -> Iterator[str]:
+        """
+        Yield the LaTeX code of the document, table by table.
+
+        With several workers, tables are rendered concurrently but yielded
+        in order, as soon as all tables before them are done. The preamble
+        comes first, so when a formatter does not declare its packages with
+        `texable.packages.requires` (as the built-in formatters do), all
+        tables are rendered before anything is yielded to find them. The
+        packages are also reported to the caller's active `package_scope`.
+
+        Args:
+            workers (Optional[int]): Number of workers. Defaults to 1, which
+                renders in the current thread; None uses one per CPU.
+            executor (Executor): With more than one worker, "process" renders
+                in worker processes, which requires the tables and their
+                formatters to be picklable; "thread" renders in worker threads.
+
+        Yields:
+            str: Consecutive pieces of the document.
+
+        Raises:
+            ValueError: If the executor is unknown or `workers` is not positive.
+        """
+        # The scopes are closed before the first yield, so they never span
+        # resumptions of the generator from different contexts.
+        if not all(table._grid.packages_declared() for table in self.tables):
+            packages, body = self._render_parts(workers, executor)
+            yield from self._iter_document(packages, [body])
+            return
+        with package_scope() as packages:
+            packages.update(self.packages())
+        bodies = self._iter_bodies(workers, executor)
+        yield from self._iter_document(packages, self._iter_parts(bodies))
+
+    def to_latex(self, workers: Optional[int] = 1, executor: Executor = "process") -> str:
+        """
+        Return the LaTeX code of the document.
+
+        All tables are rendered before the preamble is written, so it lists
+        every package required while rendering.
+
+        Args:
+            workers (Optional[int]): See `iter_latex`.
+            executor (Executor): See `iter_latex`.
+
+        Returns:
+            str: The complete document.
+
+        Raises:
+            ValueError: If the executor is unknown or `workers` is not positive.
+        """
+        packages, body = self._render_parts(workers, executor)
+        return "".join(self._iter_document(packages, [body]))
+
+    def write_to(
+        self, stream: TextIO, workers: Optional[int] = 1, executor: Executor = "process"
+    ) -> None:
+        """
+        Stream the document to a text stream, see `iter_latex`.
+
+        Args:
+            stream (TextIO): A writable text stream, such as an open file.
+            workers (Optional[int]): See `iter_latex`.
+            executor (Executor): See `iter_latex`.
+        """
+        for piece in self.iter_latex(workers, executor):
+            stream.write(piece)
+
+    def write_to_file(
+        self, file_path: str, workers: Optional[int] = 1, executor: Executor = "process"
+    ) -> None:
+        """
+        Write the document to a file, see `iter_latex`.
+
+        Args:
+            file_path (str): Destination file path.
+            workers (Optional[int]): See `iter_latex`.
+            executor (Executor): See `iter_latex`.
+        """
+        with timed("write"):
+            file = open(file_path, "w")
+        try:
+            self.write_to(file, workers, executor)
+        finally:
+            with timed("write"):
+                file.close()
+
+    def __len__(self) -> int:
+        """Return the number of tables."""
+        return len(self.tables)
+
+    def __repr__(self) -> str:
+        return f"Document(document_class={self.document_class!r}, num_tables={len(self)})"
@@ -0,0 +1,79 @@
+import re
+
+# Replacement for every character with a special meaning in LaTeX text mode
+LATEX_ESCAPES = {
+    "&": r"\&",
+    "%": r"\%",
+    "$": r"\$",
+    "#": r"\#",
+    "_": r"\_",
+    "{": r"\{",
+    "}": r"\}",
+    "~": r"\textasciitilde{}",
+    "^": r"\textasciicircum{}",
+    "\\": r"\textbackslash{}",
+}
+
+_SPECIAL = re.compile("[" + re.escape("".join(LATEX_ESCAPES)) + "]")
+
+# Joins a whole column into one string, so it can be escaped in one go
+_SEPARATOR = "\x00"
+# Stands in for backslashes while the escapes, which contain backslashes, are added
+_PLACEHOLDER = "\x01"
+
+# Braces go before the escapes that introduce them
+_REPLACE_ORDER = ["{", "}", "&", "%", "$", "#", "_", "~", "^"]
+
+
+def _replace(match: re.Match) -> str:
+    return LATEX_ESCAPES[match[0]]
+
+
+def escape(text: str) -> str:
+    """
+    Escape the characters of `text` that have a special meaning in LaTeX.
+
+    Args:
+        text (str): Plain text.
+
+    Returns:
+        str: The text, safe to use in a LaTeX document.
+
+    Examples:
+        >>> escape("50% of R&D")
+        '50\\\\% of R\\\\&D'
+    """
+    return _SPECIAL.sub(_replace, text)
+
+
+def _replace_all(text: str) -> str:
+    """Escape `text` with one `str.replace` pass per special character it contains."""
+    text = text.replace("\\", _PLACEHOLDER)
+    for char in _REPLACE_ORDER:
+        if char in text:
+            text = text.replace(char, LATEX_ESCAPES[char])
+    return text.replace(_PLACEHOLDER, LATEX_ESCAPES["\\"])
+
+
+def escape_many(texts: list[str]) -> list[str]:
+    """
+    Escape a list of strings, e.g. the contents of one column.
+
+    The strings are joined into one string that is scanned once for special
+    characters and escaped with a few whole-string replacements, which is
+    much faster than escaping them one by one. A list without any special
+    characters is returned as is.
+
+    Args:
+        texts (list[str]): Plain texts.
+
+    Returns:
+        list[str]: The escaped texts.
+    """
+    joined = _SEPARATOR.join(texts)
+    if not _SPECIAL.search(joined):
+        return texts
+    if joined.count(_SEPARATOR) != len(texts) - 1 or _PLACEHOLDER in joined:
+        # The texts themselves contain the separator or placeholder
+        return [escape(text) for text in texts]
+    return _replace_all(joined).split(_SEPARATOR)
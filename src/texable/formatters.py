@@ -1,5 +1,6 @@
-from typing import Callable
-from texable.packages import require_package
+from typing import Callable, Iterable, Optional
+
+from texable.packages import Package
 
 
 def bold(text: str) -> str:
@@ -26,6 +27,36 @@ def italic(text: str) -> str:
     return f"\\textit{{{text}}}"
 
 
+# Declaring that they need no package lets `Table.iter_latex` stream right away
+bold.packages = []  # type: ignore[attr-defined]
+italic.packages = []  # type: ignore[attr-defined]
+
+
+class ColorFormatter:
+    """
+    A formatter that wraps text in a LaTeX color command.
+
+    Unlike a closure, instances can be pickled, so tables using them can be
+    rendered in worker processes.
+    """
+
+    def __init__(
+        self,
+        command: str,
+        color_name: str,
+        package_options: Optional[Iterable[str]] = None,
+    ) -> None:
+        self.command = command
+        self.color_name = color_name
+        self.packages = [Package("xcolor", package_options)]
+
+    def __call__(self, text: str) -> str:
+        return f"\\{self.command}{{{self.color_name}}}{{{text}}}"
+
+    def __repr__(self) -> str:
+        return f"{self.command}({self.color_name!r})"
+
+
 def text_color(color_name: str) -> Callable[[str], str]:
     """
     Creates a formatter that applies the specified color to the text.
@@ -36,12 +67,7 @@ def text_color(color_name: str) -> Callable[[str], str]:
     Returns:
         Callable[[str], str]: A function that formats text in the specified color.
     """
-
-    def formatter(text: str) -> str:
-        require_package("xcolor")
-        return f"\\textcolor{{{color_name}}}{{{text}}}"
-
-    return formatter
+    return ColorFormatter("textcolor", color_name)
 
 
 def cell_color(color_name: str) -> Callable[[str], str]:
@@ -54,9 +80,4 @@ def cell_color(color_name: str) -> Callable[[str], str]:
     Returns:
         Callable[[str], str]: A function that formats cell content in the specified color.
     """
-
-    def formatter(text: str) -> str:
-        require_package("xcolor", ["table"])
-        return f"\\cellcolor{{{color_name}}}{{{text}}}"
-
-    return formatter
+    return ColorFormatter("cellcolor", color_name, ["table"])
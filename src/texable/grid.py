@@ -1,12 +1,175 @@
-from typing import Any, Iterator, Sequence
+import time
+import weakref
+from bisect import bisect_left
+from itertools import chain
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Union,
+)
 
 from texable.cell import Cell
+from texable.escaping import escape, escape_many
+from texable.instrumentation import current_stats
+from texable.number_format import NumberFormat, _is_number
+from texable.packages import require_formatter_packages
 from texable.row import Row
+from texable.rules import Rule
+from texable.text import iter_text
+
+if TYPE_CHECKING:
+    from texable.spans import SpanLayout
+
+# Number of rows rendered together when walking the grid column by column
+CHUNK_SIZE = 4096
+
+
+def _complement(indices: Sequence[int], length: int) -> list[range]:
+    """Return the runs of `range(length)` between the sorted, distinct `indices`."""
+    runs = []
+    start = 0
+    for i in indices:
+        if i > start:
+            runs.append(range(start, i))
+        start = i + 1
+    if start < length:
+        runs.append(range(start, length))
+    return runs
+
+
+def _as_list(values: Any) -> Any:
+    """
+    Convert a slice of an adopted array column to a list when that does not
+    change how its values are rendered, which makes rendering much faster.
+    """
+    dtype = getattr(values, "dtype", None)
+    if dtype is None:
+        return values
+    if dtype.kind in "biuOSU" or (dtype.kind == "f" and dtype.itemsize == 8):
+        return values.tolist()
+    return values
+
+
+class CellView(Cell):
+    """
+    A lightweight view of a single cell stored inside a `Grid`.
+
+    The view holds no data of its own: reading or writing its value and adding
+    formatters goes straight through to the grid's column storage.
+    """
+
+    def __init__(self, grid: "Grid", row: int, col: int) -> None:
+        """
+        Initializes a CellView for the given grid position.
+
+        Args:
+            grid (Grid): The grid that owns the cell.
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+        """
+        self._grid = grid
+        self._row = row
+        self._col = col
+
+    @property
+    def _value(self) -> Any:
+        return self._grid._value(self._row, self._col)
+
+    @property
+    def _formatters(self) -> Sequence[Callable[[str], str]]:
+        return self._grid._cell_formatters(self._row, self._col)
+
+    def _content_str(self) -> str:
+        number_format = self._grid.number_format(self._col)
+        if number_format is not None and _is_number(self._value):
+            return number_format.format(self._value)
+        if self.escape:
+            return escape(str(self._value))
+        return str(self._value)
+
+    @property
+    def escape(self) -> bool:
+        """
+        Get or set whether special LaTeX characters in the cell are escaped.
+
+        The cell is only escaped if escaping is also enabled for its column
+        and table.
+        """
+        return self._grid._cell_escaped(self._row, self._col)
+
+    @escape.setter
+    def escape(self, escape: bool) -> None:
+        self._grid._set_cell_escaped(self._row, self._col, escape)
+
+    @property
+    def value(self) -> Any:
+        """
+        Returns the content of the cell.
+
+        Returns:
+            Any: The content of the cell.
+        """
+        return self._value
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        """
+        Sets the content of the cell.
+
+        Args:
+            value (Any): The new content for the cell.
+        """
+        self._grid._set_value(self._row, self._col, value)
+
+    def add_formatters(self, *formatters: Callable[[str], str]) -> None:
+        """
+        Adds formatters to the cell's content.
+
+        Args:
+            *formatters (Callable[[str], str]): Formatters to apply to the cell's content.
+        """
+        self._grid._add_cell_formatters(self._row, self._col, formatters)
+
+
+class RowChanges:
+    """
+    Collects which rows of a grid changed since the collector was last reset.
+
+    Changes to single cells record their row in `rows`; changes that can
+    affect any row, such as column formatters or number formats, set
+    `everything` instead.
+    """
+
+    __slots__ = ("rows", "everything", "__weakref__")
+
+    def __init__(self) -> None:
+        self.rows: set[int] = set()
+        self.everything = False
+
+    def reset(self) -> None:
+        """
+        Forgets all recorded changes.
+        """
+        self.rows.clear()
+        self.everything = False
+
+    def _record(self, rows: Iterable[int]) -> None:
+        self.rows.update(rows)
 
 
 class Grid:
     """
     A class to represent a grid of cells.
+
+    Values are stored column by column in plain lists. `Cell` and `Row` objects
+    are only created as views when the grid is indexed or iterated, and cell
+    formatters live in a sparse side table so unformatted cells cost nothing.
     """
 
     def __init__(self, data: Sequence[Sequence[Any]]) -> None:
@@ -16,12 +179,64 @@ class Grid:
         Args:
             data (Sequence[Sequence[T]]): A 2D sequence representing the grid data.
         """
-        self._num_rows = len(data)
-        self._num_cols = len(data[0])
-        if any(len(row) != self._num_cols for row in data):
+        num_cols = len(data[0])
+        if any(len(row) != num_cols for row in data):
             raise ValueError("All rows must have the same number of columns.")
 
-        self._grid = [Row([Cell(value) for value in row]) for row in data]
+        self._init_storage([list(column) for column in zip(*data)], len(data))
+
+    @classmethod
+    def from_columns(cls, columns: list[Any]) -> "Grid":
+        """
+        Creates a Grid that adopts the given columns without copying them.
+
+        Columns are usually lists, but any mutable sequence supporting slicing
+        works, such as a NumPy array.
+
+        Args:
+            columns (list[Any]): One sequence of values per column.
+
+        Returns:
+            Grid: A grid backed by the given lists.
+
+        Raises:
+            ValueError: If there are no columns or the columns differ in length.
+        """
+        if not columns:
+            raise ValueError("A grid must have at least one column.")
+        num_rows = len(columns[0])
+        if any(len(column) != num_rows for column in columns):
+            raise ValueError("All columns must have the same number of rows.")
+
+        grid = cls.__new__(cls)
+        grid._init_storage(columns, num_rows)
+        return grid
+
+    def _init_storage(self, columns: list[Any], num_rows: int) -> None:
+        self._num_rows = num_rows
+        self._num_cols = len(columns)
+        self._version = 0  # Incremented on every change to values or formatting
+        self._structure_version = 0  # Incremented when rows are inserted or deleted
+        self._columns: list[Any] = columns
+        # Sparse formatter storage: row index -> column index -> formatters
+        self._formatters: dict[int, dict[int, list[Callable[[str], str]]]] = {}
+        # Formatter pipelines applied to whole columns or rectangular regions
+        self._column_formatters: dict[int, list[Callable[[str], str]]] = {}
+        self._region_formatters: list[
+            tuple[range, list[int], list[Callable[[str], str]]]
+        ] = []
+        self._used_formatters: set[Callable[[str], str]] = set()
+        self._number_formats: dict[int, NumberFormat] = {}
+        # Escaping is on unless switched off for the grid, a column or a cell
+        self._escape = True
+        self._unescaped_columns: set[int] = set()
+        self._unescaped_cells: dict[int, set[int]] = {}
+        # Conditional formatting rules per column, and their results for a version
+        self._column_rules: dict[int, list[Rule]] = {}
+        self._rule_results: Optional[
+            tuple[int, dict[int, list[dict[int, Sequence[Callable[[str], str]]]]]]
+        ] = None
+        self._row_changes: "weakref.WeakSet[RowChanges]" = weakref.WeakSet()
 
     @property
     def rows(self) -> list[Row]:
@@ -30,7 +245,7 @@ class Grid:
         Returns:
             Sequence[Row]: A sequence of Row objects representing the grid rows.
         """
-        return self._grid
+        return [self[i] for i in range(self._num_rows)]
 
     @property
     def num_rows(self) -> int:
@@ -52,35 +267,806 @@ class Grid:
         """
         return self._num_cols
 
-    def __getitem__(self, index: int) -> Row:
+    @property
+    def version(self) -> int:
         """
-        Gets the row at the specified index.
+        Returns a counter that changes whenever a value or any formatting changes.
 
-        Args:
-            index (int): The index of the row to retrieve.
+        Returns:
+            int: The current version of the grid.
+        """
+        return self._version
+
+    @property
+    def cacheable(self) -> bool:
+        """
+        Returns whether rendered output of the grid may be cached between renders.
+        """
+        return True
+
+    @property
+    def random_access(self) -> bool:
+        """
+        Returns whether rows can be read in any order, as views selecting
+        arbitrary rows require.
+        """
+        return True
+
+    def track_row_changes(self) -> RowChanges:
+        """
+        Starts recording which rows change.
+
+        The grid keeps only a weak reference to the returned collector, so
+        recording stops once the caller drops it.
 
         Returns:
-            Row: The row at the specified index.
+            RowChanges: A collector that is updated on every change to the grid.
         """
-        return self._grid[index]
+        changes = RowChanges()
+        self._row_changes.add(changes)
+        return changes
 
-    def __str__(self) -> str:
-        columns = [[] for _ in range(self.num_cols)]
-        for row in self._grid:
-            for i, cell in enumerate(row):
-                columns[i].append(str(cell))
-        col_widths = [max(len(cell) for cell in col) for col in columns]
-
-        def format_row(row):
-            return " | ".join(
-                f"{str(cell):<{col_widths[i]}}" for i, cell in enumerate(row)
+    def _rows_changed(self, rows: Iterable[int]) -> None:
+        for changes in self._row_changes:
+            changes._record(rows)
+
+    def _all_rows_changed(self) -> None:
+        for changes in self._row_changes:
+            changes.everything = True
+
+    def _value(self, row: int, col: int) -> Any:
+        return self._columns[col][row]
+
+    def _set_value(self, row: int, col: int, value: Any) -> None:
+        self._version += 1
+        if col in self._column_rules:
+            # Rules may format any row differently once a value changes
+            self._all_rows_changed()
+        else:
+            self._rows_changed((row,))
+        column = self._columns[col]
+        try:
+            column[row] = value
+        except (TypeError, ValueError):
+            if isinstance(column, list):
+                raise
+            # Typed buffers (e.g. adopted NumPy arrays) cannot hold every value
+            column = self._columns[col] = list(column)
+            column[row] = value
+
+    def _check_row(self, row: Sequence[Any]) -> None:
+        if not isinstance(row, Sequence) or isinstance(row, str):
+            raise TypeError("Rows must be sequences of values.")
+        if len(row) != self._num_cols:
+            raise ValueError(
+                f"Row has {len(row)} values, but the grid has {self._num_cols} columns."
             )
 
-        result = ""
-        for row in self._grid:
-            result += format_row(row) + "\n"
+    def _mutable_columns(self) -> list[list[Any]]:
+        """Return the columns as lists, converting adopted arrays that cannot grow."""
+        for j, column in enumerate(self._columns):
+            if not isinstance(column, list):
+                self._columns[j] = list(column)
+        return self._columns
+
+    def append_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        """
+        Appends rows at the end of the grid, in amortized constant time per row.
+
+        Rows are appended one by one; if a row is invalid, the rows before it
+        stay appended.
+
+        Args:
+            rows (Iterable[Sequence[Any]]): The rows to append.
+
+        Raises:
+            TypeError: If a row is not a sequence.
+            ValueError: If a row has the wrong number of values.
+        """
+        start = self._num_rows
+        columns = self._mutable_columns()
+        try:
+            for row in rows:
+                self._check_row(row)
+                for column, value in zip(columns, row):
+                    column.append(value)
+                self._num_rows += 1
+        finally:
+            if self._num_rows > start:
+                self._version += 1
+                if self._column_rules:
+                    self._all_rows_changed()
+                else:
+                    self._rows_changed(range(start, self._num_rows))
+
+    def insert_rows(self, index: int, rows: Iterable[Sequence[Any]]) -> None:
+        """
+        Inserts rows before the row at `index`.
+
+        Rows after `index` move down, together with their formatters. The new
+        rows have no cell or region formatters.
 
-        return result.strip()
+        Args:
+            index (int): Where to insert, from 0 to the number of rows.
+            rows (Iterable[Sequence[Any]]): The rows to insert.
+
+        Raises:
+            TypeError: If a row is not a sequence.
+            ValueError: If a row has the wrong number of values.
+            IndexError: If `index` is out of range.
+        """
+        if not 0 <= index <= self._num_rows:
+            raise IndexError("Row index out of range.")
+        rows = list(rows)
+        for row in rows:
+            self._check_row(row)
+        count = len(rows)
+        if not count:
+            return
+
+        for column, values in zip(self._mutable_columns(), zip(*rows)):
+            column[index:index] = values
+        self._num_rows += count
+
+        def shift(i: int) -> int:
+            return i + count if i >= index else i
+
+        self._formatters = {shift(i): value for i, value in self._formatters.items()}
+        self._unescaped_cells = {shift(i): value for i, value in self._unescaped_cells.items()}
+        regions = []
+        for region_rows, cols, formatters in self._region_formatters:
+            if region_rows.start < index < region_rows.stop:
+                # The new rows split the region
+                regions.append((range(region_rows.start, index), cols, formatters))
+                region_rows = range(index + count, region_rows.stop + count)
+            elif region_rows.start >= index:
+                region_rows = range(region_rows.start + count, region_rows.stop + count)
+            regions.append((region_rows, cols, formatters))
+        self._region_formatters = regions
+
+        self._version += 1
+        self._structure_version += 1
+        self._all_rows_changed()
+
+    def delete_rows(self, rows: Iterable[int]) -> None:
+        """
+        Deletes rows together with their formatters.
+
+        Args:
+            rows (Iterable[int]): The indices of the rows to delete.
+
+        Raises:
+            IndexError: If an index is out of range.
+        """
+        deleted = sorted(set(rows))
+        if not deleted:
+            return
+        if deleted[0] < 0 or deleted[-1] >= self._num_rows:
+            raise IndexError("Row index out of range.")
+
+        kept = _complement(deleted, self._num_rows)
+        for j, column in enumerate(self._mutable_columns()):
+            self._columns[j] = [value for run in kept for value in column[run.start : run.stop]]
+        self._num_rows -= len(deleted)
+
+        def shift(i: int) -> int:
+            return i - bisect_left(deleted, i)
+
+        removed = set(deleted)
+        self._formatters = {
+            shift(i): value for i, value in self._formatters.items() if i not in removed
+        }
+        self._unescaped_cells = {
+            shift(i): value for i, value in self._unescaped_cells.items() if i not in removed
+        }
+        regions = []
+        for region_rows, cols, formatters in self._region_formatters:
+            first = bisect_left(deleted, region_rows.start)
+            last = bisect_left(deleted, region_rows.stop)
+            inside = [i - region_rows.start for i in deleted[first:last]]
+            for run in _complement(inside, len(region_rows)):
+                start = shift(region_rows.start + run.start)
+                regions.append((range(start, start + len(run)), cols, formatters))
+        self._region_formatters = regions
+
+        self._version += 1
+        self._structure_version += 1
+        self._all_rows_changed()
+
+    def _cell_formatters(self, row: int, col: int) -> Sequence[Callable[[str], str]]:
+        row_formatters = self._formatters.get(row)
+        cell_formatters = row_formatters.get(col, ()) if row_formatters else ()
+        if (
+            not self._region_formatters
+            and col not in self._column_formatters
+            and col not in self._column_rules
+        ):
+            return cell_formatters
+
+        # Same order as in `_render_cells`: cell, region, rule, then column formatters
+        result = list(cell_formatters)
+        for rows, cols, formatters in self._region_formatters:
+            if row in rows and col in cols:
+                result.extend(formatters)
+        if col in self._column_rules:
+            for rule_result in self._evaluated_rules()[col]:
+                result.extend(rule_result.get(row, ()))
+        result.extend(self._column_formatters.get(col, ()))
+        return result
+
+    def _add_cell_formatters(
+        self, row: int, col: int, formatters: Sequence[Callable[[str], str]]
+    ) -> None:
+        if not formatters:
+            return
+        self._version += 1
+        self._rows_changed((row,))
+        row_formatters = self._formatters.setdefault(row, {})
+        row_formatters.setdefault(col, []).extend(formatters)
+        self._used_formatters.update(formatters)
+
+    def add_column_formatters(
+        self, col: int, formatters: Sequence[Callable[[str], str]]
+    ) -> None:
+        """
+        Adds formatters that are applied to every cell of a column.
+
+        The formatters are applied to the whole column at once when rendering,
+        after any formatters added to individual cells.
+
+        Args:
+            col (int): The index of the column.
+            formatters (Sequence[Callable[[str], str]]): The formatters to add.
+        """
+        if not 0 <= col < self._num_cols:
+            raise IndexError("Column index out of range.")
+        if not formatters:
+            return
+        self._version += 1
+        self._all_rows_changed()
+        self._column_formatters.setdefault(col, []).extend(formatters)
+        self._used_formatters.update(formatters)
+
+    def add_region_formatters(
+        self,
+        rows: range,
+        cols: Sequence[int],
+        formatters: Sequence[Callable[[str], str]],
+    ) -> None:
+        """
+        Adds formatters that are applied to a rectangular region of cells.
+
+        Args:
+            rows (range): The rows of the region, with a step of 1.
+            cols (Sequence[int]): The columns of the region.
+            formatters (Sequence[Callable[[str], str]]): The formatters to add.
+        """
+        if rows.step != 1:
+            raise ValueError("Region rows must be a contiguous range.")
+        if any(not 0 <= col < self._num_cols for col in cols):
+            raise IndexError("Column index out of range.")
+        if not formatters or not rows or not cols:
+            return
+        self._version += 1
+        self._rows_changed(rows)
+        self._region_formatters.append((rows, list(cols), list(formatters)))
+        self._used_formatters.update(formatters)
+
+    def column_rules(self, col: int) -> list[Rule]:
+        """
+        Returns the conditional formatting rules of a column, in the order they apply.
+
+        Args:
+            col (int): The index of the column.
+        """
+        if not 0 <= col < self._num_cols:
+            raise IndexError("Column index out of range.")
+        return list(self._column_rules.get(col, ()))
+
+    def add_column_rules(self, col: int, rules: Sequence[Rule]) -> None:
+        """
+        Adds conditional formatting rules to a column.
+
+        Args:
+            col (int): The index of the column.
+            rules (Sequence[Rule]): The rules to add.
+        """
+        if not 0 <= col < self._num_cols:
+            raise IndexError("Column index out of range.")
+        if any(not isinstance(rule, Rule) for rule in rules):
+            raise TypeError("Rules must be Rule instances.")
+        if not rules:
+            return
+        self._version += 1
+        self._all_rows_changed()
+        self._column_rules.setdefault(col, []).extend(rules)
+
+    def clear_column_rules(self, col: int) -> None:
+        """
+        Removes all conditional formatting rules of a column.
+
+        Args:
+            col (int): The index of the column.
+        """
+        if not 0 <= col < self._num_cols:
+            raise IndexError("Column index out of range.")
+        if self._column_rules.pop(col, None) is not None:
+            self._version += 1
+            self._all_rows_changed()
+
+    def _evaluated_rules(
+        self, refresh: bool = False
+    ) -> dict[int, list[dict[int, Sequence[Callable[[str], str]]]]]:
+        """
+        Returns the result of every rule, column by column.
+
+        Rules are evaluated on whole columns, so the results are kept until
+        the grid changes rather than recomputed for every chunk of rows.
+        """
+        if refresh or self._rule_results is None or self._rule_results[0] != self._version:
+            results = {}
+            for col, rules in self._column_rules.items():
+                values = list(self.iter_column_values(col))
+                results[col] = [rule.evaluate(values) for rule in rules]
+            self._rule_results = (self._version, results)
+        return self._rule_results[1]
+
+    def _refresh_rules(self) -> None:
+        """Re-evaluates the rules before rendering if the values may have changed unnoticed."""
+        if self._column_rules and not self.cacheable:
+            self._evaluated_rules(refresh=True)
+
+    def number_format(self, col: int) -> Optional[NumberFormat]:
+        """
+        Returns the number format of a column, or None if it has none.
+
+        Args:
+            col (int): The index of the column.
+        """
+        return self._number_formats.get(col)
+
+    def set_number_format(self, col: int, number_format: Optional[NumberFormat]) -> None:
+        """
+        Sets how the numbers in a column are converted to LaTeX.
+
+        Args:
+            col (int): The index of the column.
+            number_format (Optional[NumberFormat]): The format, or None to use `str`.
+        """
+        if not 0 <= col < self._num_cols:
+            raise IndexError("Column index out of range.")
+        self._version += 1
+        self._all_rows_changed()
+        if number_format is None:
+            self._number_formats.pop(col, None)
+        elif not isinstance(number_format, NumberFormat):
+            raise TypeError("Number format must be a NumberFormat.")
+        else:
+            self._number_formats[col] = number_format
+
+    @property
+    def escape(self) -> bool:
+        """
+        Get or set whether special LaTeX characters in cells and headers are
+        escaped when rendering. Enabled by default.
+
+        Numbers in columns with a number format are never escaped, since
+        their output is LaTeX already; other values in those columns are.
+        """
+        return self._escape
+
+    @escape.setter
+    def escape(self, escape: bool) -> None:
+        self._version += 1
+        self._all_rows_changed()
+        self._escape = bool(escape)
+
+    def column_escaped(self, col: int) -> bool:
+        """
+        Returns whether the values of a column are escaped when rendering.
+
+        Args:
+            col (int): The index of the column.
+        """
+        if not 0 <= col < self._num_cols:
+            raise IndexError("Column index out of range.")
+        return self._escape and col not in self._unescaped_columns
+
+    def set_column_escaped(self, col: int, escape: bool) -> None:
+        """
+        Enables or disables escaping for a column and its header.
+
+        Args:
+            col (int): The index of the column.
+            escape (bool): Whether to escape the column.
+        """
+        if not 0 <= col < self._num_cols:
+            raise IndexError("Column index out of range.")
+        self._version += 1
+        self._all_rows_changed()
+        if escape:
+            self._unescaped_columns.discard(col)
+        else:
+            self._unescaped_columns.add(col)
+
+    def unescaped_columns(self) -> set[int]:
+        """
+        Returns the columns whose headers must not be escaped.
+
+        Returns:
+            set[int]: Every column if escaping is disabled for the grid, else
+                the columns it was disabled for.
+        """
+        if not self._escape:
+            return set(range(self._num_cols))
+        return set(self._unescaped_columns)
+
+    def _cell_escaped(self, row: int, col: int) -> bool:
+        unescaped = self._unescaped_cells.get(row)
+        return self.column_escaped(col) and not (unescaped and col in unescaped)
+
+    def _set_cell_escaped(self, row: int, col: int, escape: bool) -> None:
+        self._version += 1
+        self._rows_changed((row,))
+        if escape:
+            unescaped = self._unescaped_cells.get(row)
+            if unescaped:
+                unescaped.discard(col)
+                if not unescaped:
+                    del self._unescaped_cells[row]
+        else:
+            self._unescaped_cells.setdefault(row, set()).add(col)
+
+    def column_types(self) -> dict[int, str]:
+        """
+        Returns the columns whose tabular column type is dictated by their content.
+
+        Returns:
+            dict[int, str]: Column index to column type, e.g. "S" for siunitx columns.
+        """
+        return {
+            col: number_format.column_type
+            for col, number_format in self._number_formats.items()
+            if number_format.column_type
+        }
+
+    def require_packages(self) -> None:
+        """
+        Marks the packages declared by every formatter and number format used
+        in the grid as required.
+        """
+        for formatter in self._used_formatters:
+            require_formatter_packages(formatter)
+        for number_format in self._number_formats.values():
+            require_formatter_packages(number_format)  # type: ignore[arg-type]
+        for rules in self._column_rules.values():
+            for rule in rules:
+                require_formatter_packages(rule)  # type: ignore[arg-type]
+
+    def packages_declared(self) -> bool:
+        """
+        Whether every formatter, number format and rule used in the grid
+        declares its packages, so none can be discovered while rendering.
+
+        Returns:
+            bool: True if `require_packages` marks all packages the grid needs.
+        """
+        rules = [rule for rules in self._column_rules.values() for rule in rules]
+        formatters = chain(
+            self._used_formatters,
+            self._number_formats.values(),
+            rules,
+            (formatter for rule in rules for formatter in getattr(rule, "formatters", ())),
+        )
+        return all(hasattr(formatter, "packages") for formatter in formatters)
+
+    def iter_row_values(self) -> Iterator[tuple]:
+        """
+        Returns an iterator over the raw values of each row.
+
+        Returns:
+            Iterator[tuple]: An iterator yielding one tuple of values per row.
+        """
+        for _, columns in self._iter_column_chunks():
+            yield from zip(*columns)
+
+    def iter_column_values(self, col: int) -> Iterator[Any]:
+        """
+        Returns an iterator over the raw values of a column.
+
+        Args:
+            col (int): The index of the column.
+
+        Returns:
+            Iterator[Any]: An iterator over the values of the column.
+        """
+        if not 0 <= col < self._num_cols:
+            raise IndexError("Column index out of range.")
+        return iter(self._columns[col])
+
+    def _iter_column_chunks(
+        self, chunk_size: int = CHUNK_SIZE, first: int = 0, stop: Optional[int] = None
+    ) -> Iterator[tuple[int, list[list[Any]]]]:
+        """Yield `(first_row, column_slices)` pairs covering rows `first` to `stop` in order."""
+        stop = self._num_rows if stop is None else min(stop, self._num_rows)
+        cols = range(self._num_cols)
+        for start in range(first, stop, chunk_size):
+            yield start, self._take(range(start, min(start + chunk_size, stop)), cols)
+
+    def _take(self, rows: Sequence[int], cols: Sequence[int]) -> list[list[Any]]:
+        """Return the values of the given rows, one list per given column."""
+        if isinstance(rows, range) and rows.step == 1:
+            return [_as_list(self._columns[j][rows.start : rows.stop]) for j in cols]
+        result = []
+        for j in cols:
+            column = self._columns[j]
+            if getattr(column, "dtype", None) is not None:
+                result.append(_as_list(column[list(rows)]))
+            else:
+                result.append([column[i] for i in rows])
+        return result
+
+    def iter_latex_rows(
+        self,
+        first: int = 0,
+        stop: Optional[int] = None,
+        spans: Optional["SpanLayout"] = None,
+    ) -> Iterator[str]:
+        """
+        Returns an iterator over the LaTeX representation of each row.
+
+        Produces the same output as calling `Row.to_latex` on every row, without
+        creating any `Cell` or `Row` objects.
+
+        Args:
+            first (int): The index of the first row to render.
+            stop (Optional[int]): The index after the last row to render, or
+                None to render up to the end.
+            spans (Optional[SpanLayout]): Merged cells, which replace the
+                cells they cover.
+
+        Returns:
+            Iterator[str]: An iterator yielding one LaTeX row (with line ending) per row.
+        """
+        self._refresh_rules()
+        for start, columns in self._iter_column_chunks(first=first, stop=stop):
+            rendered = zip(*self._render_chunk(start, columns))
+            if spans is None:
+                for contents in rendered:
+                    yield " & ".join(contents) + r" \\" + "\n"
+            else:
+                for i, contents in enumerate(rendered, start):
+                    yield spans.join_row(i, contents)
+
+    def render_row(self, index: int, spans: Optional["SpanLayout"] = None) -> str:
+        """
+        Returns the LaTeX representation of a single row.
+
+        Args:
+            index (int): The index of the row.
+            spans (Optional[SpanLayout]): See `iter_latex_rows`.
+
+        Returns:
+            str: The same string `iter_latex_rows` yields for this row.
+        """
+        if not 0 <= index < self._num_rows:
+            raise IndexError("Row index out of range.")
+        columns = self._take(range(index, index + 1), range(self._num_cols))
+        contents = [texts[0] for texts in self._render_chunk(index, columns)]
+        if spans is not None:
+            return spans.join_row(index, contents)
+        return " & ".join(contents) + r" \\" + "\n"
+
+    def _render_chunk(self, start: int, columns: list[list[Any]]) -> list[list[str]]:
+        """
+        Converts a chunk of column values to formatted LaTeX strings, column by column.
+
+        `columns` holds the values of every column for the rows from `start` on.
+        """
+        rows = range(start, start + len(columns[0]))
+        return self._render_cells(rows, range(self._num_cols), columns)
+
+    def _render_cells(
+        self, rows: Sequence[int], cols: Sequence[int], columns: list[list[Any]]
+    ) -> list[list[str]]:
+        """
+        Converts values of the grid to formatted LaTeX strings, column by column.
+
+        Cell formatters are applied first, followed by region formatters,
+        conditional formatting rules and column formatters. Region and column
+        formatters run once over the whole column slice.
+
+        Args:
+            rows (Sequence[int]): The row of each value in a column slice. A
+                range with a step of 1 is fastest.
+            cols (Sequence[int]): The column of each slice in `columns`.
+            columns (list[list[Any]]): The values, one slice per column.
+        """
+        stats = current_stats()
+        if stats is not None:
+            started = time.perf_counter()
+
+        # Position in `columns` of every rendered column
+        positions = {j: k for k, j in enumerate(cols)}
+        number_formats = self._number_formats
+        texts = []
+        for j, values in zip(cols, columns):
+            if j in number_formats:
+                column_texts = number_formats[j].format_many(values)
+                if (
+                    self._escape
+                    and j not in self._unescaped_columns
+                    and not set(map(type, values)) <= {int, float}
+                ):
+                    # Non-numeric values pass through the number format as `str`
+                    for p, value in enumerate(values):
+                        if not _is_number(value):
+                            column_texts[p] = escape(column_texts[p])
+                texts.append(column_texts)
+            elif self._escape and j not in self._unescaped_columns:
+                texts.append(escape_many(list(map(str, values))))
+            else:
+                texts.append(list(map(str, values)))
+
+        if self._unescaped_cells:
+            for p, i in enumerate(rows):
+                unescaped = self._unescaped_cells.get(i)
+                if unescaped:
+                    for j in unescaped:
+                        k = positions.get(j)
+                        if k is not None and not (
+                            j in number_formats and _is_number(columns[k][p])
+                        ):
+                            texts[k][p] = str(columns[k][p])
+
+        if stats is not None:
+            converted = time.perf_counter()
+            stats.add_time("convert", converted - started)
+            stats.rows += len(rows)
+            stats.cells += len(rows) * len(texts)
+            stats.formatter_calls += self._count_formatter_calls(rows, positions)
+
+        if self._formatters:
+            # The texts of every column of the grid, None for columns not rendered
+            by_column: list[Optional[list[str]]] = [None] * self._num_cols
+            for j, k in positions.items():
+                by_column[j] = texts[k]
+            for p, i in enumerate(rows):
+                row_formatters = self._formatters.get(i)
+                if row_formatters:
+                    for j, cell_formatters in row_formatters.items():
+                        column = by_column[j]
+                        if column is None:
+                            continue
+                        content = column[p]
+                        for formatter in cell_formatters:
+                            content = formatter(content)
+                        column[p] = content
+
+        contiguous = isinstance(rows, range) and rows.step == 1
+        for region_rows, region_cols, formatters in self._region_formatters:
+            selected = [positions[j] for j in region_cols if j in positions]
+            if not selected:
+                continue
+            if contiguous:
+                first = max(region_rows.start, rows.start) - rows.start
+                last = min(region_rows.stop, rows.stop) - rows.start
+                if first >= last:
+                    continue
+                for k in selected:
+                    region = texts[k][first:last]
+                    for formatter in formatters:
+                        region = list(map(formatter, region))
+                    texts[k][first:last] = region
+            else:
+                inside = [p for p, i in enumerate(rows) if i in region_rows]
+                for k in selected:
+                    column = texts[k]
+                    for p in inside:
+                        content = column[p]
+                        for formatter in formatters:
+                            content = formatter(content)
+                        column[p] = content
+
+        if self._column_rules:
+            rule_calls = 0
+            for j, rule_results in self._evaluated_rules().items():
+                k = positions.get(j)
+                if k is None:
+                    continue
+                column = texts[k]
+                for rule_result in rule_results:
+                    for p, i in enumerate(rows):
+                        formatters = rule_result.get(i)
+                        if formatters:
+                            content = column[p]
+                            for formatter in formatters:
+                                content = formatter(content)
+                            column[p] = content
+                            rule_calls += len(formatters)
+            if stats is not None:
+                stats.formatter_calls += rule_calls
+
+        for j, formatters in self._column_formatters.items():
+            k = positions.get(j)
+            if k is None:
+                continue
+            for formatter in formatters:
+                texts[k] = list(map(formatter, texts[k]))
+
+        if stats is not None:
+            stats.add_time("formatters", time.perf_counter() - converted)
+        return texts
+
+    def _count_formatter_calls(self, rows: Sequence[int], cols: Collection[int]) -> int:
+        """Return how many formatter calls rendering the given rows and columns takes."""
+        calls = 0
+        if self._formatters:
+            for i in rows:
+                row_formatters = self._formatters.get(i)
+                if row_formatters:
+                    calls += sum(
+                        len(formatters)
+                        for j, formatters in row_formatters.items()
+                        if j in cols
+                    )
+        contiguous = isinstance(rows, range) and rows.step == 1
+        for region_rows, region_cols, formatters in self._region_formatters:
+            if contiguous:
+                overlap = min(region_rows.stop, rows.stop) - max(region_rows.start, rows.start)
+            else:
+                overlap = sum(i in region_rows for i in rows)
+            if overlap > 0:
+                num_cols = sum(j in cols for j in region_cols)
+                calls += overlap * num_cols * len(formatters)
+        for j, formatters in self._column_formatters.items():
+            if j in cols:
+                calls += len(rows) * len(formatters)
+        return calls
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_row_changes"]  # Collectors belong to this process only
+        state["_rule_results"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._row_changes = weakref.WeakSet()
+
+    def to_text(self, headers: Optional[Sequence[str]] = None) -> str:
+        """
+        Returns a plain-text representation of the grid with aligned columns.
+
+        Args:
+            headers (Optional[Sequence[str]]): Optional header row to print first.
+
+        Returns:
+            str: The grid as text, one line per row.
+        """
+        return "".join(iter_text(self, headers)).strip()
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Row, list[Row]]:
+        """
+        Gets the row at the specified index.
+
+        Args:
+            index (Union[int, slice]): The index or slice of the row(s) to retrieve.
+
+        Returns:
+            Union[Row, list[Row]]: The row at the specified index, or a list of
+                rows for a slice.
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._num_rows))]
+        if index < 0:
+            index += self._num_rows
+        if index < 0 or index >= self._num_rows:
+            raise IndexError("Row index out of range.")
+        return Row([CellView(self, index, j) for j in range(self._num_cols)])
+
+    def __str__(self) -> str:
+        return self.to_text()
 
     def __repr__(self) -> str:
         """
@@ -89,7 +1075,10 @@ class Grid:
         Returns:
             str: A string representation of the grid.
         """
-        return "\n".join([" | ".join(repr(cell) for cell in row) for row in self._grid])
+        return "\n".join(
+            " | ".join(f"Cell({value})" for value in values)
+            for values in self.iter_row_values()
+        )
 
     def __iter__(self) -> Iterator[Row]:
         """
@@ -98,7 +1087,7 @@ class Grid:
         Returns:
             Iterator[Row]: An iterator over the rows.
         """
-        return iter(self._grid)
+        return (self[i] for i in range(self._num_rows))
 
 
 if __name__ == "__main__":
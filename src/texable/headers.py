@@ -1,9 +1,28 @@
-from typing import Sequence, Union
+from bisect import insort
+from typing import Collection, Literal, NamedTuple, Sequence, Union
+
+from texable.escaping import escape
+
+GroupRule = Literal["cline", "cmidrule"]
+
+
+class HeaderGroup(NamedTuple):
+    """A header spanning several columns, above their own headers."""
+
+    label: str
+    first: int
+    """The first column of the group."""
+    last: int
+    """The last column of the group, included."""
 
 
 class Headers:
     def __init__(self, num_headers: int) -> None:
         self._headers: list[str] = [""] * num_headers  # Initialize with empty strings
+        # Header groups by level, from the one right above the headers up
+        self._groups: list[list[HeaderGroup]] = []
+        self._group_rule: GroupRule = "cline"
+        self._version = 0  # Incremented on every change
 
     @property
     def headers(self) -> list[str]:
@@ -30,6 +49,7 @@ class Headers:
             ValueError: If the length of the value sequence does not match the number of indices.
             IndexError: If the index is out of range.
         """
+        self._version += 1
 
         if isinstance(index, int):
             if not isinstance(value, str):
@@ -71,6 +91,105 @@ class Headers:
                 f"Index must be an integer or a slice, got {type(index).__name__}."
             )
 
+    def add_group(self, label: str, first: int, last: int, level: int = 0) -> None:
+        """Add a header spanning the columns from `first` to `last`, above their headers.
+
+        Groups are only shown together with the headers. A rule below every
+        group separates it from the row underneath.
+
+        Examples:
+            "Model" above the "Accuracy" and "Latency" columns, and
+            "Results" above everything:
+
+            >>> table.headers = ["Dataset", "Accuracy", "Latency"]
+            >>> table.headers.add_group("Model", 1, 2)
+            >>> table.headers.add_group("Results", 0, 2, level=1)
+
+        Args:
+            label : The text of the group, escaped like the headers.
+            first : The first column of the group.
+            last : The last column of the group, included.
+            level : The row of the group: 0 is right above the headers, 1
+                above level 0, and so on. At most one more than the highest
+                level so far.
+        Raises:
+            TypeError: If the label is not a string.
+            ValueError: If the level is skipped, the columns are in the wrong
+                order, or the group overlaps another group of its level.
+            IndexError: If a column is out of range.
+        """
+        if not isinstance(label, str):
+            raise TypeError(f"Header must be a string, got {type(label).__name__}.")
+        if not 0 <= first < len(self._headers) or not 0 <= last < len(self._headers):
+            raise IndexError("Index out of range")
+        if last < first:
+            raise ValueError("The last column of a group must not be before its first.")
+        if not 0 <= level <= len(self._groups):
+            raise ValueError(f"Level must be between 0 and {len(self._groups)}, got {level}.")
+
+        if level == len(self._groups):
+            self._groups.append([])
+        groups = self._groups[level]
+        if any(group.first <= last and first <= group.last for group in groups):
+            raise ValueError("Groups of the same level must not overlap.")
+        insort(groups, HeaderGroup(label, first, last), key=lambda group: group.first)
+        self._version += 1
+
+    def clear_groups(self) -> None:
+        """Remove all header groups."""
+        self._groups = []
+        self._version += 1
+
+    @property
+    def groups(self) -> list[list[HeaderGroup]]:
+        """Get the header groups of every level, from the one right above the headers up."""
+        return [list(groups) for groups in self._groups]
+
+    @property
+    def group_rule(self) -> GroupRule:
+        """Get or set the rule drawn below header groups.
+
+        "cline" draws `\\cline`, "cmidrule" draws the booktabs `\\cmidrule`
+        with trimmed ends and adds the `booktabs` package.
+        """
+        return self._group_rule
+
+    @group_rule.setter
+    def group_rule(self, rule: GroupRule) -> None:
+        if rule not in ("cline", "cmidrule"):
+            raise ValueError(f"Unknown group rule: {rule!r}.")
+        self._group_rule = rule
+        self._version += 1
+
+    def groups_to_latex(self, vertical_borders: Sequence[str], escaped: bool = True) -> str:
+        """Convert the header groups to LaTeX rows, each followed by its rules.
+
+        Args:
+            vertical_borders : The vertical borders of the table, kept at the
+                edges of every group.
+            escaped : Whether to escape the labels.
+        """
+        latex = ""
+        num_columns = len(self._headers)
+        for groups in reversed(self._groups):
+            cells: list[str] = []
+            rules = ""
+            j = 0
+            for group in groups:
+                cells += [""] * (group.first - j)
+                j = group.last + 1
+                left = vertical_borders[0] if group.first == 0 else ""
+                spec = left + "c" + vertical_borders[j]
+                label = escape(group.label) if escaped else group.label
+                cells.append(f"\\multicolumn{{{j - group.first}}}{{{spec}}}{{{label}}}")
+                if self._group_rule == "cmidrule":
+                    rules += f"\\cmidrule(lr){{{group.first + 1}-{j}}}"
+                else:
+                    rules += f"\\cline{{{group.first + 1}-{j}}}"
+            cells += [""] * (num_columns - j)
+            latex += " & ".join(cells) + r" \\" + "\n" + rules + "\n"
+        return latex
+
     def __len__(self) -> int:
         return len(self._headers)
 
@@ -84,6 +203,23 @@ class Headers:
     def __repr__(self):
         return repr(self._headers)
 
-    def to_latex(self) -> str:
-        """Convert headers to LaTeX format."""
-        return " & ".join(self._headers) + r" \\" + "\n"
+    def to_latex(
+        self, protected: Collection[int] = (), unescaped: Collection[int] = ()
+    ) -> str:
+        """Convert headers to LaTeX format, escaping special characters.
+
+        Args:
+            protected : Indices of headers to wrap in braces, as needed for
+                headers of siunitx `S` columns.
+            unescaped : Indices of headers that are already LaTeX and must
+                not be escaped.
+        """
+        headers = [
+            header if i in unescaped else escape(header)
+            for i, header in enumerate(self._headers)
+        ]
+        headers = [
+            f"{{{header}}}" if i in protected else header
+            for i, header in enumerate(headers)
+        ]
+        return " & ".join(headers) + r" \\" + "\n"
@@ -0,0 +1,232 @@
+import functools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class RenderStats:
+    """
+    Measurements of one operation on a table, such as a `to_latex` call.
+
+    Attributes:
+        operation (str): The name of the measured method, e.g. "to_latex".
+        phases (dict[str, float]): Seconds spent per phase. "total" is the whole
+            operation. Rendering operations split it into "convert" (values to
+            strings, including number formats and escaping), "formatters"
+            (formatter chains), "write" (writing to streams and files) and
+            "layout" (everything else: borders, headers, block indentation and
+            joining the output).
+        cache_hit (bool): Whether the output came from the render cache.
+        rows (int): Number of data rows rendered.
+        cells (int): Number of cells rendered.
+        formatter_calls (int): Number of times a formatter was applied to a cell.
+        output_bytes (int): Size of the produced LaTeX, encoded as UTF-8.
+    """
+
+    def __init__(self, operation: str) -> None:
+        self.operation = operation
+        self.phases: dict[str, float] = {}
+        self.cache_hit = False
+        self.rows = 0
+        self.cells = 0
+        self.formatter_calls = 0
+        self.output_bytes = 0
+
+    def add_time(self, phase: str, seconds: float) -> None:
+        """
+        Adds time spent in a phase.
+
+        Args:
+            phase (str): The name of the phase.
+            seconds (float): The time to add.
+        """
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns the measurements as a plain, JSON-serializable dict.
+        """
+        return {
+            "operation": self.operation,
+            "phases": dict(self.phases),
+            "cache_hit": self.cache_hit,
+            "rows": self.rows,
+            "cells": self.cells,
+            "formatter_calls": self.formatter_calls,
+            "output_bytes": self.output_bytes,
+        }
+
+    def __repr__(self) -> str:
+        return f"RenderStats({self.to_dict()!r})"
+
+
+Listener = Callable[[RenderStats], None]
+
+_listeners: list[Listener] = []
+# Stats lists of the enclosing `instrument()` blocks in this context
+_collectors: ContextVar[tuple[list[RenderStats], ...]] = ContextVar(
+    "_collectors", default=()
+)
+# Stats of the operation in progress in this context
+_active: ContextVar[Optional[RenderStats]] = ContextVar("_active", default=None)
+
+
+def add_listener(listener: Listener) -> None:
+    """
+    Calls `listener` with the stats of every measured operation from now on,
+    in any thread.
+
+    Args:
+        listener (Listener): A callable taking a `RenderStats`, such as `log_stats`.
+    """
+    _listeners.append(listener)
+
+
+def remove_listener(listener: Listener) -> None:
+    """
+    Stops calling a listener added with `add_listener`.
+
+    Args:
+        listener (Listener): The listener to remove.
+
+    Raises:
+        ValueError: If the listener was not added.
+    """
+    _listeners.remove(listener)
+
+
+@contextmanager
+def instrument() -> Iterator[list[RenderStats]]:
+    """
+    Collect the stats of every table operation inside the `with` block.
+
+    Only operations in the current thread or asyncio task are collected.
+    Measured operations are table construction, `to_latex`, `render`,
+    `write_to` and `write_to_file`; `iter_latex` is not measured on its own,
+    since its work happens in the caller's loop.
+
+    Examples:
+        >>> with instrument() as stats:
+        ...     latex = table.to_latex()
+        >>> stats[0].to_dict()["phases"]["total"]  # doctest: +SKIP
+        0.0042
+
+    Yields:
+        list[RenderStats]: The stats, appended to as operations finish.
+    """
+    collected: list[RenderStats] = []
+    token = _collectors.set(_collectors.get() + (collected,))
+    try:
+        yield collected
+    finally:
+        _collectors.reset(token)
+
+
+def enabled() -> bool:
+    """Return whether operations are currently measured."""
+    return bool(_listeners) or bool(_collectors.get())
+
+
+def current_stats() -> Optional[RenderStats]:
+    """Return the stats of the operation being measured, or None if there is none."""
+    return _active.get()
+
+
+@contextmanager
+def measure(operation: str, remainder: Optional[str] = None) -> Iterator[RenderStats]:
+    """
+    Measure an operation and report its stats when it finishes.
+
+    Args:
+        operation (str): The name of the operation.
+        remainder (Optional[str]): Phase that is assigned the part of the total
+            time not recorded in any other phase.
+    """
+    stats = RenderStats(operation)
+    token = _active.set(stats)
+    start = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        total = time.perf_counter() - start
+        _active.reset(token)
+        if remainder is not None:
+            stats.phases[remainder] = max(total - sum(stats.phases.values()), 0.0)
+        stats.phases["total"] = total
+        _publish(stats)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """Add the time spent in the `with` block to a phase of the operation being measured."""
+    stats = _active.get()
+    if stats is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.add_time(phase, time.perf_counter() - start)
+
+
+def measured(operation: str, remainder: Optional[str] = None) -> Callable[[F], F]:
+    """
+    Decorator that measures every call of a method while instrumentation is enabled.
+
+    Calls made while another operation is measured, e.g. `write_to` inside
+    `write_to_file`, add to that operation's stats instead.
+
+    Args:
+        operation (str): The name of the operation.
+        remainder (Optional[str]): See `measure`.
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _active.get() is not None or not enabled():
+                return func(*args, **kwargs)
+            with measure(operation, remainder):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _publish(stats: RenderStats) -> None:
+    for collected in _collectors.get():
+        collected.append(stats)
+    for listener in list(_listeners):
+        listener(stats)
+
+
+def log_stats(stats: RenderStats) -> None:
+    """
+    Listener that logs a one-line summary of the stats to the `texable.instrumentation` logger.
+
+    Use it with `add_listener(log_stats)`; the output goes to the handlers set
+    up by `texable.logger_config.setup_logging`, or any other logging setup.
+    """
+    import logging
+
+    phases = ", ".join(
+        f"{phase} {seconds * 1000:.1f} ms"
+        for phase, seconds in stats.phases.items()
+        if phase != "total"
+    )
+    logging.getLogger(__name__).info(
+        "%s took %.1f ms%s: %d rows, %d cells, %d formatter calls, %d bytes%s",
+        stats.operation,
+        stats.phases.get("total", 0.0) * 1000,
+        f" ({phases})" if phases else "",
+        stats.rows,
+        stats.cells,
+        stats.formatter_calls,
+        stats.output_bytes,
+        " (cached)" if stats.cache_hit else "",
+    )
@@ -0,0 +1,189 @@
+import math
+from typing import Any
+
+from texable.custom_types import Alignment
+from texable.grid import Grid
+
+# Optional dependencies (numpy, pyarrow) are imported inside the functions
+# that need them, so importing texable never requires them.
+
+
+def _alignment_for_kind(kind: str) -> Alignment:
+    """Return the default alignment for a NumPy dtype kind."""
+    return Alignment.RIGHT if kind in "iuf" else Alignment.CENTER
+
+
+def _is_missing(value: Any) -> bool:
+    """Return whether a value of an object column stands for a missing value."""
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _datetime_strings(column: Any, missing: str) -> Any:
+    """
+    Convert a `datetime64` array to ISO 8601 strings, dropping the time of day
+    when every value falls on midnight. NaT becomes `missing`.
+    """
+    import numpy as np
+
+    strings = np.datetime_as_string(column, unit="auto").astype(object)
+    strings[np.isnat(column)] = missing
+    return strings
+
+
+def _object_column(column: Any, mask: Any, missing: str) -> Any:
+    """Replace the masked values of an object column with `missing`."""
+    if mask.any():
+        # Never write into an array that may be shared with the caller
+        column = column.copy()
+        column[mask] = missing
+    return column
+
+
+def _pandas_column(values: Any, copy: bool, missing: str) -> Any:
+    """Adopt a pandas Series or Index as a NumPy array for a Grid column."""
+    if values.dtype.kind == "M":
+        if getattr(values.dtype, "tz", None) is None:
+            return _datetime_strings(values.to_numpy(), missing)
+        # Timezone-aware values: keep the offset in the ISO string
+        import numpy as np
+
+        mask = values.isna().to_numpy()
+        stamps = values.to_numpy(dtype=object)
+        return np.array(
+            [missing if lost else stamp.isoformat() for stamp, lost in zip(stamps, mask)],
+            dtype=object,
+        )
+
+    column = values.to_numpy(copy=copy)
+    if column.dtype.kind == "O":
+        column = _object_column(column, values.isna().to_numpy(), missing)
+    return column
+
+
+def from_dataframe(
+    df: Any, index: bool = False, copy: bool = False, missing: str = ""
+) -> tuple[Grid, list[str], list[Alignment]]:
+    """
+    Builds a Grid from a pandas DataFrame.
+
+    Each column is adopted as the array returned by `Series.to_numpy`, which
+    shares memory with the DataFrame for NumPy-backed dtypes. Datetime columns
+    are converted to ISO 8601 strings, and missing values in object and string
+    columns are replaced with `missing`; those columns are copied.
+
+    Args:
+        df (pandas.DataFrame): The DataFrame to convert.
+        index (bool): Whether to include the index as the first column.
+        copy (bool): Copy the column buffers instead of sharing them.
+        missing (str): The cell content for missing values.
+
+    Returns:
+        tuple[Grid, list[str], list[Alignment]]: The grid, headers taken from the
+            column names, and alignments derived from the column dtypes.
+    """
+    columns = []
+    headers = []
+    if index:
+        columns.append(_pandas_column(df.index, copy, missing))
+        headers.append("" if df.index.name is None else str(df.index.name))
+    for position, name in enumerate(df.columns):
+        columns.append(_pandas_column(df.iloc[:, position], copy, missing))
+        headers.append(str(name))
+
+    if not columns:
+        raise ValueError("The DataFrame has no columns.")
+
+    alignments = [_alignment_for_kind(column.dtype.kind) for column in columns]
+    return Grid.from_columns(columns), headers, alignments
+
+
+def from_ndarray(
+    array: Any, copy: bool = False, missing: str = ""
+) -> tuple[Grid, list[Alignment]]:
+    """
+    Builds a Grid from a two-dimensional NumPy array.
+
+    Each column is adopted as a view of the array, so no data is copied.
+    `datetime64` arrays are converted to ISO 8601 strings, and missing values
+    (None, NaN, NaT) in object and datetime arrays are replaced with `missing`.
+
+    Args:
+        array (numpy.ndarray): A two-dimensional array.
+        copy (bool): Copy the columns instead of sharing memory with `array`.
+        missing (str): The cell content for missing values.
+
+    Returns:
+        tuple[Grid, list[Alignment]]: The grid and alignments derived from the dtype.
+
+    Raises:
+        ValueError: If the array is not two-dimensional or has no columns.
+    """
+    import numpy as np
+
+    array = np.asarray(array)
+    if array.ndim != 2:
+        raise ValueError(f"Array must be two-dimensional, got {array.ndim} dimensions.")
+    if array.shape[1] == 0:
+        raise ValueError("The array has no columns.")
+
+    alignments = [_alignment_for_kind(array.dtype.kind)] * array.shape[1]
+    if array.dtype.kind == "M":
+        array = _datetime_strings(array, missing)
+    elif array.dtype.kind == "O":
+        mask = np.frompyfunc(_is_missing, 1, 1)(array).astype(bool)
+        array = _object_column(array, mask, missing)
+
+    columns = [array[:, j] for j in range(array.shape[1])]
+    if copy:
+        columns = [column.copy() for column in columns]
+    return Grid.from_columns(columns), alignments
+
+
+def from_arrow(
+    table: Any, missing: str = ""
+) -> tuple[Grid, list[str], list[Alignment]]:
+    """
+    Builds a Grid from a pyarrow Table or RecordBatch.
+
+    Columns are converted with `to_numpy`, which is zero-copy for primitive
+    columns without nulls stored in a single chunk. Date and timestamp columns
+    are converted to ISO 8601 strings, and nulls are replaced with `missing`.
+
+    Args:
+        table (pyarrow.Table | pyarrow.RecordBatch): The Arrow data to convert.
+        missing (str): The cell content for null values.
+
+    Returns:
+        tuple[Grid, list[str], list[Alignment]]: The grid, headers taken from the
+            schema, and alignments derived from the column types.
+    """
+    import pyarrow.types as pa_types
+
+    columns = []
+    alignments = []
+    for field, column in zip(table.schema, table.columns):
+        if pa_types.is_date(field.type) or pa_types.is_timestamp(field.type):
+            # Nulls become NaT, which is replaced along with the conversion
+            columns.append(
+                _datetime_strings(column.to_numpy(zero_copy_only=False), missing)
+            )
+        elif column.null_count:
+            # Nulls would become NaN (numbers) or raise
+            values = column.to_pylist()
+            columns.append([missing if value is None else value for value in values])
+        else:
+            columns.append(column.to_numpy(zero_copy_only=False))
+
+        numeric = (
+            pa_types.is_integer(field.type)
+            or pa_types.is_floating(field.type)
+            or pa_types.is_decimal(field.type)
+        )
+        alignments.append(Alignment.RIGHT if numeric else Alignment.CENTER)
+
+    if not columns:
+        raise ValueError("The Arrow table has no columns.")
+
+    headers = [str(name) for name in table.schema.names]
+    return Grid.from_columns(columns), headers, alignments
+
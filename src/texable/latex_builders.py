@@ -1,9 +1,13 @@
-from typing import Optional
+from typing import Iterable, Iterator, NamedTuple, Optional, Sequence
 
 from texable.grid import Grid
 from texable.headers import Headers
 from texable.line_borders import LineBorders
 from texable.column_alignments import ColumnAlignments
+from texable.spans import SpanLayout
+
+# Characters that `str.splitlines` treats as line boundaries
+_LINE_BREAKS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
 
 
 def make_caption(caption: str) -> str:
@@ -14,24 +18,279 @@ def make_label(label: str) -> str:
     return f"\\label{{{label}}}\n"
 
 
-def make_tabular_content(
-    headers: Headers, data: Grid, horizontal_borders: LineBorders
-) -> str:
-    latex_rows = []
-    if headers.are_set:
-        latex_rows.append(headers.to_latex())
+class IndentedLines(str):
+    """
+    Block content made of complete lines that already carry the indentation
+    of every enclosing block. `iter_lines` and `iter_block` pass it through
+    unchanged instead of splitting and indenting it again.
+    """
+
+
+def indent_lines(text: str, indent: str) -> IndentedLines:
+    """Indent the lines of `text` the way `iter_block` indents its content."""
+    return IndentedLines(
+        "".join(
+            indent + line + "\n" if line.strip() else "\n"
+            for line in text.splitlines()
+        )
+    )
+
+
+class Layout(NamedTuple):
+    """
+    The borders and column argument of a table, compiled for rendering.
+
+    Built by `compile_layout` from the headers, borders and alignments of a
+    table, so that rendering reads plain strings instead of indexing and
+    validating the layout objects cell by cell.
+    """
+
+    top: str
+    """The top border line, or an empty string."""
+    header_rule: str
+    """The border line below the headers, or an empty string."""
+    header_groups: str
+    """The rows of header groups above the headers, with their rules."""
+    row_borders: tuple[str, ...]
+    """The border line above each data row, or an empty string."""
+    bottom: str
+    """The bottom border, without a line break."""
+    column_arg: str
+    """The column argument of the tabular environment."""
+    spans: Optional[SpanLayout] = None
+    """The merged cells, if any."""
+
+
+def _line(border: str) -> str:
+    return border + "\n" if border else ""
+
+
+def compile_layout(
+    headers: Headers,
+    horizontal_borders: LineBorders,
+    vertical_borders: LineBorders,
+    column_alignments: ColumnAlignments,
+    column_types: Optional[dict[int, str]] = None,
+    spans: Optional[SpanLayout] = None,
+    escape_headers: bool = True,
+) -> Layout:
+    """Compile the layout of a table into a `Layout`.
+
+    Borders are taken the way `make_head` and `iter_body_chunks` use them:
+    with headers, the second border goes below the headers and is also the
+    one above the first data row. Borders crossing merged cells in `spans`
+    are drawn around them. `escape_headers` applies to header groups.
+    """
+    borders = horizontal_borders.borders
+    lines = tuple(_line(border) for border in borders)
+    with_headers = headers.are_set
+    row_lines = lines[1:] if with_headers else lines
+    if spans is not None and spans.crossed:
+        num_cols = len(column_alignments)
+        row_lines = tuple(
+            spans.border_line(i, line, num_cols) if i else line
+            for i, line in enumerate(row_lines)
+        )
+    return Layout(
+        top=lines[0],
+        header_rule=lines[1] if with_headers and len(lines) > 1 else "",
+        header_groups=(
+            headers.groups_to_latex(vertical_borders.borders, escape_headers)
+            if with_headers
+            else ""
+        ),
+        row_borders=row_lines,
+        bottom=borders[-1],
+        column_arg=make_column_arg(vertical_borders, column_alignments, column_types),
+        spans=spans,
+    )
+
+
+def make_head(headers: Headers, data: Grid, layout: Layout) -> str:
+    """Return what precedes the first data row.
+
+    That is the top border and, if headers are set, the header groups, the
+    header row and the border below it.
+    """
+    if not headers.are_set:
+        return layout.top
+    return (
+        layout.top
+        + layout.header_groups
+        + headers.to_latex(protected=data.column_types(), unescaped=data.unescaped_columns())
+        + layout.header_rule
+    )
+
+
+def _iter_body(
+    rows: Iterator[str],
+    borders: Sequence[str],
+    start: int,
+    stop: int,
+) -> Iterator[str]:
+    for i, row in zip(range(start, stop), rows):
+        if i != start and borders[i]:
+            yield borders[i]
+        yield row
+
+
+def _iter_indented_body(
+    rows: Sequence[IndentedLines],
+    borders: Sequence[str],
+    start: int,
+    stop: int,
+) -> Iterator[str]:
+    # Runs of rows between two borders are yielded as a single chunk
+    run_start = start
+    for i in range(start + 1, stop):
+        if borders[i]:
+            yield IndentedLines("".join(rows[run_start:i]))
+            yield borders[i]
+            run_start = i
+    yield IndentedLines("".join(rows[run_start:stop]))
+
+
+def iter_body_chunks(
+    data: Grid,
+    borders: Sequence[str],
+    rows_per_chunk: Optional[int] = None,
+    indented_rows: Optional[Sequence[IndentedLines]] = None,
+    spans: Optional[SpanLayout] = None,
+) -> Iterator[Iterator[str]]:
+    """Split the data rows into chunks, each yielded as an iterator of its rows.
 
-    for row in data:
-        latex_rows.append(row.to_latex())
+    Rows are interleaved with the borders above them, except for the first
+    row of each chunk, whose border belongs to the chunk's head. Every chunk
+    must be consumed before the next one is requested, since they share one
+    pass over the grid.
 
-    with_borders = ""
-    for i in range(len(latex_rows)):
-        if horizontal_borders[i]:
-            with_borders += horizontal_borders[i] + "\n"
-        with_borders += latex_rows[i]
-    with_borders += horizontal_borders[-1]
+    Args:
+        data (Grid): The grid to render.
+        borders (Sequence[str]): The border line above each data row, see
+            `Layout.row_borders`.
+        rows_per_chunk (Optional[int]): Rows per chunk, or None for a single chunk.
+        indented_rows (Optional[Sequence[IndentedLines]]): The data rows of
+            `data` already rendered and indented, e.g. from a cache.
+        spans (Optional[SpanLayout]): Merged cells, used unless `indented_rows`
+            is given.
+    """
+    num_rows = data.num_rows
+    size = rows_per_chunk or max(num_rows, 1)
+    if indented_rows is None:
+        rows = data.iter_latex_rows(spans=spans)
+        for start in range(0, max(num_rows, 1), size):
+            yield _iter_body(rows, borders, start, min(start + size, num_rows))
+    else:
+        for start in range(0, max(num_rows, 1), size):
+            yield _iter_indented_body(
+                indented_rows, borders, start, min(start + size, num_rows)
+            )
 
-    return with_borders
+
+def iter_tabular_content(
+    headers: Headers,
+    data: Grid,
+    layout: Layout,
+    indented_rows: Optional[Sequence[IndentedLines]] = None,
+) -> Iterator[str]:
+    """Yield the rows of the tabular environment, interleaved with their borders.
+
+    `indented_rows` supplies the data rows of `data` already rendered and
+    indented, e.g. from a cache.
+    """
+    yield make_head(headers, data, layout)
+    for body in iter_body_chunks(
+        data, layout.row_borders, None, indented_rows, layout.spans
+    ):
+        yield from body
+    yield layout.bottom
+
+
+def iter_preview_content(
+    headers: Headers,
+    data: Grid,
+    layout: Layout,
+    shown: Sequence[range],
+    omitted: int,
+) -> Iterator[str]:
+    """Yield the rows of a tabular environment showing only some data rows.
+
+    Only the `shown` rows are rendered. A row spanning all columns stands in
+    for the `omitted` rows between two ranges.
+    """
+    yield make_head(headers, data, layout)
+    borders = layout.row_borders
+    for k, rows in enumerate(shown):
+        if k:
+            yield (
+                f"\\multicolumn{{{data.num_cols}}}{{c}}"
+                f"{{$\\vdots$ ({omitted} rows omitted)}} \\\\\n"
+            )
+        yield from _iter_body(
+            data.iter_latex_rows(rows.start, rows.stop, layout.spans),
+            borders,
+            rows.start,
+            rows.stop,
+        )
+    yield layout.bottom
+
+
+def make_tabular_content(headers: Headers, data: Grid, layout: Layout) -> str:
+    return "".join(iter_tabular_content(headers, data, layout))
+
+
+def iter_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Split a stream of text chunks into lines.
+
+    Equivalent to `"".join(chunks).splitlines()`, but only holds one chunk
+    (plus an unterminated line carried over to the next chunk) in memory.
+    `IndentedLines` chunks are yielded whole.
+    """
+    pending = ""
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if isinstance(chunk, IndentedLines):
+            if pending:
+                yield pending
+                pending = ""
+            yield chunk
+            continue
+        if pending:
+            chunk = pending + chunk
+            pending = ""
+        lines = chunk.splitlines()
+        if chunk[-1] not in _LINE_BREAKS:
+            pending = lines.pop()
+        yield from lines
+    if pending:
+        yield pending
+
+
+def iter_block(
+    name: str,
+    content: Iterable[str],
+    indent: str,
+    required_arg: Optional[list[str]] = None,
+    optional_arg: Optional[list[str]] = None,
+) -> Iterator[str]:
+    """Yield a LaTeX environment line by line, indenting its content."""
+    optional = f"[{', '.join(optional_arg)}]" if optional_arg else ""
+    required = f"{{{', '.join(required_arg)}}}" if required_arg else ""
+    yield f"\\begin{{{name}}}{optional}{required}\n"
+
+    empty = True
+    for line in iter_lines(content):
+        empty = False
+        if isinstance(line, IndentedLines):
+            yield line
+        else:
+            yield indent + line + "\n" if line.strip() else "\n"
+    if empty:
+        yield "\n"
+
+    yield f"\\end{{{name}}}\n"
 
 
 def make_block(
@@ -41,21 +300,23 @@ def make_block(
     required_arg: Optional[list[str]] = None,
     optional_arg: Optional[list[str]] = None,
 ) -> str:
-    required = f"{{{', '.join(required_arg)}}}" if required_arg else ""
-    optional = f"[{', '.join(optional_arg)}]" if optional_arg else ""
-    indented = "\n".join(
-        indent + line if line.strip() else "" for line in content.splitlines()
-    )
-    return f"\\begin{{{name}}}{required}{optional}\n{indented}\n\\end{{{name}}}\n"
+    return "".join(iter_block(name, [content], indent, required_arg, optional_arg))
 
 
 def make_column_arg(
-    vertical_borders: LineBorders, column_alignments: ColumnAlignments
+    vertical_borders: LineBorders,
+    column_alignments: ColumnAlignments,
+    column_types: Optional[dict[int, str]] = None,
 ) -> str:
-    """Generate the column argument for the tabular environment."""
-    result = ""
-    for i in range(len(column_alignments)):
-        result += vertical_borders[i]
-        result += column_alignments[i]
-    result += vertical_borders[-1]
-    return result
+    """Generate the column argument for the tabular environment.
+
+    `column_types` overrides the alignment of specific columns with another
+    column type, such as siunitx's `S`.
+    """
+    column_types = column_types or {}
+    borders = vertical_borders.borders
+    alignments = [
+        column_types.get(i, alignment)
+        for i, alignment in enumerate(column_alignments.alignments)
+    ]
+    return "".join(map(str.__add__, borders, alignments)) + borders[-1]
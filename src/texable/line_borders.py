@@ -15,6 +15,7 @@ class LineBorders(ABC):
     def __init__(self, num_borders: int) -> None:
         self._num_borders = num_borders
         self._borders = [""] * num_borders
+        self._version = 0  # Incremented on every change
 
     @property
     def borders(self) -> list[str]:
@@ -44,6 +45,19 @@ class LineBorders(ABC):
             raise IndexError("Index out of range.")
 
         self._borders[index] = self._make_border(type)
+        self._version += 1
+
+    def _insert(self, index: int, count: int, border: str = "") -> None:
+        """Insert `count` borders before `index`, in amortized constant time near the end."""
+        self._borders[index:index] = [border] * count
+        self._num_borders += count
+        self._version += 1
+
+    def _delete(self, index: int, count: int) -> None:
+        """Delete `count` borders from `index` on."""
+        del self._borders[index : index + count]
+        self._num_borders = len(self._borders)
+        self._version += 1
 
     @abstractmethod
     def _make_border(self, type: Literal["single", "double"]) -> str:
@@ -17,11 +17,20 @@ class ColorFormatter(logging.Formatter):
         return f"{color}{message}{self.RESET}"
 
 
-def setup_logging():
+def setup_logging(level: int = logging.INFO) -> None:
+    """
+    Send log records to stderr, colored by level.
+
+    This replaces the handlers of the root logger and sets its level, so it
+    is meant for scripts and interactive use. Importing texable never calls it.
+
+    Args:
+        level (int): The level of the root logger.
+    """
     handler = logging.StreamHandler()
     formatter = ColorFormatter("%(levelname)s - %(message)s")
     handler.setFormatter(formatter)
 
     root_logger = logging.getLogger()
-    root_logger.setLevel(logging.INFO)
+    root_logger.setLevel(level)
     root_logger.handlers = [handler]
@@ -0,0 +1,231 @@
+import math
+from numbers import Number
+from typing import Any, Literal, Optional, Sequence
+
+from texable.packages import Package
+
+Notation = Literal["fixed", "percent", "scientific", "engineering"]
+Siunitx = Literal["num", "S"]
+
+
+def _numpy() -> Any:
+    """Return the numpy module, or None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, Number) and not isinstance(value, (bool, complex))
+
+
+class NumberFormat:
+    """
+    Describes how the numbers in a column are converted to LaTeX.
+
+    Non-numeric values in the column are left untouched and rendered with `str`.
+
+    Examples:
+        Two decimals with a thousands separator:
+
+        >>> NumberFormat(decimals=2, thousands=",").format(1234.5)
+        '1,234.50'
+
+        Three significant digits as a percentage:
+
+        >>> NumberFormat(significant=3, notation="percent").format(0.12345)
+        '12.3\\\\%'
+    """
+
+    def __init__(
+        self,
+        decimals: Optional[int] = None,
+        significant: Optional[int] = None,
+        notation: Notation = "fixed",
+        thousands: str = "",
+        decimal_mark: str = ".",
+        siunitx: Optional[Siunitx] = None,
+    ) -> None:
+        """
+        Initializes a NumberFormat.
+
+        Args:
+            decimals (Optional[int]): Number of digits after the decimal mark.
+                For scientific and engineering notation this applies to the mantissa.
+            significant (Optional[int]): Number of significant digits. Cannot be
+                combined with `decimals`.
+            notation (Notation): One of "fixed", "percent" (value multiplied by
+                100, followed by a percent sign), "scientific" or "engineering"
+                (exponent is a multiple of three).
+            thousands (str): Separator inserted between groups of three digits.
+            decimal_mark (str): Character used as the decimal mark.
+            siunitx (Optional[Siunitx]): "num" wraps every number in `\\num{}`;
+                "S" emits plain numbers and turns the column into a siunitx `S`
+                column. Both register the `siunitx` package.
+
+        Raises:
+            ValueError: If the options are inconsistent.
+        """
+        if decimals is not None and significant is not None:
+            raise ValueError("Specify either decimals or significant digits, not both.")
+        if decimals is not None and decimals < 0:
+            raise ValueError("decimals must be a non-negative integer.")
+        if significant is not None and significant <= 0:
+            raise ValueError("significant must be a positive integer.")
+        if notation not in ("fixed", "percent", "scientific", "engineering"):
+            raise ValueError(f"Unknown notation: {notation!r}.")
+        if siunitx not in (None, "num", "S"):
+            raise ValueError(f"siunitx must be None, 'num' or 'S', got {siunitx!r}.")
+
+        self.decimals = decimals
+        self.significant = significant
+        self.notation = notation
+        self.thousands = thousands
+        self.decimal_mark = decimal_mark
+        self.siunitx = siunitx
+
+    @property
+    def packages(self) -> list[Package]:
+        """Get the LaTeX packages needed to render numbers in this format."""
+        return [Package("siunitx")] if self.siunitx else []
+
+    @property
+    def column_type(self) -> Optional[str]:
+        """Get the tabular column type this format requires, if any."""
+        return "S" if self.siunitx == "S" else None
+
+    def format(self, value: Any) -> str:
+        """
+        Formats a single value.
+
+        Args:
+            value (Any): The value to format.
+
+        Returns:
+            str: The LaTeX representation of the value.
+        """
+        if not _is_number(value):
+            return str(value)
+        if isinstance(value, float) and not math.isfinite(value):
+            return self._finish(str(value), None)
+
+        match self.notation:
+            case "percent":
+                return self._finish(self._fixed(value * 100), "\\%")
+            case "scientific" | "engineering":
+                return self._exponential(value)
+            case _:
+                return self._finish(self._fixed(value), None)
+
+    def format_many(self, values: Sequence[Any]) -> list[str]:
+        """
+        Formats a sequence of values, e.g. one column.
+
+        Columns that hold only ints and floats (or a NumPy integer or float
+        array) are formatted in one pass with a precompiled format spec when
+        the format allows it; other columns are formatted value by value.
+
+        Args:
+            values (Sequence[Any]): The values to format.
+
+        Returns:
+            list[str]: The LaTeX representation of each value.
+        """
+        spec = self._spec()
+        np = _numpy()
+        if np is not None and isinstance(values, np.ndarray):
+            numeric = values.dtype.kind in "iuf"
+            values = values.tolist()
+        else:
+            numeric = spec is not None and set(map(type, values)) <= {int, float}
+
+        if spec is None or not numeric:
+            return [self.format(value) for value in values]
+
+        texts = list(map(spec.format, values))
+        table = {}
+        if self.thousands and self.thousands != ",":
+            table[ord(",")] = self.thousands
+        if self.decimal_mark != ".":
+            table[ord(".")] = self.decimal_mark
+        if table:
+            texts = [text.translate(table) for text in texts]
+        if self.notation == "percent":
+            # The "%" presentation type appends a bare percent sign, which
+            # `format` leaves off non-finite values
+            return [
+                self.format(value)
+                if isinstance(value, float) and not math.isfinite(value)
+                else self._finish(text[:-1], "\\%")
+                for text, value in zip(texts, values)
+            ]
+        if self.siunitx == "num":
+            return [self._finish(text, None) for text in texts]
+        return texts
+
+    def _spec(self) -> Optional[str]:
+        """Return a `str.format` spec equivalent to `format` for finite ints and floats."""
+        if self.decimals is None or self.notation not in ("fixed", "percent"):
+            return None
+        grouping = "," if self.thousands else ""
+        presentation = "%" if self.notation == "percent" else "f"
+        return f"{{:{grouping}.{self.decimals}{presentation}}}"
+
+    def _decimals_for(self, value: float) -> Optional[int]:
+        if self.significant is None:
+            return self.decimals
+        if value == 0:
+            return self.significant - 1
+        return self.significant - 1 - math.floor(math.log10(abs(value)))
+
+    def _fixed(self, value: Any) -> str:
+        decimals = self._decimals_for(value)
+        grouping = "," if self.thousands else ""
+        if decimals is None:
+            text = f"{value:{grouping}}"
+        elif decimals < 0:
+            text = f"{round(value, decimals):{grouping}.0f}"
+        else:
+            text = f"{value:{grouping}.{decimals}f}"
+        return text.translate({ord(","): self.thousands, ord("."): self.decimal_mark})
+
+    def _exponential(self, value: Any) -> str:
+        value = float(value)
+        exponent = 0 if value == 0 else math.floor(math.log10(abs(value)))
+        if self.notation == "engineering":
+            exponent -= exponent % 3
+        mantissa = value / 10**exponent
+
+        if self.significant is not None:
+            decimals = max(self._decimals_for(mantissa) or 0, 0)
+        else:
+            decimals = self.decimals
+        text = f"{mantissa:.{decimals}f}" if decimals is not None else repr(mantissa)
+
+        # Rounding may carry the mantissa into the next power of ten
+        step = 3 if self.notation == "engineering" else 1
+        if abs(float(text)) >= 10**step:
+            exponent += step
+            mantissa /= 10**step
+            text = f"{mantissa:.{decimals}f}" if decimals is not None else repr(mantissa)
+
+        text = text.replace(".", self.decimal_mark)
+        if self.siunitx:
+            return self._finish(f"{text}e{exponent}", None)
+        if exponent == 0:
+            return text
+        return f"${text} \\times 10^{{{exponent}}}$"
+
+    def _finish(self, text: str, suffix: Optional[str]) -> str:
+        if self.siunitx == "num":
+            text = f"\\num{{{text}}}"
+        return text + suffix if suffix else text
+
+    def __repr__(self) -> str:
+        return (
+            f"NumberFormat(decimals={self.decimals}, significant={self.significant}, "
+            f"notation={self.notation!r}, thousands={self.thousands!r}, "
+            f"decimal_mark={self.decimal_mark!r}, siunitx={self.siunitx!r})"
+        )
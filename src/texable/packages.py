@@ -1,4 +1,6 @@
-from typing import Iterable, Optional, Set
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterable, Iterator, Optional, Set, TypeVar
 
 
 class Package:
@@ -12,7 +14,7 @@ class Package:
 
     def __str__(self) -> str:
         if self.options:
-            return f"\\usepackage[{','.join(self.options)}]{{{self.name}}}"
+            return f"\\usepackage[{','.join(sorted(self.options))}]{{{self.name}}}"
         else:
             return f"\\usepackage{{{self.name}}}"
 
@@ -31,17 +33,87 @@ class Package:
             self.options.add(option)
 
 
+class PackageSet:
+    """
+    A collection of LaTeX packages, unique by name, in the order they were required.
+
+    Requiring a package that is already in the set merges the new options into it.
+    """
+
+    def __init__(self, packages: Iterable[Package] = ()) -> None:
+        self._packages: dict[str, Package] = {}
+        self.update(packages)
+
+    def add(self, name: str, options: Optional[Iterable[str]] = None) -> None:
+        """
+        Adds a package, merging its options if it is already present.
+
+        Args:
+            name (str): The name of the package.
+            options (Optional[Iterable[str]]): Optional list of options for the package.
+        """
+        existing = self._packages.get(name)
+        if existing is None:
+            self._packages[name] = Package(name, options)
+        elif options:
+            existing.add_options(options)
+
+    def update(self, packages: Iterable[Package]) -> None:
+        """
+        Adds several packages, merging options of packages already present.
+
+        Args:
+            packages (Iterable[Package]): The packages to add.
+        """
+        for pkg in packages:
+            self.add(pkg.name, pkg.options)
+
+    def to_latex(self) -> str:
+        """
+        Returns the `\\usepackage` lines for all packages, one per line.
+        """
+        return "".join(f"{pkg}\n" for pkg in self)
+
+    def __iter__(self) -> Iterator[Package]:
+        return iter(self._packages.values())
+
+    def __len__(self) -> int:
+        return len(self._packages)
+
+    def __contains__(self, name: object) -> bool:
+        if isinstance(name, Package):
+            name = name.name
+        return name in self._packages
+
+    def __repr__(self) -> str:
+        return f"PackageSet({list(self._packages)})"
+
+
+# Packages required outside of any `package_scope`
 required_packages: Set[Package] = set()
 
+_current_scope: ContextVar[Optional[PackageSet]] = ContextVar(
+    "texable_package_scope", default=None
+)
+
 
 def require_package(name: str, options: Optional[Iterable[str]] = None) -> None:
     """
     Marks a LaTeX package as required for the document.
 
+    The package is added to the innermost active `package_scope`, such as the
+    one opened by `Table.to_latex`. Outside of any scope it is added to the
+    module-level `required_packages` set.
+
     Args:
         name (str): The name of the package.
         options (Optional[Sequence[str]]): Optional list of options for the package.
     """
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.add(name, options)
+        return
+
     new_pkg = Package(name, options)
     if new_pkg in required_packages:
         if options:
@@ -52,3 +124,67 @@ def require_package(name: str, options: Optional[Iterable[str]] = None) -> None:
                     break
     else:
         required_packages.add(new_pkg)
+
+
+@contextmanager
+def package_scope(propagate: bool = True) -> Iterator[PackageSet]:
+    """
+    Collects the packages required inside the `with` block.
+
+    The scope is stored in a context variable, so concurrent scopes in
+    different threads or asyncio tasks do not see each other's packages.
+
+    Args:
+        propagate (bool): When the block exits, also add the collected packages
+            to the enclosing scope, if there is one.
+
+    Yields:
+        PackageSet: The packages required inside the block.
+    """
+    packages = PackageSet()
+    token = _current_scope.set(packages)
+    try:
+        yield packages
+    finally:
+        _current_scope.reset(token)
+        parent = _current_scope.get()
+        if propagate and parent is not None:
+            parent.update(packages)
+
+
+F = TypeVar("F", bound=Callable[[str], str])
+
+
+def requires(name: str, options: Optional[Iterable[str]] = None) -> Callable[[F], F]:
+    """
+    Declares that a formatter needs a LaTeX package.
+
+    Declared packages are registered by the renderer before any output is
+    produced, which lets `Table.iter_latex` emit a complete preamble up front.
+
+    Args:
+        name (str): The name of the package.
+        options (Optional[Iterable[str]]): Optional list of options for the package.
+
+    Returns:
+        Callable[[F], F]: A decorator that records the package on the formatter.
+    """
+
+    def decorator(formatter: F) -> F:
+        packages = list(getattr(formatter, "packages", ()))
+        packages.append(Package(name, options))
+        formatter.packages = packages  # type: ignore[attr-defined]
+        return formatter
+
+    return decorator
+
+
+def require_formatter_packages(formatter: Callable[[str], str]) -> None:
+    """
+    Marks all packages declared by a formatter as required.
+
+    Args:
+        formatter (Callable[[str], str]): A formatter, optionally decorated with `requires`.
+    """
+    for package in getattr(formatter, "packages", ()):
+        require_package(package.name, package.options)
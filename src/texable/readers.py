@@ -0,0 +1,328 @@
+import csv
+from contextlib import contextmanager
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from texable.grid import CHUNK_SIZE, Grid
+
+if TYPE_CHECKING:
+    from texable.spans import SpanLayout
+
+Converter = Callable[[str], Any]
+Dtypes = Union[Mapping[int, Converter], Sequence[Optional[Converter]]]
+Dialect = Union[str, csv.Dialect, type[csv.Dialect]]
+
+
+class DelimitedFile:
+    """
+    A CSV or TSV file together with the options needed to read it.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        delimiter: str,
+        encoding: Optional[str] = None,
+        dialect: Optional[Dialect] = None,
+        max_rows: Optional[int] = None,
+        has_header: bool = False,
+    ) -> None:
+        """
+        Initializes a DelimitedFile.
+
+        Args:
+            file_path (str): Path to the file.
+            delimiter (str): Field delimiter, used when no dialect is given.
+            encoding (Optional[str]): Text encoding of the file.
+            dialect (Optional[Dialect]): A `csv` dialect, overriding `delimiter`.
+            max_rows (Optional[int]): Maximum number of data rows to read.
+            has_header (bool): Whether the first row holds the column headers.
+        """
+        if max_rows is not None and max_rows < 0:
+            raise ValueError("max_rows must be a non-negative integer.")
+
+        self.file_path = file_path
+        self.delimiter = delimiter
+        self.encoding = encoding
+        self.dialect = dialect
+        self.max_rows = max_rows
+        self.has_header = has_header
+
+    @contextmanager
+    def rows(self) -> Iterator[tuple[Optional[list[str]], Iterator[list[str]]]]:
+        """
+        Opens the file and yields its header (if any) and an iterator over the data rows.
+        """
+        with open(self.file_path, "r", encoding=self.encoding, newline="") as file:
+            if self.dialect is None:
+                reader = csv.reader(file, delimiter=self.delimiter)
+            else:
+                reader = csv.reader(file, self.dialect)
+
+            header = next(reader, None) if self.has_header else None
+            yield header, islice(reader, self.max_rows)
+
+
+def iter_row_chunks(
+    rows: Iterator[list[str]], num_cols: Optional[int], chunk_size: int = CHUNK_SIZE
+) -> Iterator[list[list[str]]]:
+    """
+    Reads rows in chunks, checking that every row has the same number of columns.
+
+    Args:
+        rows (Iterator[list[str]]): The rows to read.
+        num_cols (Optional[int]): Expected number of columns, or None to use the first row.
+        chunk_size (int): Number of rows per chunk.
+
+    Raises:
+        ValueError: If a row does not have the expected number of columns.
+    """
+    row_number = 0
+    while chunk := list(islice(rows, chunk_size)):
+        if num_cols is None:
+            num_cols = len(chunk[0])
+        for row in chunk:
+            row_number += 1
+            if len(row) != num_cols:
+                raise ValueError(
+                    f"All rows must have the same number of columns: "
+                    f"row {row_number} has {len(row)}, expected {num_cols}."
+                )
+        yield chunk
+
+
+def _converts(values: Iterable[str], converter: Converter) -> bool:
+    try:
+        for _ in map(converter, values):
+            pass
+    except ValueError:
+        return False
+    return True
+
+
+class DtypeInference:
+    """
+    Infers a numeric type per column from chunks of raw string values.
+
+    Each column starts out as `int` and is widened to `float` and finally left
+    as `str` as soon as a value that does not fit is seen.
+    """
+
+    _CANDIDATES: tuple[Converter, ...] = (int, float)
+
+    def __init__(self, num_cols: int) -> None:
+        self._levels = [0] * num_cols
+
+    def update(self, columns: Sequence[Sequence[str]]) -> None:
+        """
+        Narrows the inferred types using another chunk of column values.
+
+        Args:
+            columns (Sequence[Sequence[str]]): One sequence of raw values per column.
+        """
+        for j, values in enumerate(columns):
+            level = self._levels[j]
+            while level < len(self._CANDIDATES) and not _converts(
+                values, self._CANDIDATES[level]
+            ):
+                level += 1
+            self._levels[j] = level
+
+    def converters(self) -> list[Optional[Converter]]:
+        """
+        Returns the inferred converter per column, or None for text columns.
+        """
+        return [
+            self._CANDIDATES[level] if level < len(self._CANDIDATES) else None
+            for level in self._levels
+        ]
+
+
+def resolve_converters(
+    num_cols: int,
+    dtypes: Optional[Dtypes],
+    inference: Optional[DtypeInference],
+) -> list[Optional[Converter]]:
+    """
+    Combines explicit dtypes with inferred ones; explicit dtypes take precedence.
+    """
+    converters = inference.converters() if inference else [None] * num_cols
+    if dtypes is None:
+        return converters
+
+    items = dtypes.items() if isinstance(dtypes, Mapping) else enumerate(dtypes)
+    for j, converter in items:
+        if not 0 <= j < num_cols:
+            raise IndexError(f"dtype given for column {j}, but there are {num_cols}.")
+        if converter is not None:
+            converters[j] = converter
+    return converters
+
+
+def read_columns(
+    source: DelimitedFile,
+    dtypes: Optional[Dtypes] = None,
+    infer_dtypes: bool = False,
+) -> tuple[Optional[list[str]], list[list[Any]]]:
+    """
+    Reads a delimited file into one list of values per column.
+
+    Rows are read and validated chunk by chunk and appended straight to the
+    column lists, so the file is never held as a list of rows.
+
+    Returns:
+        tuple[Optional[list[str]], list[list[Any]]]: The header row (if any) and the columns.
+
+    Raises:
+        ValueError: If the file has no data rows or rows have inconsistent column counts.
+    """
+    columns: list[list[Any]] = []
+    inference: Optional[DtypeInference] = None
+
+    with source.rows() as (header, rows):
+        for chunk in iter_row_chunks(rows, len(header) if header else None):
+            chunk_columns = list(zip(*chunk))
+            if not columns:
+                columns = [[] for _ in chunk_columns]
+                inference = DtypeInference(len(columns)) if infer_dtypes else None
+            if inference is not None:
+                inference.update(chunk_columns)
+            for column, values in zip(columns, chunk_columns):
+                column.extend(values)
+
+    if not columns:
+        if not header:
+            raise ValueError(f"The file {source.file_path} contains no rows.")
+        columns = [[] for _ in header]
+
+    converters = resolve_converters(len(columns), dtypes, inference)
+    for j, converter in enumerate(converters):
+        if converter is not None:
+            columns[j] = list(map(converter, columns[j]))
+
+    return header, columns
+
+
+class StreamedGrid(Grid):
+    """
+    A grid whose rows are read from a delimited file every time they are rendered.
+
+    Only the row count, column count and inferred dtypes are kept in memory,
+    so rendering uses a constant amount of memory regardless of the file size.
+    Cells cannot be indexed or modified, but formatters can still be added
+    through the grid-level APIs.
+    """
+
+    def __init__(
+        self,
+        source: DelimitedFile,
+        dtypes: Optional[Dtypes] = None,
+        infer_dtypes: bool = False,
+    ) -> None:
+        """
+        Initializes the StreamedGrid by scanning the file once.
+
+        Args:
+            source (DelimitedFile): The file to read rows from.
+            dtypes (Optional[Dtypes]): Converters per column.
+            infer_dtypes (bool): Whether to infer numeric column types.
+
+        Raises:
+            ValueError: If the file has no data rows or rows have inconsistent column counts.
+        """
+        self._source = source
+        num_rows = 0
+        num_cols: Optional[int] = None
+        inference: Optional[DtypeInference] = None
+
+        with source.rows() as (header, rows):
+            self._header = header
+            for chunk in iter_row_chunks(rows, len(header) if header else None):
+                if num_cols is None:
+                    num_cols = len(chunk[0])
+                    inference = DtypeInference(num_cols) if infer_dtypes else None
+                if inference is not None:
+                    inference.update(list(zip(*chunk)))
+                num_rows += len(chunk)
+
+        if num_cols is None:
+            if not header:
+                raise ValueError(f"The file {source.file_path} contains no rows.")
+            num_cols = len(header)
+
+        self._converters = resolve_converters(num_cols, dtypes, inference)
+        self._init_storage([], num_rows)
+        self._num_cols = num_cols
+
+    @property
+    def header(self) -> Optional[list[str]]:
+        """
+        Returns the header row read from the file, if the file has one.
+        """
+        return self._header
+
+    def _iter_column_chunks(
+        self, chunk_size: int = CHUNK_SIZE, first: int = 0, stop: Optional[int] = None
+    ) -> Iterator[tuple[int, list[list[Any]]]]:
+        stop = self._num_rows if stop is None else min(stop, self._num_rows)
+        if first >= stop:
+            return
+        start = 0
+        with self._source.rows() as (_, rows):
+            for chunk in iter_row_chunks(rows, self._num_cols, chunk_size):
+                end = start + len(chunk)
+                if end > first:
+                    # Rows before `first` are read, but never converted
+                    chunk = chunk[max(first - start, 0) : stop - start]
+                    columns = [list(values) for values in zip(*chunk)]
+                    for j, converter in enumerate(self._converters):
+                        if converter is not None:
+                            columns[j] = list(map(converter, columns[j]))
+                    yield max(start, first), columns
+                start = end
+                if start >= stop:
+                    break
+
+    @property
+    def cacheable(self) -> bool:
+        # The file may change between renders
+        return False
+
+    @property
+    def random_access(self) -> bool:
+        # Rows are only ever read front to back
+        return False
+
+    def iter_column_values(self, col: int) -> Iterator[Any]:
+        if not 0 <= col < self._num_cols:
+            raise IndexError("Column index out of range.")
+        for _, columns in self._iter_column_chunks():
+            yield from columns[col]
+
+    def _set_value(self, row: int, col: int, value: Any) -> None:
+        raise TypeError("Values of a streamed grid cannot be modified.")
+
+    def append_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        raise TypeError("Rows cannot be added to a streamed grid.")
+
+    def insert_rows(self, index: int, rows: Iterable[Sequence[Any]]) -> None:
+        raise TypeError("Rows cannot be added to a streamed grid.")
+
+    def delete_rows(self, rows: Iterable[int]) -> None:
+        raise TypeError("Rows cannot be deleted from a streamed grid.")
+
+    def render_row(self, index: int, spans: Optional["SpanLayout"] = None) -> str:
+        raise TypeError("Rows of a streamed grid cannot be rendered one by one.")
+
+    def __getitem__(self, index):
+        raise TypeError("Rows of a streamed grid cannot be accessed by index.")
@@ -0,0 +1,238 @@
+import math
+import re
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Any, Callable, Literal, Optional, Sequence, Union
+
+from texable.formatters import ColorFormatter, bold
+from texable.number_format import _is_number
+from texable.packages import Package
+
+Formatter = Callable[[str], str]
+
+
+def _numbers(values: Sequence[Any]) -> list[tuple[int, Any]]:
+    """Return the `(row, value)` pairs of the numeric values, leaving out NaN."""
+    return [
+        (i, value)
+        for i, value in enumerate(values)
+        if _is_number(value) and not (isinstance(value, float) and math.isnan(value))
+    ]
+
+
+def _packages(formatters: Sequence[Formatter]) -> list[Package]:
+    return [package for formatter in formatters for package in getattr(formatter, "packages", ())]
+
+
+class Rule(ABC):
+    """
+    A conditional formatting rule for a column.
+
+    Rules are evaluated once per render on all values of the column at once,
+    and decide which formatters each cell gets. They are applied after cell
+    and region formatters and before column formatters.
+
+    Attributes:
+        packages (list[Package]): The LaTeX packages the formatters of the rule need.
+    """
+
+    packages: list[Package]
+
+    @abstractmethod
+    def evaluate(self, values: Sequence[Any]) -> dict[int, Sequence[Formatter]]:
+        """
+        Decides which values are formatted.
+
+        Args:
+            values (Sequence[Any]): The raw values of the column.
+
+        Returns:
+            dict[int, Sequence[Formatter]]: The formatters of every formatted
+                value, by index. Values not in the dict are left as they are.
+        """
+
+
+class HighlightMax(Rule):
+    """
+    Formats the largest number of a column, and any value equal to it.
+
+    Examples:
+        >>> from texable.formatters import cell_color
+        >>> table.columns[1].add_rules(HighlightMax(bold, cell_color("yellow")))
+    """
+
+    _largest = True
+
+    def __init__(self, *formatters: Formatter) -> None:
+        """
+        Initializes the rule.
+
+        Args:
+            *formatters (Formatter): Formatters for the highlighted values.
+                Defaults to `bold`.
+        """
+        self.formatters = formatters or (bold,)
+        self.packages = _packages(self.formatters)
+
+    def evaluate(self, values: Sequence[Any]) -> dict[int, Sequence[Formatter]]:
+        numbers = _numbers(values)
+        if not numbers:
+            return {}
+        extreme = (max if self._largest else min)(value for _, value in numbers)
+        return {i: self.formatters for i, value in numbers if value == extreme}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}{self.formatters!r}"
+
+
+class HighlightMin(HighlightMax):
+    """
+    Formats the smallest number of a column, and any value equal to it.
+    """
+
+    _largest = False
+
+
+class Threshold(Rule):
+    """
+    Formats the numbers of a column above and/or below a threshold.
+
+    With both bounds, only numbers strictly between them are formatted.
+
+    Examples:
+        >>> from texable.formatters import text_color
+        >>> table.columns[2].add_rules(Threshold(text_color("red"), below=0))
+    """
+
+    def __init__(
+        self,
+        *formatters: Formatter,
+        above: Optional[float] = None,
+        below: Optional[float] = None,
+    ) -> None:
+        """
+        Initializes the rule.
+
+        Args:
+            *formatters (Formatter): Formatters for the matching values.
+                Defaults to `bold`.
+            above (Optional[float]): Format numbers greater than this.
+            below (Optional[float]): Format numbers less than this.
+
+        Raises:
+            ValueError: If neither bound is given.
+        """
+        if above is None and below is None:
+            raise ValueError("Threshold needs a lower bound, an upper bound or both.")
+        self.formatters = formatters or (bold,)
+        self.above = above
+        self.below = below
+        self.packages = _packages(self.formatters)
+
+    def evaluate(self, values: Sequence[Any]) -> dict[int, Sequence[Formatter]]:
+        above = -math.inf if self.above is None else self.above
+        below = math.inf if self.below is None else self.below
+        return {i: self.formatters for i, value in _numbers(values) if above < value < below}
+
+    def __repr__(self) -> str:
+        return f"Threshold({self.formatters!r}, above={self.above!r}, below={self.below!r})"
+
+
+class Matches(Rule):
+    """
+    Formats the values of a column whose text matches a regular expression.
+
+    Examples:
+        >>> from texable.formatters import italic
+        >>> table.columns[0].add_rules(Matches(r"^TODO", italic))
+    """
+
+    def __init__(
+        self, pattern: Union[str, "re.Pattern[str]"], *formatters: Formatter, flags: int = 0
+    ) -> None:
+        """
+        Initializes the rule.
+
+        Args:
+            pattern (Union[str, re.Pattern[str]]): Searched for in `str(value)`.
+            *formatters (Formatter): Formatters for the matching values.
+                Defaults to `bold`.
+            flags (int): `re` flags, used when `pattern` is a string.
+        """
+        self.pattern = re.compile(pattern, flags) if isinstance(pattern, str) else pattern
+        self.formatters = formatters or (bold,)
+        self.packages = _packages(self.formatters)
+
+    def evaluate(self, values: Sequence[Any]) -> dict[int, Sequence[Formatter]]:
+        search = self.pattern.search
+        return {i: self.formatters for i, value in enumerate(values) if search(str(value))}
+
+    def __repr__(self) -> str:
+        return f"Matches({self.pattern.pattern!r}, {self.formatters!r})"
+
+
+class ColorScale(Rule):
+    """
+    Colors the numbers of a column on a gradient by their percentile rank.
+
+    The smallest number gets the `low` color, the largest the `high` color,
+    and the others a mix of both in proportion to their rank. Ranks are
+    rounded to `steps` levels, so the output uses at most `steps + 1` colors.
+
+    Examples:
+        A heatmap from white to red:
+
+        >>> table.columns[3].add_rules(ColorScale("white", "red"))
+    """
+
+    def __init__(
+        self,
+        low: str = "white",
+        high: str = "red",
+        steps: int = 10,
+        command: Literal["cellcolor", "textcolor"] = "cellcolor",
+    ) -> None:
+        """
+        Initializes the rule.
+
+        Args:
+            low (str): The xcolor color of the smallest number.
+            high (str): The xcolor color of the largest number.
+            steps (int): The number of color levels above `low`.
+            command (Literal["cellcolor", "textcolor"]): Whether to color the
+                cell background or the text.
+
+        Raises:
+            ValueError: If `steps` is not positive or the command is unknown.
+        """
+        if steps <= 0:
+            raise ValueError("steps must be a positive integer.")
+        if command not in ("cellcolor", "textcolor"):
+            raise ValueError(f"Unknown color command: {command!r}.")
+        self.low = low
+        self.high = high
+        self.steps = steps
+        self.command = command
+        self._options = ["table"] if command == "cellcolor" else None
+        self.packages = [Package("xcolor", self._options)]
+
+    def evaluate(self, values: Sequence[Any]) -> dict[int, Sequence[Formatter]]:
+        numbers = _numbers(values)
+        distinct = sorted({value for _, value in numbers})
+        if not distinct:
+            return {}
+        last = max(len(distinct) - 1, 1)
+        levels: dict[int, tuple[Formatter]] = {}
+        result: dict[int, Sequence[Formatter]] = {}
+        for i, value in numbers:
+            level = round(bisect_left(distinct, value) / last * self.steps)
+            formatters = levels.get(level)
+            if formatters is None:
+                percent = round(100 * level / self.steps)
+                color = f"{self.high}!{percent}!{self.low}"
+                formatters = levels[level] = (ColorFormatter(self.command, color, self._options),)
+            result[i] = formatters
+        return result
+
+    def __repr__(self) -> str:
+        return f"ColorScale({self.low!r}, {self.high!r}, steps={self.steps}, command={self.command!r})"
@@ -0,0 +1,304 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import Iterator, NamedTuple, Optional, Sequence
+
+from texable.views import contiguous_runs
+
+
+class Span(NamedTuple):
+    """A rectangular block of merged cells."""
+
+    row: int
+    """The first row."""
+    col: int
+    """The first column."""
+    num_rows: int
+    num_cols: int
+
+    @property
+    def rows(self) -> range:
+        """The rows the span covers."""
+        return range(self.row, self.row + self.num_rows)
+
+    @property
+    def cols(self) -> range:
+        """The columns the span covers."""
+        return range(self.col, self.col + self.num_cols)
+
+
+class Spans:
+    """
+    The merged cells of a table.
+
+    Spans are indexed column by column: the spans covering a column never
+    overlap, so they are kept sorted by their first row and the span
+    covering a cell is found by bisection, in O(log n) for n spans.
+    """
+
+    def __init__(self) -> None:
+        self._spans: list[Span] = []
+        # Column -> first rows of the spans covering it, sorted, and those spans
+        self._starts: dict[int, list[int]] = {}
+        self._by_start: dict[int, dict[int, Span]] = {}
+        self._version = 0  # Incremented on every change
+
+    def add(self, span: Span) -> None:
+        """
+        Adds a span.
+
+        Args:
+            span (Span): The span to add.
+
+        Raises:
+            ValueError: If the span overlaps another span.
+        """
+        if self.overlapping(span):
+            raise ValueError("Merged cells cannot overlap other merged cells.")
+        self._index(span)
+        self._spans.append(span)
+        self._version += 1
+
+    def _index(self, span: Span) -> None:
+        for j in span.cols:
+            insort(self._starts.setdefault(j, []), span.row)
+            self._by_start.setdefault(j, {})[span.row] = span
+
+    def remove(self, span: Span) -> None:
+        """
+        Removes a span.
+
+        Args:
+            span (Span): The span to remove.
+
+        Raises:
+            ValueError: If the span is not there.
+        """
+        self._spans.remove(span)
+        for j in span.cols:
+            starts = self._starts[j]
+            del starts[bisect_left(starts, span.row)]
+            del self._by_start[j][span.row]
+            if not starts:
+                del self._starts[j], self._by_start[j]
+        self._version += 1
+
+    def at(self, row: int, col: int) -> Optional[Span]:
+        """
+        Returns the span covering a cell, if any.
+
+        Args:
+            row (int): The row of the cell.
+            col (int): The column of the cell.
+
+        Returns:
+            Optional[Span]: The span, or None if the cell is not merged.
+        """
+        starts = self._starts.get(col)
+        if not starts:
+            return None
+        k = bisect_right(starts, row) - 1
+        if k < 0:
+            return None
+        span = self._by_start[col][starts[k]]
+        return span if row < span.row + span.num_rows else None
+
+    def overlapping(self, span: Span) -> list[Span]:
+        """
+        Returns the spans sharing a cell with `span`.
+
+        Args:
+            span (Span): Any block of cells.
+
+        Returns:
+            list[Span]: The overlapping spans, each listed once.
+        """
+        found: dict[Span, None] = {}
+        stop = span.row + span.num_rows
+        for j in span.cols:
+            starts = self._starts.get(j)
+            if not starts:
+                continue
+            # The span covering the first row, and those starting further down
+            first = max(bisect_right(starts, span.row) - 1, 0)
+            for start in starts[first : bisect_left(starts, stop)]:
+                other = self._by_start[j][start]
+                if other.row + other.num_rows > span.row:
+                    found[other] = None
+        return list(found)
+
+    @property
+    def has_multirow(self) -> bool:
+        """Whether any span covers more than one row."""
+        return any(span.num_rows > 1 for span in self._spans)
+
+    def _replace_all(self, spans: list[Span]) -> None:
+        self._spans = []
+        self._starts = {}
+        self._by_start = {}
+        for span in spans:
+            self._index(span)
+            self._spans.append(span)
+        self._version += 1
+
+    def _insert_rows(self, index: int, count: int) -> None:
+        """Move the spans below `index` down, growing those the new rows go into."""
+        if not self._spans:
+            return
+        spans = []
+        for span in self._spans:
+            if span.row >= index:
+                span = span._replace(row=span.row + count)
+            elif index < span.row + span.num_rows:
+                span = span._replace(num_rows=span.num_rows + count)
+            spans.append(span)
+        self._replace_all(spans)
+
+    def _delete_rows(self, deleted: Sequence[int]) -> None:
+        """Move the spans up after deleting the sorted, distinct rows `deleted`."""
+        if not self._spans:
+            return
+        spans = []
+        for span in self._spans:
+            first = bisect_left(deleted, span.row)
+            last = bisect_left(deleted, span.row + span.num_rows)
+            num_rows = span.num_rows - (last - first)
+            if num_rows * span.num_cols > 1:
+                spans.append(span._replace(row=span.row - first, num_rows=num_rows))
+        self._replace_all(spans)
+
+    def __iter__(self) -> Iterator[Span]:
+        return iter(sorted(self._spans))
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __bool__(self) -> bool:
+        return bool(self._spans)
+
+
+# (first column, column after the span, text before, text after, whether to show the content)
+_Segment = tuple[int, int, str, str, bool]
+
+
+class SpanLayout:
+    """
+    The merged cells of a table, compiled for rendering.
+
+    Only rows holding part of a span have an entry, so rows without any
+    are joined as usual at the cost of one dict lookup.
+    """
+
+    def __init__(
+        self, spans: Spans, vertical_borders: Sequence[str], alignments: Sequence[str]
+    ) -> None:
+        """
+        Compiles the spans.
+
+        Args:
+            spans (Spans): The merged cells.
+            vertical_borders (Sequence[str]): The vertical borders of the table.
+            alignments (Sequence[str]): The column alignment of every column.
+        """
+        self._rows: dict[int, tuple[_Segment, ...]] = {}
+        # Data row -> columns of the spans the border above it would cross
+        self.crossed: dict[int, Sequence[int]] = {}
+        # Spans of the same shape in the same columns share their segments
+        shapes: dict[tuple[int, int, int], tuple[_Segment, _Segment]] = {}
+        rows = self._rows
+        crossed = self.crossed
+        shared = set()  # Rows holding parts of several spans
+        for row, col, num_rows, num_cols in spans:
+            segments = shapes.get((col, num_rows, num_cols))
+            if segments is None:
+                segments = shapes[col, num_rows, num_cols] = self._segments(
+                    col, num_rows, num_cols, vertical_borders, alignments
+                )
+            first, covered = segments
+            if row in rows:
+                rows[row] += (first,)
+                shared.add(row)
+            else:
+                rows[row] = (first,)
+            cols = range(col, col + num_cols)
+            for i in range(row + 1, row + num_rows):
+                if i in rows:
+                    rows[i] += (covered,)
+                    crossed[i] = [*crossed.get(i, ()), *cols]
+                    shared.add(i)
+                else:
+                    rows[i] = (covered,)
+                    crossed[i] = cols
+        for i in shared:
+            rows[i] = tuple(sorted(rows[i]))
+
+    @staticmethod
+    def _segments(
+        col: int,
+        num_rows: int,
+        num_cols: int,
+        vertical_borders: Sequence[str],
+        alignments: Sequence[str],
+    ) -> tuple[_Segment, _Segment]:
+        """Return the segments of the first row of a span and of the rows it covers."""
+        multicolumn = ""
+        if num_cols > 1:
+            left = vertical_borders[0] if col == 0 else ""
+            spec = left + alignments[col] + vertical_borders[col + num_cols]
+            multicolumn = f"\\multicolumn{{{num_cols}}}{{{spec}}}{{"
+        multirow = f"\\multirow{{{num_rows}}}{{*}}{{" if num_rows > 1 else ""
+        closing = "}" * ((num_cols > 1) + (num_rows > 1))
+        stop = col + num_cols
+        return (
+            (col, stop, multicolumn + multirow, closing, True),
+            (col, stop, multicolumn, "}" if multicolumn else "", False),
+        )
+
+    def join_row(self, row: int, contents: Sequence[str]) -> str:
+        """
+        Joins the rendered cells of a row into a LaTeX row.
+
+        Cells covered by a span are left out; the first cell of a span
+        holds its content.
+
+        Args:
+            row (int): The index of the row.
+            contents (Sequence[str]): The rendered cells of the row.
+
+        Returns:
+            str: The LaTeX row, with line ending.
+        """
+        segments = self._rows.get(row)
+        if segments is None:
+            return " & ".join(contents) + r" \\" + "\n"
+        cells: list[str] = []
+        j = 0
+        for first, stop, before, after, show in segments:
+            cells.extend(contents[j:first])
+            cells.append(before + contents[first] + after if show else before + after)
+            j = stop
+        cells.extend(contents[j:])
+        return " & ".join(cells) + r" \\" + "\n"
+
+    def border_line(self, row: int, border: str, num_cols: int) -> str:
+        """
+        Returns the border line above a data row, drawn around the spans it crosses.
+
+        A `\\hline` crossing a span becomes `\\cline` ranges over the other
+        columns. Double borders become single ones there.
+
+        Args:
+            row (int): The data row below the border.
+            border (str): The border line, with its line break.
+            num_cols (int): The number of columns of the table.
+
+        Returns:
+            str: The border line, with its line break, or an empty string.
+        """
+        crossed = self.crossed.get(row)
+        if not border or not crossed:
+            return border
+        covered = set(crossed)
+        free = [j for j in range(num_cols) if j not in covered]
+        clines = "".join(
+            f"\\cline{{{run.start + 1}-{run.stop}}}" for run in contiguous_runs(free)
+        )
+        return clines + "\n" if clines else ""
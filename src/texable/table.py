@@ -1,24 +1,61 @@
-from typing import Optional, Any, Sequence, Union
-import logging
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, NamedTuple, Optional, Any, Sequence, TextIO, Union
+from itertools import chain, compress
+import heapq
+import time
 
 from texable.column_alignments import ColumnAlignments
-from texable.grid import Grid
+from texable.columns import Columns
+from texable.grid import Grid, RowChanges
 from texable.headers import Headers
+from texable.instrumentation import current_stats, measured, timed
 from texable.line_borders import LineBorders, VerticalBorders, HorizontalBorders
 from texable.latex_builders import (
     make_caption,
     make_label,
-    make_block,
-    make_tabular_content,
-    make_column_arg,
+    iter_block,
+    iter_body_chunks,
+    iter_preview_content,
+    indent_lines,
+    make_head,
+    IndentedLines,
+    Layout,
+    compile_layout,
 )
-from texable.custom_types import Alignment
-from texable.packages import required_packages
+from texable.custom_types import Alignment, Pagination
+from texable.packages import PackageSet, _current_scope, package_scope
 from texable.row import Row
+from texable.spans import Span, SpanLayout, Spans
+from texable.text import PREVIEW_ROWS, TextStyle, iter_html, iter_text, shown_rows
+from texable.views import GridView, Index, contiguous_runs, resolve_index
 
+if TYPE_CHECKING:
+    import numpy
+    import pandas
+    import pyarrow
 
-# Configure logging
-logger = logging.getLogger(__name__)
+    from texable.readers import Dialect, Dtypes
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a table's render cache."""
+
+    hits: int
+    misses: int
+
+
+class _RenderCacheEntry(NamedTuple):
+    key: tuple[int, ...]
+    rendered: "RenderedTable"
+    latex: str  # Full output of `to_latex`, including the preamble
+
+
+class RenderedTable(NamedTuple):
+    """The LaTeX code of a table together with the packages it requires."""
+
+    latex: str
+    """The `table` environment, without any preamble."""
+    packages: PackageSet
+    """The packages required to compile `latex`."""
 
 
 class Table:
@@ -58,6 +95,7 @@ class Table:
         >>> latex_code = table.to_latex()
     """
 
+    @measured("construct")
     def __init__(self, data: Sequence[Sequence[Any]]) -> None:
         """
         Initialize a Table object.
@@ -75,7 +113,17 @@ class Table:
         ):
             raise TypeError("Data must be a sequence of sequences (rows).")
 
-        self._grid = Grid(data)
+        self._init_from_grid(Grid(data))
+
+    @classmethod
+    def _from_grid(cls, grid: Grid) -> "Table":
+        """Create a Table around an existing Grid without copying its data."""
+        table = cls.__new__(cls)
+        table._init_from_grid(grid)
+        return table
+
+    def _init_from_grid(self, grid: Grid) -> None:
+        self._grid = grid
 
         num_rows = self._grid.num_rows
         num_columns = self._grid.num_cols
@@ -86,10 +134,31 @@ class Table:
 
         self._vertical_borders = VerticalBorders(num_columns + 1)
         self._horizontal_borders = HorizontalBorders(num_rows + 1)
+        self._spans = Spans()
 
         self._table_alignment: Alignment = Alignment.CENTER
         self._caption: Optional[str] = None
         self._label: Optional[str] = None
+        self._pagination = Pagination.NONE
+        self._rows_per_chunk = 50
+        self._packages = PackageSet()  # Packages required explicitly for this table
+
+        # Render cache, valid while `_state_key()` is unchanged
+        self._version = 0
+        self._render_cache: Optional[_RenderCacheEntry] = None
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+        # Compiled borders, column argument and spans, valid while their key is unchanged
+        self._layout: Optional[tuple[tuple[Any, ...], Layout]] = None
+        self._span_layout: Optional[tuple[tuple[int, ...], SpanLayout]] = None
+
+        # Rendered data rows kept between renders when `incremental` is on
+        self._incremental = False
+        self._row_cache: Optional[list[IndentedLines]] = None
+        self._row_cache_indent = ""
+        self._row_cache_spans: Optional[SpanLayout] = None
+        self._row_changes: Optional[RowChanges] = None
 
     @property
     def grid(self) -> Grid:
@@ -111,6 +180,611 @@ class Table:
         """
         return self._grid.rows
 
+    @property
+    def columns(self) -> Columns:
+        """
+        Get the columns of the table.
+
+        Formatters added to a column are stored once and applied to the whole
+        column in a single pass when the table is rendered.
+
+        Examples:
+            >>> from texable.formatters import bold
+            >>> table.columns[2].add_formatters(bold)
+
+        Returns:
+            Columns: The columns of the table.
+        """
+        return Columns(self._grid)
+
+    def add_formatters(
+        self,
+        *formatters: Callable[[str], str],
+        rows: Optional[Union[int, slice]] = None,
+        columns: Optional[Union[int, slice, Sequence[int]]] = None,
+    ) -> None:
+        """
+        Add formatters to a rectangular block of cells in one call.
+
+        Args:
+            *formatters (Callable[[str], str]): Formatters to apply.
+            rows (Optional[Union[int, slice]]): A row index or a contiguous slice
+                of rows. Defaults to all rows.
+            columns (Optional[Union[int, slice, Sequence[int]]]): A column index,
+                slice or sequence of column indices. Defaults to all columns.
+
+        Raises:
+            TypeError: If `rows` or `columns` has an unsupported type.
+            ValueError: If `rows` is a slice with a step other than 1.
+            IndexError: If an index is out of range.
+
+        Examples:
+            Make the first two columns of the first ten rows bold:
+            >>> table.add_formatters(bold, rows=slice(0, 10), columns=[0, 1])
+        """
+        if columns is None:
+            col_indexes = list(range(self.num_columns))
+        elif isinstance(columns, int):
+            col_indexes = [columns]
+        elif isinstance(columns, slice):
+            col_indexes = list(range(*columns.indices(self.num_columns)))
+        elif isinstance(columns, Sequence):
+            col_indexes = list(columns)
+        else:
+            raise TypeError(
+                f"Columns must be an integer, a slice or a sequence, got {type(columns).__name__}."
+            )
+
+        if rows is None:
+            for col in col_indexes:
+                self._grid.add_column_formatters(col, formatters)
+            return
+
+        if isinstance(rows, int):
+            if not 0 <= rows < self.num_rows:
+                raise IndexError("Row index out of range.")
+            row_range = range(rows, rows + 1)
+        elif isinstance(rows, slice):
+            row_range = range(*rows.indices(self.num_rows))
+        else:
+            raise TypeError(
+                f"Rows must be an integer or a slice, got {type(rows).__name__}."
+            )
+        self._grid.add_region_formatters(row_range, col_indexes, formatters)
+
+    def append_row(self, row: Sequence[Any]) -> None:
+        """
+        Append a row at the end of the table.
+
+        Args:
+            row (Sequence[Any]): The values of the row, one per column.
+
+        Raises:
+            TypeError: If the row is not a sequence, or the table is a view or
+                streamed from a file.
+            ValueError: If the row has the wrong number of values.
+        """
+        self.extend_rows([row])
+
+    def extend_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        """
+        Append rows at the end of the table.
+
+        Rows are consumed one at a time, so `rows` can be a generator, and
+        each takes amortized constant time. The new rows get the border
+        between the last two rows, if there is one. If a row is invalid, the
+        rows before it stay appended.
+
+        Examples:
+            >>> table.extend_rows(producer.rows())
+            >>> table.write_to_file("results.tex")
+
+        Args:
+            rows (Iterable[Sequence[Any]]): The rows to append.
+
+        Raises:
+            TypeError: If a row is not a sequence, or the table is a view or
+                streamed from a file.
+            ValueError: If a row has the wrong number of values.
+        """
+        start = self.num_rows
+        try:
+            self._grid.append_rows(rows)
+        finally:
+            self._add_row_borders(start, self.num_rows - start)
+
+    def insert_row(self, index: int, row: Sequence[Any]) -> None:
+        """
+        Insert a row before the row at `index`.
+
+        The rows after it move down together with their formatters and
+        borders.
+
+        Args:
+            index (int): Where to insert the row. Negative indices count from
+                the end, as for `list.insert`.
+            row (Sequence[Any]): The values of the row, one per column.
+
+        Raises:
+            TypeError: If the row is not a sequence, or the table is a view or
+                streamed from a file.
+            ValueError: If the row has the wrong number of values.
+            IndexError: If `index` is out of range.
+        """
+        if index < 0:
+            index += self.num_rows
+        self._grid.insert_rows(index, [row])
+        self._add_row_borders(index, 1)
+        self._spans._insert_rows(index, 1)
+
+    def delete_rows(self, rows: Index) -> None:
+        """
+        Delete rows together with their formatters and borders.
+
+        Merged cells lose the deleted rows; those left with a single cell
+        are unmerged.
+
+        Examples:
+            >>> table.delete_rows(slice(0, 10))
+            >>> table.delete_rows([3, 5, -1])
+
+        Args:
+            rows (Index): An index, a slice or a sequence of indices.
+
+        Raises:
+            TypeError: If the selection has an unsupported type, or the table
+                is a view or streamed from a file.
+            IndexError: If an index is out of range.
+        """
+        deleted = resolve_index(rows, self.num_rows)
+        self._grid.delete_rows(deleted)
+        for run in reversed(list(contiguous_runs(deleted))):
+            count = len(run)
+            self._horizontal_borders._delete(self._border_position(run.start, count), count)
+        self._spans._delete_rows(sorted(set(deleted)))
+
+    def _border_position(self, index: int, count: int = 0) -> int:
+        """
+        Return where in the horizontal borders the borders of `count` rows
+        added or deleted at `index` go.
+
+        These are the borders above the rows, except that the top border,
+        the border below the headers and the bottom border stay in place.
+        """
+        offset = 1 if self._headers.are_set else 0
+        position = index + offset if index > 0 else offset + 1
+        return min(position, len(self._horizontal_borders) - 1 - count)
+
+    def _add_row_borders(self, index: int, count: int) -> None:
+        if count <= 0:
+            return
+        # Continue the inner border of the row being moved down, of the rows
+        # above, or else the first inner border, which rows inserted first take
+        offset = 1 if self._headers.are_set else 0
+        last = len(self._horizontal_borders) - 1
+        border = ""
+        for slot in (index + offset, index - 1 + offset, index - 2 + offset, offset + 1):
+            if offset < slot < last:
+                border = self._horizontal_borders[slot]
+                break
+        else:
+            # With headers and no border between data rows, the rule below
+            # the headers is the only inner border
+            if offset and last > offset:
+                border = self._horizontal_borders[offset]
+        self._horizontal_borders._insert(self._border_position(index), count, border)
+
+    def merge(self, first_row: int, first_col: int, last_row: int, last_col: int) -> None:
+        """
+        Merge a block of cells into one, spanning several rows and/or columns.
+
+        The merged cell shows the value and formatting of its top-left cell;
+        the values of the other cells are kept but not shown. Merged columns
+        become a `\\multicolumn` and merged rows a `\\multirow`, which
+        requires the `multirow` package. Horizontal borders crossing merged
+        rows are drawn around them with `\\cline`.
+
+        Views, including sorted and filtered tables, do not keep merged cells.
+
+        Examples:
+            A header cell above two columns, and a label for three rows:
+            >>> table.merge(0, 1, 0, 2)
+            >>> table.merge(1, 0, 3, 0)
+
+        Args:
+            first_row (int): The row of the top-left cell.
+            first_col (int): The column of the top-left cell.
+            last_row (int): The row of the bottom-right cell, included.
+            last_col (int): The column of the bottom-right cell, included.
+                Negative indices count from the end.
+
+        Raises:
+            TypeError: If an index is not an integer.
+            IndexError: If an index is out of range.
+            ValueError: If the block is a single cell, is empty, or overlaps
+                cells already merged.
+        """
+        (first_row, last_row), (first_col, last_col) = (
+            resolve_index([first_row, last_row], self.num_rows),
+            resolve_index([first_col, last_col], self.num_columns),
+        )
+        if last_row < first_row or last_col < first_col:
+            raise ValueError("The last cell must not be above or left of the first cell.")
+        num_rows = last_row - first_row + 1
+        num_cols = last_col - first_col + 1
+        if num_rows * num_cols == 1:
+            raise ValueError("At least two cells must be merged.")
+        self._spans.add(Span(first_row, first_col, num_rows, num_cols))
+
+    def unmerge(self, row: int, col: int) -> None:
+        """
+        Split the merged cell covering a cell back into single cells.
+
+        Args:
+            row (int): The row of any cell of the merged cell.
+            col (int): The column of any cell of the merged cell.
+
+        Raises:
+            IndexError: If an index is out of range.
+            ValueError: If the cell is not merged.
+        """
+        (row,), (col,) = resolve_index(row, self.num_rows), resolve_index(col, self.num_columns)
+        span = self._spans.at(row, col)
+        if span is None:
+            raise ValueError(f"Cell ({row}, {col}) is not merged.")
+        self._spans.remove(span)
+
+    @property
+    def spans(self) -> list[Span]:
+        """
+        Get the merged cells, sorted by their top-left cell.
+
+        Returns:
+            list[Span]: The merged cells.
+        """
+        return list(self._spans)
+
+    def __getitem__(
+        self, index: Union[Index, tuple[Index, Union[Index, str, Sequence[str]]]]
+    ) -> "Table":
+        """
+        Return a view of some rows, or of some rows and columns, of the table.
+
+        See `select` for how views behave.
+
+        Examples:
+            The first hundred rows:
+            >>> top = table[:100]
+
+            Every other row of the first and third column:
+            >>> table[::2, [0, 2]]
+
+            A column selected by its header:
+            >>> table[:, "Name"]
+
+        Args:
+            index: A row selection, or a `(rows, columns)` tuple. Rows are
+                selected by an index, a slice or a sequence of indices;
+                columns also by header.
+
+        Returns:
+            Table: A view of the selected rows and columns.
+
+        Raises:
+            TypeError: If the index has an unsupported type.
+            IndexError: If an index is out of range.
+            ValueError: If no column has a given header.
+        """
+        if isinstance(index, tuple):
+            if len(index) != 2:
+                raise TypeError("Index a table with rows or with a (rows, columns) tuple.")
+            rows, columns = index
+            return self.select(columns, rows)
+        return self.select(rows=index)
+
+    def head(self, n: int = 5) -> "Table":
+        """
+        Return a view of the first `n` rows of the table.
+
+        Args:
+            n (int): The number of rows.
+
+        Raises:
+            ValueError: If `n` is negative.
+        """
+        if n < 0:
+            raise ValueError("The number of rows must be a non-negative integer.")
+        return self.select(rows=slice(0, n))
+
+    def tail(self, n: int = 5) -> "Table":
+        """
+        Return a view of the last `n` rows of the table.
+
+        Args:
+            n (int): The number of rows.
+
+        Raises:
+            ValueError: If `n` is negative.
+        """
+        if n < 0:
+            raise ValueError("The number of rows must be a non-negative integer.")
+        return self.select(rows=slice(max(self.num_rows - n, 0), None))
+
+    def select(
+        self,
+        columns: Optional[Union[Index, str, Sequence[str]]] = None,
+        rows: Optional[Index] = None,
+    ) -> "Table":
+        """
+        Return a view of some columns and rows of the table.
+
+        The view shares the data and formatting of this table; nothing is
+        copied per cell. It shows later changes to values and formatters of
+        this table, and changing values or formatters through the view
+        changes this table. Headers, alignments, borders and the other
+        settings of the table are copied and remapped to the selection, after
+        which they belong to the view. The label is not copied, since labels
+        must be unique within a document. Inserting or deleting rows of this
+        table leaves its views out of date, and using them afterwards raises
+        a ValueError; select again instead.
+
+        Examples:
+            >>> summary = table.select(columns=["Name", "Total"], rows=slice(0, 10))
+            >>> summary.caption = "Top ten"
+            >>> latex = summary.to_latex()
+
+        Args:
+            columns: The columns to show, in order: an index, a slice, a
+                header, or a sequence of indices and headers. Defaults to all
+                columns.
+            rows: The rows to show, in order: an index, a slice or a sequence
+                of indices. Defaults to all rows.
+
+        Returns:
+            Table: A view of the selected rows and columns.
+
+        Raises:
+            TypeError: If a selection has an unsupported type, or if the table
+                is streamed from a file and the rows are not a slice with a
+                step of 1.
+            IndexError: If an index is out of range.
+            ValueError: If no column has a given header, or if this table is
+                a view that is out of date.
+        """
+        if columns is None:
+            cols: Sequence[int] = range(self.num_columns)
+        else:
+            cols = self._column_indexes(columns)
+        row_indexes = range(self.num_rows) if rows is None else resolve_index(rows, self.num_rows)
+
+        view = Table._from_grid(GridView(self._grid, row_indexes, cols))
+        view._copy_settings(self, row_indexes, cols)
+        return view
+
+    def sort_by(
+        self,
+        column: Union[int, str],
+        reverse: bool = False,
+        key: Optional[Callable[[Any], Any]] = None,
+    ) -> "Table":
+        """
+        Return a view of the table with its rows sorted by the values of a column.
+
+        The sort is stable and compares the raw values, or their keys, directly.
+        Formatters and horizontal borders follow their rows; see `select` for
+        how views behave.
+
+        Examples:
+            >>> ranked = table.sort_by("Score", reverse=True)
+
+        Args:
+            column (Union[int, str]): The index or header of the column to sort by.
+            reverse (bool): Whether to sort in descending order.
+            key (Optional[Callable[[Any], Any]]): A function computing the sort
+                key of each value, as for `sorted`.
+
+        Returns:
+            Table: A view of all rows in sorted order.
+
+        Raises:
+            TypeError: If the values or keys cannot be compared, or if the
+                table is streamed from a file.
+            IndexError: If the column index is out of range.
+            ValueError: If no column has the given header.
+        """
+        keys = self._column_keys(column, key)
+        return self.select(rows=sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse))
+
+    def filter(self, column: Union[int, str], predicate: Callable[[Any], Any]) -> "Table":
+        """
+        Return a view of the rows whose value in a column satisfies a predicate.
+
+        Examples:
+            >>> passed = table.filter("Score", lambda score: score >= 50)
+
+        Args:
+            column (Union[int, str]): The index or header of the column to test.
+            predicate (Callable[[Any], Any]): Called with each value of the
+                column; rows for which it returns a true value are kept.
+
+        Returns:
+            Table: A view of the matching rows, in their original order.
+
+        Raises:
+            TypeError: If the table is streamed from a file.
+            IndexError: If the column index is out of range.
+            ValueError: If no column has the given header.
+        """
+        values = self._grid.iter_column_values(self._column_index(column))
+        return self.select(rows=list(compress(range(self.num_rows), map(predicate, values))))
+
+    def top_k(
+        self,
+        column: Union[int, str],
+        k: int,
+        key: Optional[Callable[[Any], Any]] = None,
+        largest: bool = True,
+    ) -> "Table":
+        """
+        Return a view of the `k` rows with the largest values in a column.
+
+        Only `k` rows are kept while scanning the column, which is much faster
+        than sorting the whole table when `k` is small.
+
+        Examples:
+            >>> podium = table.top_k("Score", 3)
+
+        Args:
+            column (Union[int, str]): The index or header of the column to rank by.
+            k (int): The number of rows.
+            key (Optional[Callable[[Any], Any]]): A function computing the
+                ranking key of each value.
+            largest (bool): Whether to keep the largest values, in descending
+                order, or the smallest values, in ascending order.
+
+        Returns:
+            Table: A view of the selected rows. Ties keep their original order.
+
+        Raises:
+            TypeError: If the values or keys cannot be compared, or if the
+                table is streamed from a file.
+            IndexError: If the column index is out of range.
+            ValueError: If `k` is negative, or if no column has the given header.
+        """
+        if k < 0:
+            raise ValueError("k must be a non-negative integer.")
+        keys = self._column_keys(column, key)
+        select = heapq.nlargest if largest else heapq.nsmallest
+        return self.select(rows=select(k, range(len(keys)), key=keys.__getitem__))
+
+    def group_by(self, column: Union[int, str], rules: bool = True) -> list[range]:
+        """
+        Collapse runs of equal values in a column into merged group labels.
+
+        The column is scanned once. Every run of two or more consecutive rows
+        with equal values is merged into a single `\\multirow` label, see
+        `merge`. Sort the table first, e.g. with `sort_by`, to bring equal
+        values together.
+
+        Examples:
+            >>> report = table.sort_by("Model")
+            >>> report.group_by("Model")
+
+        Args:
+            column (Union[int, str]): The index or header of the key column.
+            rules (bool): Whether to draw a horizontal border above every
+                group but the first. Borders inside a group are drawn around
+                its label with `\\cline`. With headers, a last group of a
+                single row gets no border above it, since that border is
+                also the bottom border.
+
+        Returns:
+            list[range]: The rows of every group, in order.
+
+        Raises:
+            IndexError: If the column index is out of range.
+            ValueError: If a group would overlap cells already merged, or if
+                no column has the given header.
+        """
+        col = self._column_index(column)
+        groups = []
+        start = 0
+        previous: Any = None
+        for i, value in enumerate(self._grid.iter_column_values(col)):
+            if i and value != previous:
+                groups.append(range(start, i))
+                start = i
+            previous = value
+        if self.num_rows:
+            groups.append(range(start, self.num_rows))
+
+        spans = [Span(rows.start, col, len(rows), 1) for rows in groups if len(rows) > 1]
+        if any(self._spans.overlapping(span) for span in spans):
+            raise ValueError("Groups cannot overlap cells already merged.")
+        for span in spans:
+            self._spans.add(span)
+        if rules:
+            offset = 1 if self._headers.are_set else 0
+            # With headers, the border above the last row is the bottom border
+            bottom = len(self._horizontal_borders) - 1
+            for rows in groups[1:]:
+                slot = rows.start + offset
+                if slot < bottom and not self._horizontal_borders[slot]:
+                    self._horizontal_borders.at(slot)
+        return groups
+
+    def _column_keys(
+        self, column: Union[int, str], key: Optional[Callable[[Any], Any]]
+    ) -> list[Any]:
+        values = self._grid.iter_column_values(self._column_index(column))
+        return list(values if key is None else map(key, values))
+
+    def _column_index(self, column: Union[int, str]) -> int:
+        if not isinstance(column, (int, str)):
+            raise TypeError(
+                f"Column must be an integer or a header, got {type(column).__name__}."
+            )
+        return self._column_indexes(column)[0]
+
+    def _column_indexes(self, columns: Union[Index, str, Sequence[str]]) -> Sequence[int]:
+        if isinstance(columns, str):
+            columns = [columns]
+        if isinstance(columns, (int, slice)):
+            return resolve_index(columns, self.num_columns)
+
+        names = self._headers.headers
+        indexes = []
+        for column in columns:
+            if isinstance(column, str):
+                if column not in names:
+                    raise ValueError(f"No column has the header {column!r}.")
+                column = names.index(column)
+            indexes.append(column)
+        return resolve_index(indexes, self.num_columns)
+
+    def _copy_settings(self, table: "Table", rows: Sequence[int], cols: Sequence[int]) -> None:
+        """Copy the settings of `table` to this view of its `rows` and `cols`."""
+        if table._headers.are_set:
+            self._headers[:] = [table._headers[j] for j in cols]
+        if list(cols) == list(range(table.num_columns)):
+            # Header groups only carry over when the columns stay the same
+            self._headers._groups = table._headers.groups
+            self._headers._group_rule = table._headers.group_rule
+        alignments = list(table._column_alignments)
+        self._column_alignments[:] = [alignments[j] for j in cols]
+
+        # Inner borders stay with the column or row after them, outer borders stay outside
+        vertical = table._vertical_borders.borders
+        self._vertical_borders._borders = (
+            [vertical[0]] + [vertical[j] for j in cols[1:]] + [vertical[-1]]
+        )
+        horizontal = table._horizontal_borders.borders
+        offset = 1 if table._headers.are_set else 0
+        selected = [""] * (len(rows) + 1)
+        # Borders between data rows, except the bottom one drawn above the last row with headers
+        inner = horizontal[offset + 1 : -1]
+        if len(set(inner)) <= 1:
+            # A uniform pattern stays uniform. Without borders between data
+            # rows to go by, the rule below the headers stands for them
+            fill = inner[0] if inner else horizontal[offset] if offset else ""
+            for p in range(1, len(rows)):
+                selected[p + offset] = fill
+        else:
+            for p in range(1, len(rows)):
+                selected[p + offset] = horizontal[rows[p] + offset] if rows[p] else ""
+        selected[0] = horizontal[0]
+        if offset and rows:
+            selected[1] = horizontal[1]
+        selected[-1] = horizontal[-1]
+        self._horizontal_borders._borders = selected
+
+        self._indent = table._indent
+        self._table_alignment = table._table_alignment
+        self._caption = table._caption
+        self._pagination = table._pagination
+        self._rows_per_chunk = table._rows_per_chunk
+        self._packages = PackageSet(table._packages)
+
     @property
     def headers(self) -> Headers:
         """
@@ -151,6 +825,7 @@ class Table:
     @caption.setter
     def caption(self, caption: str) -> None:
         self._caption = str(caption)
+        self._version += 1
 
     @property
     def label(self) -> Optional[str]:
@@ -165,6 +840,7 @@ class Table:
     @label.setter
     def label(self, label: str) -> None:
         self._label = str(label)
+        self._version += 1
 
     @property
     def indent(self) -> str:
@@ -181,6 +857,7 @@ class Table:
     @indent.setter
     def indent(self, indent: str) -> None:
         self._indent = str(indent)
+        self._version += 1
 
     @property
     def num_columns(self) -> int:
@@ -265,78 +942,567 @@ class Table:
     @table_alignment.setter
     def table_alignment(self, alignment: Alignment) -> None:
         self._table_alignment = alignment
+        self._version += 1
+
+    @property
+    def escape(self) -> bool:
+        """Get or set whether special LaTeX characters are escaped when rendering.
+
+        Characters such as `&`, `%`, `_` and `$` in cell values and headers
+        are replaced by their LaTeX escapes, column by column in a single
+        pass, before any formatters run. Escaping can also be disabled for
+        single columns (`table.columns[i].escape`) and cells
+        (`table.rows[i][j].escape`), e.g. for values that already are LaTeX.
+        Numbers rendered with a number format are never escaped.
+
+        Enabled by default.
+        """
+        return self._grid.escape
+
+    @escape.setter
+    def escape(self, escape: bool) -> None:
+        self._grid.escape = escape
+
+    @property
+    def pagination(self) -> Pagination:
+        """Get or set how the table is split across pages.
+
+        - `Pagination.NONE` emits a single `tabular` in a `table` float.
+        - `Pagination.LONGTABLE` emits a `longtable`, which repeats the
+          header row and the borders around it on every page and closes
+          every page with the bottom border. The label is only emitted
+          together with a caption. Requires the `longtable` package, which
+          is added to the preamble automatically.
+        - `Pagination.CHUNKS` emits one `table` float per `rows_per_chunk`
+          rows. Each chunk repeats the top border and header row and ends
+          with the bottom border; the caption and label go on the first chunk.
+
+        Rows are streamed chunk by chunk in every mode. The default is
+        `Pagination.NONE`.
+        """
+        return self._pagination
+
+    @pagination.setter
+    def pagination(self, pagination: Pagination) -> None:
+        if not isinstance(pagination, Pagination):
+            raise TypeError("Pagination must be a Pagination value.")
+        self._pagination = pagination
+        self._version += 1
+
+    @property
+    def rows_per_chunk(self) -> int:
+        """Get or set the number of data rows per chunk for `Pagination.CHUNKS`.
+
+        The default is 50.
+        """
+        return self._rows_per_chunk
+
+    @rows_per_chunk.setter
+    def rows_per_chunk(self, rows_per_chunk: int) -> None:
+        if not isinstance(rows_per_chunk, int) or rows_per_chunk <= 0:
+            raise ValueError("Rows per chunk must be a positive integer.")
+        self._rows_per_chunk = rows_per_chunk
+        self._version += 1
 
     def __str__(self) -> str:
-        # First, determine the number of columns
-        num_cols = self.grid.num_cols
-
-        # Flatten grid + headers into string values and find max width for each column
-        columns = [[] for _ in range(num_cols)]
-        if self._headers.are_set:
-            for i, header in enumerate(self._headers):
-                columns[i].append(str(header))
-        for row in self._grid:
-            for i, cell in enumerate(row):
-                columns[i].append(str(cell))
-        col_widths = [max(len(cell) for cell in col) for col in columns]
-
-        def format_row(row):
-            return " | ".join(
-                f"{str(cell):<{col_widths[i]}}" for i, cell in enumerate(row)
-            )
+        return self.to_text().strip()
+
+    def to_text(
+        self,
+        style: TextStyle = "plain",
+        head: Optional[int] = None,
+        tail: Optional[int] = None,
+    ) -> str:
+        """
+        Return a plain-text representation of the table with aligned columns.
 
-        result = ""
-        if self._headers.are_set:
-            result += format_row(self._headers) + "\n"
-        for row in self._grid:
-            result += format_row(row) + "\n"
+        Every shown value is converted to a string once. With `head` or `tail`,
+        only those rows are converted, so previewing a large table is cheap.
 
-        return result.strip()
+        Args:
+            style (TextStyle): "plain" separates columns with " | ", "markdown"
+                returns a Markdown table and "grid" draws borders around the
+                table and below the headers.
+            head (Optional[int]): Only show this many rows from the start.
+            tail (Optional[int]): Only show this many rows from the end. When
+                rows are left out, a row of "..." marks where, and a last line
+                tells how many rows were omitted.
 
-    def to_latex(self) -> str:
+        Returns:
+            str: The table as text, one line per row.
+
+        Raises:
+            ValueError: If the style is unknown or `head` or `tail` is negative.
         """
-        Return the LaTeX string representation of the table.
+        return "".join(self._iter_text(style, head, tail)).removesuffix("\n")
+
+    def write_text(
+        self,
+        stream: TextIO,
+        style: TextStyle = "plain",
+        head: Optional[int] = None,
+        tail: Optional[int] = None,
+    ) -> None:
+        """
+        Stream the plain-text representation of the table to a text stream.
+
+        The output is `to_text()` followed by a newline, written line by line.
+
+        Args:
+            stream (TextIO): A writable text stream, such as an open file.
+            style (TextStyle): See `to_text`.
+            head (Optional[int]): See `to_text`.
+            tail (Optional[int]): See `to_text`.
+
+        Raises:
+            ValueError: If the style is unknown or `head` or `tail` is negative.
+        """
+        for line in self._iter_text(style, head, tail):
+            stream.write(line)
+
+    def _iter_text(
+        self, style: TextStyle, head: Optional[int], tail: Optional[int]
+    ) -> Iterator[str]:
+        headers = self._headers if self._headers.are_set else None
+        return iter_text(self._grid, headers, style, head, tail)
+
+    def preview(
+        self,
+        n_head: int = PREVIEW_ROWS,
+        n_tail: int = PREVIEW_ROWS,
+        style: TextStyle = "plain",
+    ) -> str:
+        """
+        Return the first and last rows of the table as text.
+
+        Only the shown rows are converted and measured, so previewing takes
+        the same time for a table of any length.
+
+        Args:
+            n_head (int): Number of rows to show from the start.
+            n_tail (int): Number of rows to show from the end.
+            style (TextStyle): See `to_text`.
 
         Returns:
-            str: LaTeX code for the table.
+            str: The preview, ending with the number of omitted rows if any.
+
+        Raises:
+            ValueError: If the style is unknown or `n_head` or `n_tail` is negative.
         """
-        tabular_alignment = self._table_alignment.table() + "\n"
+        return self.to_text(style, n_head, n_tail)
+
+    def _repr_html_(self) -> str:
+        """Return an HTML preview of the table, used by Jupyter."""
+        headers = self._headers if self._headers.are_set else None
+        return "".join(iter_html(self._grid, headers, PREVIEW_ROWS, PREVIEW_ROWS))
+
+    def _repr_latex_(self) -> str:
+        """Return a preview of the table as a LaTeX tabular, used by Jupyter.
+
+        Unlike `to_latex`, only the first and last rows are rendered, and the
+        surrounding float, caption and preamble are left out.
+        """
+        shown, omitted = shown_rows(self._grid.num_rows, PREVIEW_ROWS, PREVIEW_ROWS)
+        layout = self._compiled_layout()
+        content = iter_preview_content(self._headers, self._grid, layout, shown, omitted)
+        return "".join(
+            iter_block(
+                name="tabular",
+                content=content,
+                indent=self._indent,
+                required_arg=[layout.column_arg],
+            )
+        )
+
+    @property
+    def incremental(self) -> bool:
+        """Get or set whether rendering only re-renders rows that changed.
+
+        When enabled, the LaTeX of every data row is kept after rendering.
+        Rendering again only redoes the rows whose values or cell formatters
+        changed since, which makes re-rendering a large table after a few
+        edits much cheaper at the cost of keeping the rows in memory. Column
+        formatters and number formats still re-render every row.
+
+        Disabled by default.
+        """
+        return self._incremental
+
+    @incremental.setter
+    def incremental(self, enabled: bool) -> None:
+        self._incremental = bool(enabled)
+        if not self._incremental:
+            self._row_cache = None
+            self._row_changes = None
+
+    def _indented_rows(self) -> Optional[list[IndentedLines]]:
+        """Return the data rows from the row cache, re-rendering changed rows first."""
+        if not self._incremental or not self._grid.cacheable:
+            return None
+
+        # Data rows sit inside the table and tabular blocks, or a longtable
+        depth = 1 if self._pagination is Pagination.LONGTABLE else 2
+        indent = self._indent * depth
+        changes = self._row_changes
+        spans = self._compiled_spans()
+        if (
+            self._row_cache is None
+            or changes is None
+            or changes.everything
+            or self._row_cache_indent != indent
+            or self._row_cache_spans is not spans
+            or len(self._row_cache) > self._grid.num_rows
+        ):
+            if changes is None:
+                changes = self._row_changes = self._grid.track_row_changes()
+            changes.reset()
+            self._row_cache = [
+                indent_lines(row, indent) for row in self._grid.iter_latex_rows(spans=spans)
+            ]
+            self._row_cache_indent = indent
+            self._row_cache_spans = spans
+        elif changes.rows:
+            # Appended rows are among the changed rows
+            self._row_cache.extend([IndentedLines()] * (self._grid.num_rows - len(self._row_cache)))
+            for i in changes.rows:
+                self._row_cache[i] = indent_lines(self._grid.render_row(i, spans), indent)
+            changes.reset()
+        return self._row_cache
+
+    def _compiled_layout(self) -> Layout:
+        """Return the compiled layout, compiling it again only after a change."""
+        column_types = self._grid.column_types()
+        key = (
+            self._headers._version,
+            self._horizontal_borders._version,
+            self._vertical_borders._version,
+            self._column_alignments._version,
+            self._spans._version,
+            self._grid.escape,
+            tuple(column_types.items()),
+        )
+        if self._layout is None or self._layout[0] != key:
+            layout = compile_layout(
+                self._headers,
+                self._horizontal_borders,
+                self._vertical_borders,
+                self._column_alignments,
+                column_types,
+                self._compiled_spans(),
+                self._grid.escape,
+            )
+            self._layout = (key, layout)
+        return self._layout[1]
+
+    def _compiled_spans(self) -> Optional[SpanLayout]:
+        """Return the compiled merged cells, or None if no cells are merged."""
+        if not self._spans:
+            return None
+        key = (
+            self._spans._version,
+            self._vertical_borders._version,
+            self._column_alignments._version,
+        )
+        if self._span_layout is None or self._span_layout[0] != key:
+            spans = SpanLayout(
+                self._spans,
+                self._vertical_borders.borders,
+                self._column_alignments.alignments,
+            )
+            self._span_layout = (key, spans)
+        return self._span_layout[1]
+
+    def _iter_table_block(self, cached_rows: bool = True) -> Iterator[str]:
+        indented_rows = self._indented_rows() if cached_rows else None
+        layout = self._compiled_layout()
+        head = make_head(self._headers, self._grid, layout)
+        bottom = layout.bottom
+        bodies = iter_body_chunks(
+            self._grid,
+            layout.row_borders,
+            self._rows_per_chunk if self._pagination is Pagination.CHUNKS else None,
+            indented_rows,
+            layout.spans,
+        )
+        column_arg = layout.column_arg
+
+        if self._pagination is Pagination.LONGTABLE:
+            return self._iter_longtable_block(head, next(bodies), bottom, column_arg)
 
-        tabular_content = make_tabular_content(
-            self._headers, self._grid, self._horizontal_borders
+        return chain.from_iterable(
+            self._iter_float_block(
+                chain([head], body, [bottom]), column_arg, with_caption=i == 0
+            )
+            for i, body in enumerate(bodies)
         )
-        tabular_block = make_block(
+
+    def _iter_float_block(
+        self, content: Iterable[str], column_arg: str, with_caption: bool
+    ) -> Iterator[str]:
+        tabular_alignment = self._table_alignment.table() + "\n"
+
+        tabular_block = iter_block(
             name="tabular",
-            content=tabular_content,
+            content=content,
             indent=self._indent,
-            required_arg=[
-                make_column_arg(self._vertical_borders, self._column_alignments)
-            ],
+            required_arg=[column_arg],
         )
 
-        caption = make_caption(self._caption) if self._caption else ""
-        label = make_label(self._label) if self._label else ""
-
-        final = ""
-        if required_packages:
-            final += "\n".join(str(pck) for pck in required_packages)
-            final += "\n"
-            final += "%" * 20 + "\n"
+        caption = make_caption(self._caption) if self._caption and with_caption else ""
+        label = make_label(self._label) if self._label and with_caption else ""
 
-        final += make_block(
+        return iter_block(
             name="table",
-            content=f"{tabular_alignment}{tabular_block}{caption}{label}",
+            content=chain([tabular_alignment], tabular_block, [caption, label]),
             indent=self._indent,
         )
-        return final
+
+    def _iter_longtable_block(
+        self, head: str, body: Iterable[str], bottom: str, column_arg: str
+    ) -> Iterator[str]:
+        preamble = []
+        if self._caption:
+            # The caption only goes on the first page, above the repeated head
+            label = f"\\label{{{self._label}}}" if self._label else ""
+            preamble += [f"\\caption{{{self._caption}}}{label} \\\\\n", head]
+            preamble.append("\\endfirsthead\n")
+        if head:
+            preamble += [head, "\\endhead\n"]
+        if bottom:
+            preamble += [bottom + "\n", "\\endfoot\n"]
+
+        return iter_block(
+            name="longtable",
+            content=chain(preamble, body),
+            indent=self._indent,
+            required_arg=[column_arg],
+            optional_arg=[self._table_alignment.column()],
+        )
+
+    def _collect_packages(self, packages: PackageSet) -> None:
+        """Add the packages this table requires to the active scope's `packages`."""
+        packages.update(self._packages)
+        if self._pagination is Pagination.LONGTABLE:
+            packages.add("longtable")
+        if self._spans.has_multirow:
+            packages.add("multirow")
+        if self._headers.are_set and self._headers._groups and self._headers.group_rule == "cmidrule":
+            packages.add("booktabs")
+        self._grid.require_packages()
+
+    def _iter_preamble(self, packages: PackageSet) -> Iterator[str]:
+        if packages:
+            for pck in packages:
+                yield str(pck) + "\n"
+            yield "%" * 20 + "\n"
+
+    def require_package(self, name: str, options: Optional[Iterable[str]] = None) -> None:
+        """
+        Require a LaTeX package whenever this table is rendered.
+
+        Packages needed by formatters are tracked automatically; use this for
+        anything else the table's content relies on.
+
+        Args:
+            name (str): The name of the package.
+            options (Optional[Iterable[str]]): Optional list of options for the package.
+        """
+        self._packages.add(name, options)
+        self._version += 1
+
+    @measured("render", remainder="layout")
+    def render(self) -> RenderedTable:
+        """
+        Render the table and collect the packages it requires.
+
+        Packages are collected in a `package_scope` of their own, so rendering
+        is safe to do concurrently from several threads or asyncio tasks, and
+        packages required by one table never show up in another.
+
+        Returns:
+            RenderedTable: The `table` environment, without preamble, and its packages.
+        """
+        latex, packages = self._render_cached().rendered
+        stats = current_stats()
+        if stats is not None:
+            stats.output_bytes += len(latex.encode("utf-8"))
+        return RenderedTable(latex, PackageSet(packages))
+
+    def _state_key(self) -> Optional[tuple[int, ...]]:
+        """Return a key that changes whenever the rendered output may change."""
+        if not self._grid.cacheable:
+            return None
+        return (
+            self._version,
+            self._grid.version,
+            self._headers._version,
+            self._column_alignments._version,
+            self._vertical_borders._version,
+            self._horizontal_borders._version,
+            self._spans._version,
+        )
+
+    def _render_cached(self) -> _RenderCacheEntry:
+        key = self._state_key()
+        cached = self._render_cache
+        if key is not None and cached is not None and cached.key == key:
+            self._cache_hits += 1
+            stats = current_stats()
+            if stats is not None:
+                stats.cache_hit = True
+            # Report the packages to any enclosing scope, as a real render would,
+            # but never to the global set, which a real render leaves alone
+            scope = _current_scope.get()
+            if scope is not None:
+                scope.update(cached.rendered.packages)
+            return cached
+
+        self._cache_misses += 1
+        with package_scope() as packages:
+            self._collect_packages(packages)
+            latex = "".join(self._iter_table_block())
+
+        entry = _RenderCacheEntry(
+            key,  # type: ignore[arg-type]
+            RenderedTable(latex, packages),
+            "".join(self._iter_preamble(packages)) + latex,
+        )
+        self._render_cache = entry if key is not None else None
+        return entry
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Get the hit and miss counts of the render cache.
+
+        `to_latex`, `render` and `write_to` reuse the previous output as long
+        as nothing about the table changed through its API. Changes made
+        behind the table's back, such as writing to an adopted NumPy array or
+        mutating a formatter object, are not detected; call `clear_cache`
+        after making them.
+
+        Returns:
+            CacheInfo: The number of cache hits and misses.
+        """
+        return CacheInfo(self._cache_hits, self._cache_misses)
+
+    def clear_cache(self) -> None:
+        """
+        Drop the cached render output, forcing the next render to start afresh.
+        """
+        self._render_cache = None
+
+    @measured("to_latex", remainder="layout")
+    def to_latex(self) -> str:
+        """
+        Return the LaTeX string representation of the table.
+
+        The output starts with a `\\usepackage` line for every package this
+        table requires, if any.
+
+        Returns:
+            str: LaTeX code for the table.
+        """
+        latex = self._render_cached().latex
+        stats = current_stats()
+        if stats is not None:
+            stats.output_bytes += len(latex.encode("utf-8"))
+        return latex
+
+    def iter_latex(self) -> Iterator[str]:
+        """
+        Yield the LaTeX representation of the table line by line.
+
+        The output is identical to `to_latex()`, but rows are rendered one at a
+        time so memory use does not grow with the size of the table. The
+        preamble comes first, so when a formatter does not declare its packages
+        with `texable.packages.requires` (as the built-in formatters do), the
+        table is rendered once beforehand to find them.
+
+        Yields:
+            str: Consecutive lines of LaTeX code, each ending with a newline.
+        """
+        # The scope is closed before the first yield, so it never spans
+        # resumptions of the generator from different contexts.
+        with package_scope() as packages:
+            self._collect_packages(packages)
+            declared = self._grid.packages_declared()
+            if not declared:
+                for _ in self._iter_table_block(cached_rows=False):
+                    pass
+        yield from self._iter_preamble(packages)
+        # Cached rows come in multi-line chunks, so render them one by one
+        lines = self._iter_table_block(cached_rows=False)
+        if declared:
+            yield from lines
+            return
+        # Formatters require their packages again; keep them out of the caller's scope
+        while True:
+            with package_scope(propagate=False):
+                line = next(lines, None)
+            if line is None:
+                return
+            yield line
+
+    @measured("write_to", remainder="layout")
+    def write_to(self, stream: TextIO) -> None:
+        """
+        Stream the LaTeX representation of the table to a text stream.
+
+        Args:
+            stream (TextIO): A writable text stream, such as an open file.
+        """
+        lines: Iterable[str]
+        if self._render_cache is not None and self._render_cache.key == self._state_key():
+            lines = [self._render_cached().latex]
+        else:
+            lines = self.iter_latex()
+
+        stats = current_stats()
+        if stats is None:
+            for line in lines:
+                stream.write(line)
+            return
+        for line in lines:
+            started = time.perf_counter()
+            stream.write(line)
+            stats.add_time("write", time.perf_counter() - started)
+            stats.output_bytes += len(line.encode("utf-8"))
 
     @classmethod
-    def from_file(cls, file_path: str) -> "Table":
+    @measured("from_file")
+    def from_file(
+        cls,
+        file_path: str,
+        *,
+        encoding: Optional[str] = None,
+        dialect: Optional["Dialect"] = None,
+        has_header: bool = False,
+        max_rows: Optional[int] = None,
+        dtypes: Optional["Dtypes"] = None,
+        infer_dtypes: bool = False,
+        stream: bool = False,
+    ) -> "Table":
         """
         Create a Table object from a CSV or TSV file.
 
+        The file is read and validated in chunks that are appended straight to
+        the table's column storage, so it is never held as a list of rows.
+
         Args:
             file_path (str): Path to a CSV (.csv) or TSV (.tsv) file.
+            encoding (Optional[str]): Text encoding of the file.
+            dialect (Optional[Dialect]): A `csv` dialect (name, class or instance)
+                to use instead of the delimiter implied by the file extension.
+            has_header (bool): Use the first row as the table headers.
+            max_rows (Optional[int]): Read at most this many data rows.
+            dtypes (Optional[Dtypes]): Converters such as `int` or `float`, either
+                one per column or a mapping from column index to converter.
+            infer_dtypes (bool): Convert columns whose values are all integers
+                or all floats to that type. Explicit `dtypes` take precedence.
+            stream (bool): Do not load the data at all. The file is scanned once
+                up front and read again, chunk by chunk, every time the table
+                is rendered, e.g. with `write_to_file`. Rows of a streamed table
+                cannot be accessed or modified.
 
         Returns:
             Table: A new Table instance with data loaded from the file.
@@ -348,6 +1514,8 @@ class Table:
         """
         import os
 
+        from texable.readers import DelimitedFile, StreamedGrid, read_columns
+
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"The file {file_path} does not exist.")
 
@@ -361,15 +1529,128 @@ class Table:
                     "Unsupported file format. Only .csv and .tsv files are supported."
                 )
 
-        # Read the file and create a Table instance
-        with open(file_path, "r") as file:
-            import csv
+        source = DelimitedFile(
+            file_path,
+            delimiter=delimiter,
+            encoding=encoding,
+            dialect=dialect,
+            max_rows=max_rows,
+            has_header=has_header,
+        )
+        if stream:
+            streamed = StreamedGrid(source, dtypes, infer_dtypes)
+            header, grid = streamed.header, streamed
+        else:
+            header, columns = read_columns(source, dtypes, infer_dtypes)
+            grid = Grid.from_columns(columns)
+
+        table = cls._from_grid(grid)
+        if header:
+            table.headers = header
+        return table
+
+    @classmethod
+    @measured("from_dataframe")
+    def from_dataframe(
+        cls,
+        df: "pandas.DataFrame",
+        index: bool = False,
+        copy: bool = False,
+        missing: str = "",
+    ) -> "Table":
+        """
+        Create a Table object from a pandas DataFrame.
+
+        Column buffers are shared with the DataFrame where pandas allows it, so
+        no row-of-lists conversion takes place. Headers are taken from the column
+        names and numeric columns are right-aligned. Datetimes are shown as ISO
+        8601 strings.
+
+        Args:
+            df (pandas.DataFrame): The DataFrame to convert.
+            index (bool): Include the index as the first column.
+            copy (bool): Copy the data instead of sharing it. Without a copy,
+                changing a cell value may also change the DataFrame.
+            missing (str): The cell content for missing values in text and
+                datetime columns. Defaults to an empty cell.
+
+        Returns:
+            Table: A new Table instance backed by the DataFrame's columns.
+        """
+        from texable import interop
 
-            reader = csv.reader(file, delimiter=delimiter)
-            data = list(reader)
+        grid, headers, alignments = interop.from_dataframe(
+            df, index=index, copy=copy, missing=missing
+        )
+        table = cls._from_grid(grid)
+        table.headers = headers
+        table.column_alignments = alignments
+        return table
+
+    @classmethod
+    @measured("from_ndarray")
+    def from_ndarray(
+        cls,
+        array: "numpy.ndarray",
+        headers: Optional[Sequence[str]] = None,
+        copy: bool = False,
+        missing: str = "",
+    ) -> "Table":
+        """
+        Create a Table object from a two-dimensional NumPy array.
+
+        Each column is a view of the array, so no data is copied. Numeric
+        arrays are right-aligned and datetimes are shown as ISO 8601 strings.
+
+        Args:
+            array (numpy.ndarray): A two-dimensional array.
+            headers (Optional[Sequence[str]]): Optional column headers.
+            copy (bool): Copy the data instead of sharing it with `array`.
+            missing (str): The cell content for missing values in object and
+                datetime arrays. Defaults to an empty cell.
+
+        Returns:
+            Table: A new Table instance backed by the array.
+
+        Raises:
+            ValueError: If the array is not two-dimensional.
+        """
+        from texable import interop
+
+        grid, alignments = interop.from_ndarray(array, copy=copy, missing=missing)
+        table = cls._from_grid(grid)
+        if headers is not None:
+            table.headers = headers
+        table.column_alignments = alignments
+        return table
+
+    @classmethod
+    @measured("from_arrow")
+    def from_arrow(cls, data: "pyarrow.Table", missing: str = "") -> "Table":
+        """
+        Create a Table object from a pyarrow Table or RecordBatch.
+
+        Primitive columns without nulls are adopted without copying. Headers are
+        taken from the schema and numeric columns are right-aligned. Dates and
+        timestamps are shown as ISO 8601 strings.
+
+        Args:
+            data (pyarrow.Table | pyarrow.RecordBatch): The Arrow data to convert.
+            missing (str): The cell content for null values. Defaults to an
+                empty cell.
+
+        Returns:
+            Table: A new Table instance backed by the Arrow columns.
+        """
+        from texable import interop
 
-        return cls(data)
+        grid, headers, alignments = interop.from_arrow(data, missing=missing)
+        table = cls._from_grid(grid)
+        table.headers = headers
+        table.column_alignments = alignments
+        return table
 
+    @measured("write_to_file", remainder="layout")
     def write_to_file(self, file_path: str) -> None:
         """
         Write the LaTeX representation of the table to a file.
@@ -377,8 +1658,22 @@ class Table:
         Args:
             file_path (str): Destination file path.
         """
-        with open(file_path, "w") as file:
-            file.write(self.to_latex())
+        with timed("write"):
+            file = open(file_path, "w")
+        try:
+            self.write_to(file)
+        finally:
+            with timed("write"):
+                file.close()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Cached output is cheap to recreate and not worth pickling
+        state = self.__dict__.copy()
+        state["_render_cache"] = None
+        state["_row_cache"] = None
+        state["_row_changes"] = None
+        state["_row_cache_spans"] = None
+        return state
 
     def __repr__(self) -> str:
         """
@@ -0,0 +1,177 @@
+import html
+from typing import TYPE_CHECKING, Iterator, Literal, Optional, Sequence
+
+if TYPE_CHECKING:
+    from texable.grid import Grid
+
+TextStyle = Literal["plain", "markdown", "grid"]
+
+_ELLIPSIS = "..."
+
+# Rows shown from the start and from the end of a table by previews
+PREVIEW_ROWS = 5
+
+
+def shown_rows(
+    num_rows: int, head: Optional[int], tail: Optional[int]
+) -> tuple[list[range], int]:
+    """
+    Work out which rows a preview shows.
+
+    Args:
+        num_rows (int): The number of rows of the table.
+        head (Optional[int]): Number of rows to show from the start.
+        tail (Optional[int]): Number of rows to show from the end.
+
+    Returns:
+        tuple[list[range], int]: The ranges of shown rows, and the number of
+            rows omitted between them. With neither `head` nor `tail`, every
+            row is shown.
+
+    Raises:
+        ValueError: If `head` or `tail` is negative.
+    """
+    if head is None and tail is None:
+        return [range(num_rows)], 0
+    head, tail = head or 0, tail or 0
+    if head < 0 or tail < 0:
+        raise ValueError("head and tail must be non-negative integers.")
+    if head + tail >= num_rows:
+        return [range(num_rows)], 0
+    return [range(head), range(num_rows - tail, num_rows)], num_rows - head - tail
+
+
+def stringify_rows(grid: "Grid", rows: range) -> list[list[str]]:
+    """Return the values of a range of rows, converted with `str`, column by column."""
+    columns: list[list[str]] = [[] for _ in range(grid.num_cols)]
+    for _, chunk in grid._iter_column_chunks(first=rows.start, stop=rows.stop):
+        for column, values in zip(columns, chunk):
+            column.extend(map(str, values))
+    return columns
+
+
+def _line_template(style: TextStyle, widths: list[int]) -> str:
+    cells = [f"{{:<{width}}}" for width in widths]
+    if style == "plain":
+        return " | ".join(cells) + "\n"
+    return "| " + " | ".join(cells) + " |\n"
+
+
+def iter_text(
+    grid: "Grid",
+    headers: Optional[Sequence[str]] = None,
+    style: TextStyle = "plain",
+    head: Optional[int] = None,
+    tail: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    Yield a plain-text rendering of a grid line by line.
+
+    Each shown value is converted with `str` once. The column widths are
+    tracked while converting, after which the lines are streamed out.
+
+    Args:
+        grid (Grid): The grid to render.
+        headers (Optional[Sequence[str]]): Optional header row.
+        style (TextStyle): "plain" separates columns with " | ", "markdown"
+            emits a Markdown table and "grid" draws borders around the table
+            and below the headers.
+        head (Optional[int]): Only show this many rows from the start.
+        tail (Optional[int]): Only show this many rows from the end. When rows
+            are left out, a row of "..." marks where, and a last line tells
+            how many rows were omitted.
+
+    Yields:
+        str: Consecutive lines, each ending with a newline.
+
+    Raises:
+        ValueError: If the style is unknown or `head` or `tail` is negative.
+    """
+    if style not in ("plain", "markdown", "grid"):
+        raise ValueError(f"Unknown text style: {style!r}.")
+
+    ranges, omitted = shown_rows(grid.num_rows, head, tail)
+    blocks = [stringify_rows(grid, rows) for rows in ranges]
+    header_texts = [str(header) for header in headers] if headers is not None else None
+    if style == "markdown":
+        # Pipes would end the cell early
+        blocks = [
+            [[text.replace("|", "\\|") for text in column] for column in block]
+            for block in blocks
+        ]
+        if header_texts is None:
+            header_texts = [""] * grid.num_cols
+        header_texts = [text.replace("|", "\\|") for text in header_texts]
+
+    widths = [3 if style == "markdown" or omitted else 0] * grid.num_cols
+    for block in blocks:
+        for j, column in enumerate(block):
+            widths[j] = max(widths[j], max(map(len, column), default=0))
+    if header_texts is not None:
+        for j, text in enumerate(header_texts):
+            widths[j] = max(widths[j], len(text))
+
+    template = _line_template(style, widths)
+    rule = "+" + "+".join("-" * (width + 2) for width in widths) + "+\n"
+
+    if style == "grid":
+        yield rule
+    if header_texts is not None:
+        yield template.format(*header_texts)
+        if style == "markdown":
+            yield "| " + " | ".join("-" * width for width in widths) + " |\n"
+        elif style == "grid":
+            yield rule.replace("-", "=")
+
+    for k, block in enumerate(blocks):
+        if k:
+            yield template.format(*[_ELLIPSIS] * grid.num_cols)
+        for texts in zip(*block):
+            yield template.format(*texts)
+
+    if style == "grid":
+        yield rule
+    if omitted:
+        yield f"({omitted} rows omitted)\n"
+
+
+def iter_html(
+    grid: "Grid",
+    headers: Optional[Sequence[str]] = None,
+    head: Optional[int] = None,
+    tail: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    Yield an HTML table of a grid line by line.
+
+    Values are converted with `str` and escaped for HTML; formatters are not
+    applied. `head` and `tail` work as in `iter_text`.
+
+    Args:
+        grid (Grid): The grid to render.
+        headers (Optional[Sequence[str]]): Optional header row.
+        head (Optional[int]): Only show this many rows from the start.
+        tail (Optional[int]): Only show this many rows from the end.
+
+    Yields:
+        str: Consecutive lines of HTML, each ending with a newline.
+
+    Raises:
+        ValueError: If `head` or `tail` is negative.
+    """
+    ranges, omitted = shown_rows(grid.num_rows, head, tail)
+    yield "<table>\n"
+    if headers is not None:
+        cells = "".join(f"<th>{html.escape(str(header))}</th>" for header in headers)
+        yield f"<thead><tr>{cells}</tr></thead>\n"
+    yield "<tbody>\n"
+    for k, rows in enumerate(ranges):
+        if k:
+            yield "<tr>" + f"<td>{_ELLIPSIS}</td>" * grid.num_cols + "</tr>\n"
+        for texts in zip(*stringify_rows(grid, rows)):
+            cells = "".join(f"<td>{html.escape(text)}</td>" for text in texts)
+            yield f"<tr>{cells}</tr>\n"
+    yield "</tbody>\n"
+    yield "</table>\n"
+    if omitted:
+        yield f"<p>({omitted} rows omitted)</p>\n"
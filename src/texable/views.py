@@ -0,0 +1,343 @@
+import operator
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, Union
+
+from texable.grid import CHUNK_SIZE, Grid, RowChanges
+from texable.number_format import NumberFormat
+from texable.rules import Rule
+
+Index = Union[int, slice, Iterable[int]]
+
+
+def resolve_index(index: Index, length: int) -> Sequence[int]:
+    """
+    Returns the positions selected by an index, a slice or an iterable of indices.
+
+    Negative indices count from the end, as for lists.
+
+    Args:
+        index (Index): The selection.
+        length (int): The length of the selected sequence.
+
+    Returns:
+        Sequence[int]: A range for an integer or a slice, else a list.
+
+    Raises:
+        TypeError: If the index has an unsupported type.
+        IndexError: If an index is out of range.
+    """
+    if isinstance(index, slice):
+        return range(*index.indices(length))
+    if isinstance(index, (str, bytes)) or not isinstance(index, (int, Iterable)):
+        raise TypeError(
+            f"Index must be an integer, a slice or a sequence of integers, got {type(index).__name__}."
+        )
+    single = not isinstance(index, Iterable)
+    positions = []
+    for i in [index] if single else index:  # type: ignore[list-item]
+        i = operator.index(i)
+        if i < 0:
+            i += length
+        if not 0 <= i < length:
+            raise IndexError("Index out of range.")
+        positions.append(i)
+    if single:
+        return range(positions[0], positions[0] + 1)
+    return positions
+
+
+def is_contiguous(rows: Sequence[int]) -> bool:
+    """Return whether `rows` is a range with a step of 1."""
+    return isinstance(rows, range) and rows.step == 1
+
+
+def _compose(outer: Sequence[int], inner: Sequence[int]) -> Sequence[int]:
+    """Return `outer[i]` for every `i` in `inner`, as a range if possible."""
+    if isinstance(outer, range) and isinstance(inner, range):
+        return range(
+            outer.start + inner.start * outer.step,
+            outer.start + inner.stop * outer.step,
+            inner.step * outer.step,
+        )
+    return [outer[i] for i in inner]
+
+
+def contiguous_runs(rows: Iterable[int]) -> Iterator[range]:
+    """Split a set of rows into contiguous ranges."""
+    first = last = None
+    for i in sorted(set(rows)):
+        if last is not None and i == last + 1:
+            last = i
+            continue
+        if last is not None:
+            yield range(first, last + 1)  # type: ignore[arg-type]
+        first = last = i
+    if last is not None:
+        yield range(first, last + 1)  # type: ignore[arg-type]
+
+
+class _ViewRowChanges(RowChanges):
+    """
+    A collector registered with the underlying grid of a view, which records
+    the changed rows as row indices of the view.
+    """
+
+    __slots__ = ("_view",)
+
+    def __init__(self, view: "GridView") -> None:
+        super().__init__()
+        self._view = view
+
+    def _record(self, rows: Iterable[int]) -> None:
+        self.rows.update(self._view._view_rows(rows))
+
+
+class GridView(Grid):
+    """
+    A selection of rows and columns of another grid.
+
+    The view holds no values or formatting of its own. Reading values and
+    rendering go to the underlying grid, so the view shows every later change
+    to it; changing values or formatting through the view changes the
+    underlying grid. Inserting or deleting rows of the underlying grid moves
+    the rows the view selects, so the view is out of date afterwards.
+    """
+
+    def __init__(self, base: Grid, rows: Sequence[int], cols: Sequence[int]) -> None:
+        """
+        Initializes a GridView.
+
+        Args:
+            base (Grid): The grid to select from. A view of a view selects
+                from the grid underlying both.
+            rows (Sequence[int]): The rows of `base` to show, in order, such
+                as a range or a list of indices.
+            cols (Sequence[int]): The columns of `base` to show, in order.
+
+        Raises:
+            TypeError: If `base` is read sequentially and `rows` is not a
+                range with a step of 1.
+        """
+        if isinstance(base, GridView):
+            base._check_current()
+            rows = _compose(base._rows, rows)
+            cols = [base._cols[j] for j in cols]
+            base = base._base
+        if not base.random_access and not is_contiguous(rows):
+            raise TypeError("Only a contiguous slice of rows of a streamed grid can be selected.")
+
+        self._base = base
+        self._rows = rows
+        self._cols = list(cols)
+        self._num_rows = len(rows)
+        self._num_cols = len(self._cols)
+        self._structure_version = base._structure_version
+        # Underlying row -> rows of the view, built when first needed
+        self._row_positions: Optional[dict[int, list[int]]] = None
+
+    @property
+    def base(self) -> Grid:
+        """
+        Returns the grid the view selects from.
+        """
+        return self._base
+
+    @property
+    def version(self) -> int:
+        return self._base.version
+
+    @property
+    def cacheable(self) -> bool:
+        return self._base.cacheable
+
+    @property
+    def random_access(self) -> bool:
+        return self._base.random_access
+
+    def track_row_changes(self) -> RowChanges:
+        changes = _ViewRowChanges(self)
+        self._base._row_changes.add(changes)
+        return changes
+
+    def _view_rows(self, rows: Iterable[int]) -> list[int]:
+        """Return the rows of the view showing any of the given underlying rows."""
+        if is_contiguous(self._rows):
+            first, stop = self._rows.start, self._rows.stop  # type: ignore[attr-defined]
+            return [i - first for i in rows if first <= i < stop]
+        if self._row_positions is None:
+            self._row_positions = {}
+            for p, i in enumerate(self._rows):
+                self._row_positions.setdefault(i, []).append(p)
+        return [p for i in rows for p in self._row_positions.get(i, ())]
+
+    def _check_current(self) -> None:
+        """Raise a ValueError if rows of the underlying grid moved since the view was made."""
+        if self._structure_version != self._base._structure_version:
+            raise ValueError(
+                "The view is out of date: rows were inserted into or deleted from "
+                "its table after it was made."
+            )
+
+    def _base_row(self, row: int) -> int:
+        self._check_current()
+        if not 0 <= row < self._num_rows:
+            raise IndexError("Row index out of range.")
+        return self._rows[row]
+
+    def _base_col(self, col: int) -> int:
+        if not 0 <= col < self._num_cols:
+            raise IndexError("Column index out of range.")
+        return self._cols[col]
+
+    def _value(self, row: int, col: int) -> Any:
+        self._check_current()
+        return self._base._value(self._rows[row], self._cols[col])
+
+    def _set_value(self, row: int, col: int, value: Any) -> None:
+        self._base._set_value(self._base_row(row), self._base_col(col), value)
+
+    def append_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        raise TypeError("Rows cannot be added to a view; add them to its table.")
+
+    def insert_rows(self, index: int, rows: Iterable[Sequence[Any]]) -> None:
+        raise TypeError("Rows cannot be added to a view; add them to its table.")
+
+    def delete_rows(self, rows: Iterable[int]) -> None:
+        raise TypeError("Rows cannot be deleted from a view; delete them from its table.")
+
+    def _cell_formatters(self, row: int, col: int) -> Sequence[Callable[[str], str]]:
+        self._check_current()
+        return self._base._cell_formatters(self._rows[row], self._cols[col])
+
+    def _add_cell_formatters(
+        self, row: int, col: int, formatters: Sequence[Callable[[str], str]]
+    ) -> None:
+        self._base._add_cell_formatters(
+            self._base_row(row), self._base_col(col), formatters
+        )
+
+    def add_column_formatters(
+        self, col: int, formatters: Sequence[Callable[[str], str]]
+    ) -> None:
+        self._check_current()
+        base_col = self._base_col(col)
+        if self._rows == range(self._base.num_rows):
+            self._base.add_column_formatters(base_col, formatters)
+        else:
+            self.add_region_formatters(range(self._num_rows), [col], formatters)
+
+    def add_region_formatters(
+        self,
+        rows: range,
+        cols: Sequence[int],
+        formatters: Sequence[Callable[[str], str]],
+    ) -> None:
+        """
+        Adds formatters to a rectangular region of the view.
+
+        The underlying grid gets one region per contiguous run of its rows
+        that the region covers.
+        """
+        self._check_current()
+        if rows.step != 1:
+            raise ValueError("Region rows must be a contiguous range.")
+        base_cols = [self._base_col(col) for col in cols]
+        for run in contiguous_runs(_compose(self._rows, rows)):
+            self._base.add_region_formatters(run, base_cols, formatters)
+
+    def column_rules(self, col: int) -> list[Rule]:
+        return self._base.column_rules(self._base_col(col))
+
+    def add_column_rules(self, col: int, rules: Sequence[Rule]) -> None:
+        """
+        Adds conditional formatting rules to a column of the underlying grid.
+
+        The rules are evaluated on the whole column of the underlying grid,
+        not only on the rows of the view.
+        """
+        self._base.add_column_rules(self._base_col(col), rules)
+
+    def clear_column_rules(self, col: int) -> None:
+        self._base.clear_column_rules(self._base_col(col))
+
+    def _refresh_rules(self) -> None:
+        self._base._refresh_rules()
+
+    def number_format(self, col: int) -> Optional[NumberFormat]:
+        return self._base.number_format(self._base_col(col))
+
+    def set_number_format(self, col: int, number_format: Optional[NumberFormat]) -> None:
+        self._base.set_number_format(self._base_col(col), number_format)
+
+    @property
+    def escape(self) -> bool:
+        return self._base.escape
+
+    @escape.setter
+    def escape(self, escape: bool) -> None:
+        self._base.escape = escape
+
+    def column_escaped(self, col: int) -> bool:
+        return self._base.column_escaped(self._base_col(col))
+
+    def set_column_escaped(self, col: int, escape: bool) -> None:
+        self._base.set_column_escaped(self._base_col(col), escape)
+
+    def unescaped_columns(self) -> set[int]:
+        unescaped = self._base.unescaped_columns()
+        return {k for k, j in enumerate(self._cols) if j in unescaped}
+
+    def _cell_escaped(self, row: int, col: int) -> bool:
+        self._check_current()
+        return self._base._cell_escaped(self._rows[row], self._cols[col])
+
+    def _set_cell_escaped(self, row: int, col: int, escape: bool) -> None:
+        self._base._set_cell_escaped(self._base_row(row), self._base_col(col), escape)
+
+    def column_types(self) -> dict[int, str]:
+        column_types = self._base.column_types()
+        return {k: column_types[j] for k, j in enumerate(self._cols) if j in column_types}
+
+    def require_packages(self) -> None:
+        self._base.require_packages()
+
+    def packages_declared(self) -> bool:
+        return self._base.packages_declared()
+
+    def iter_column_values(self, col: int) -> Iterator[Any]:
+        if not 0 <= col < self._num_cols:
+            raise IndexError("Column index out of range.")
+        for _, columns in self._iter_column_chunks():
+            yield from columns[col]
+
+    def _iter_column_chunks(
+        self, chunk_size: int = CHUNK_SIZE, first: int = 0, stop: Optional[int] = None
+    ) -> Iterator[tuple[int, list[list[Any]]]]:
+        self._check_current()
+        if self._base.random_access:
+            yield from super()._iter_column_chunks(chunk_size, first, stop)
+            return
+        # Sequential grids are read through, skipping the rows before the view
+        offset = self._rows.start  # type: ignore[attr-defined]
+        stop = self._num_rows if stop is None else min(stop, self._num_rows)
+        chunks = self._base._iter_column_chunks(chunk_size, offset + first, offset + stop)
+        for start, columns in chunks:
+            yield start - offset, [columns[j] for j in self._cols]
+
+    def _take(self, rows: Sequence[int], cols: Sequence[int]) -> list[list[Any]]:
+        self._check_current()
+        if not self._base.random_access:
+            raise TypeError("Rows of a streamed grid cannot be read out of order.")
+        return self._base._take(
+            _compose(self._rows, rows), [self._cols[j] for j in cols]
+        )
+
+    def _render_chunk(self, start: int, columns: list[list[Any]]) -> list[list[str]]:
+        self._check_current()
+        rows = _compose(self._rows, range(start, start + len(columns[0])))
+        return self._base._render_cells(rows, self._cols, columns)
+
+    def __getstate__(self) -> dict[str, Any]:
+        return self.__dict__.copy()
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
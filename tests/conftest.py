@@ -0,0 +1,26 @@
+import pytest
+
+from texable import Table
+from texable.packages import required_packages
+
+
+@pytest.fixture(autouse=True)
+def restore_required_packages():
+    saved = set(required_packages)
+    yield
+    required_packages.clear()
+    required_packages.update(saved)
+
+
+@pytest.fixture
+def bordered_table():
+    """Return a function building a two-column table with horizontal borders of a style."""
+
+    def build(rows, style, with_headers) -> Table:
+        table = Table([list(row) for row in rows])
+        if with_headers:
+            table.headers = ["n", "name"]
+        getattr(table.horizontal_borders, style)()
+        return table
+
+    return build
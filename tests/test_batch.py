@@ -0,0 +1,59 @@
+import pytest
+
+from texable import Table, render_many, write_many
+from texable.formatters import bold, cell_color, text_color
+from texable.packages import required_packages
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_render_many_preserves_order(workers):
+    tables = [Table([[i, i * 2], [i * 3, "x"]]) for i in range(6)]
+    for i, table in enumerate(tables):
+        table.caption = f"Table {i}"
+        table.columns[0].add_formatters(bold)
+    tables[1].rows[0][1].add_formatters(text_color("red"))
+    tables[4].rows[1][1].add_formatters(cell_color("blue"))
+
+    results = render_many(tables, workers=workers)
+
+    assert len(results) == 6
+    assert all(f"\\caption{{Table {i}}}" in latex for i, latex in enumerate(results))
+    assert "\\usepackage" not in results[0]
+    assert "\\usepackage{xcolor}" in results[1]
+    assert "\\usepackage[table]{xcolor}" in results[4]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_render_many_merges_packages(workers):
+    tables = [Table([[i, "x"]]) for i in range(3)]
+    tables[0].rows[0][1].add_formatters(text_color("red"))
+    tables[2].rows[0][1].add_formatters(cell_color("blue"))
+
+    required_packages.clear()
+    render_many(tables, workers=workers)
+
+    assert [(pkg.name, pkg.options) for pkg in required_packages] == [
+        ("xcolor", {"table"})
+    ]
+
+
+def test_write_many(tmp_path):
+    tables = [Table([[i, i * 2], [i * 3, "x"]]) for i in range(4)]
+    tables[3].caption = "Table 3"
+    tables[3].rows[0][1].add_formatters(text_color("red"))
+    paths = write_many(tables, str(tmp_path / "out"), workers=2)
+
+    assert [path.rsplit("/", 1)[-1] for path in paths][:2] == [
+        "table_0.tex",
+        "table_1.tex",
+    ]
+    with open(paths[3]) as file:
+        assert file.read() == render_many([tables[3]], workers=1)[0]
+
+
+def test_invalid_arguments(tmp_path):
+    tables = [Table([[1]]), Table([[2]])]
+    with pytest.raises(ValueError):
+        render_many(tables, workers=0)
+    with pytest.raises(ValueError):
+        write_many(tables, str(tmp_path), names=["a.tex"])
@@ -0,0 +1,77 @@
+import pytest
+
+from texable import Table
+from texable.formatters import bold, italic
+
+
+def test_column_formatters_apply_to_every_cell():
+    table = Table(
+        [
+            ["a", 1, 2],
+            ["b", 3, 4],
+            ["c", 5, 6],
+        ]
+    )
+    table.columns[1].add_formatters(bold)
+
+    assert [row[1].to_latex() for row in table.rows] == [
+        "\\textbf{1}",
+        "\\textbf{3}",
+        "\\textbf{5}",
+    ]
+    assert "a & \\textbf{1} & 2 \\\\" in table.to_latex()
+
+
+def test_column_formatters_run_after_cell_formatters():
+    table = Table(
+        [
+            ["a", 1, 2],
+            ["b", 3, 4],
+            ["c", 5, 6],
+        ]
+    )
+    table.columns[0].add_formatters(bold)
+    table.rows[0][0].add_formatters(italic)
+
+    assert table.rows[0][0].to_latex() == "\\textbf{\\textit{a}}"
+    assert "\\textbf{\\textit{a}} & 1 & 2" in table.to_latex()
+
+
+def test_column_selection_and_iteration():
+    table = Table(
+        [
+            ["a", 1, 2],
+            ["b", 3, 4],
+            ["c", 5, 6],
+        ]
+    )
+    for column in table.columns[1:]:
+        column.add_formatters(italic)
+
+    assert list(table.columns[-1]) == [2, 4, 6]
+    assert "a & \\textit{1} & \\textit{2}" in table.to_latex()
+
+
+def test_region_formatters():
+    table = Table(
+        [
+            ["a", 1, 2],
+            ["b", 3, 4],
+            ["c", 5, 6],
+        ]
+    )
+    table.add_formatters(bold, rows=slice(1, 3), columns=[0, 2])
+
+    latex = table.to_latex()
+    assert "a & 1 & 2 \\\\" in latex
+    assert "\\textbf{b} & 3 & \\textbf{4} \\\\" in latex
+    assert "\\textbf{c} & 5 & \\textbf{6} \\\\" in latex
+    assert table.rows[2][2].to_latex() == "\\textbf{6}"
+
+
+def test_invalid_region():
+    table = Table([["a", 1, 2], ["b", 3, 4], ["c", 5, 6]])
+    with pytest.raises(ValueError):
+        table.add_formatters(bold, rows=slice(0, 3, 2))
+    with pytest.raises(IndexError):
+        table.columns[3]
@@ -0,0 +1,107 @@
+import pytest
+
+from texable import Document, Table
+from texable.formatters import bold, cell_color, text_color
+from texable.packages import package_scope, require_package, required_packages
+
+
+def test_preamble_lists_packages_once():
+    tables = [Table([[i, i * 2], [i * 3, "x"]]) for i in range(6)]
+    for i, table in enumerate(tables):
+        table.caption = f"Table {i}"
+        table.columns[0].add_formatters(bold)
+    tables[1].rows[0][1].add_formatters(text_color("red"))
+    tables[4].rows[1][1].add_formatters(cell_color("blue"))
+    tables[5].require_package("booktabs")
+    latex = Document(tables, class_options=["a4paper"]).to_latex(workers=1)
+
+    assert latex.startswith(
+        "\\documentclass[a4paper]{article}\n"
+        "\\usepackage[table]{xcolor}\n"
+        "\\usepackage{booktabs}\n"
+        "\n\\begin{document}\n\n"
+    )
+    assert latex.endswith("\\end{table}\n\n\\end{document}\n")
+    assert latex.count("\\usepackage") == 2
+    positions = [latex.index(f"\\caption{{Table {i}}}") for i in range(6)]
+    assert positions == sorted(positions)
+    assert tables[2].render().latex in latex
+
+
+@pytest.mark.parametrize("workers, executor", [(2, "process"), (3, "thread")])
+def test_pools_render_the_same_document(workers, executor):
+    tables = [Table([[i, i * 2], [i * 3, "x"]]) for i in range(6)]
+    tables[1].rows[0][1].add_formatters(text_color("red"))
+    tables[4].rows[1][1].add_formatters(cell_color("blue"))
+    document = Document(tables)
+    assert document.to_latex(workers, executor) == document.to_latex(workers=1)
+
+
+def test_renders_in_the_current_process_by_default(monkeypatch):
+    monkeypatch.setattr("texable.batch.os.cpu_count", lambda: 4)
+    tables = [Table([[i, i * 2], [i * 3, "x"]]) for i in range(6)]
+    # Lambdas cannot be pickled, so a process pool would fail on them
+    tables[0].rows[0][0].add_formatters(lambda text: f"<{text}>")
+    document = Document(tables)
+    assert document.to_latex() == document.to_latex(workers=1)
+    assert "<0>" in document.to_latex()
+
+
+def test_sections_and_raw_latex():
+    document = Document()
+    document.add_section("Results & more")
+    document.add_table(Table([[1]]))
+    document.add_latex("\\clearpage")
+    document.add_section("Appendix", level="subsection")
+
+    body = document.to_latex(workers=1).split("\\begin{document}\n\n")[1]
+    assert body.startswith("\\section{Results \\& more}\n\n\\begin{table}")
+    assert "\\end{table}\n\n\\clearpage\n\n\\subsection{Appendix}\n" in body
+    assert len(document) == 1
+
+    with pytest.raises(ValueError):
+        document.add_section("x", level="chapterette")  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        document.add_table([[1]])  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        document.to_latex(executor="fiber")  # type: ignore[arg-type]
+
+
+def test_write_to_file_streams_the_document(tmp_path):
+    tables = [Table([[i, i * 2], [i * 3, "x"]]) for i in range(6)]
+    tables[1].rows[0][1].add_formatters(text_color("red"))
+    document = Document(tables)
+    path = tmp_path / "appendix.tex"
+    document.write_to_file(str(path), workers=2, executor="thread")
+    assert path.read_text() == document.to_latex(workers=1)
+
+
+def shout(text: str) -> str:
+    require_package("undeclared")
+    return text.upper()
+
+
+def test_undeclared_packages():
+    table = Table([["a"]])
+    table.columns[0].add_formatters(shout)
+    document = Document([table])
+
+    assert "\\usepackage{undeclared}" in document.to_latex(workers=1)
+    before = set(required_packages)
+    assert "".join(document.iter_latex(workers=1)) == document.to_latex()
+    assert required_packages == before
+    # The caller's scope gets them too
+    with package_scope() as packages:
+        list(document.iter_latex())
+    assert [pkg.name for pkg in packages] == ["undeclared"]
+
+
+def test_write_to_file_includes_undeclared_packages(tmp_path):
+    tables = [Table([[i, i * 2], [i * 3, "x"]]) for i in range(6)]
+    tables[1].rows[0][1].add_formatters(text_color("red"))
+    tables[3].columns[0].add_formatters(shout)
+    document = Document(tables)
+    path = tmp_path / "document.tex"
+    document.write_to_file(str(path), workers=2, executor="thread")
+    assert "\\usepackage{undeclared}" in path.read_text()
+    assert path.read_text() == document.to_latex()
@@ -0,0 +1,99 @@
+import pytest
+
+from texable import Table
+from texable.cell import Cell
+from texable.escaping import escape, escape_many
+from texable.formatters import bold
+from texable.number_format import NumberFormat
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("plain", "plain"),
+        ("R&D", r"R\&D"),
+        ("50%", r"50\%"),
+        ("$5 #1 a_b {x}", r"\$5 \#1 a\_b \{x\}"),
+        ("~^\\", r"\textasciitilde{}\textasciicircum{}\textbackslash{}"),
+    ],
+)
+def test_escape(text, expected):
+    assert escape(text) == expected
+
+
+def test_escape_many_matches_escape():
+    texts = ["a_b", "plain", "", "100%", "\\{~^}", "x\x00&y"]
+    assert escape_many(texts) == [escape(text) for text in texts]
+
+
+def test_escape_many_returns_clean_lists_unchanged():
+    texts = ["a", "b"]
+    assert escape_many(texts) is texts
+    assert escape_many([]) == []
+
+
+def test_cells_and_headers_are_escaped():
+    table = Table([["R&D", "5%"], ["a_b", 1]])
+    table.headers = ["Name #", "Share"]
+
+    latex = table.to_latex()
+    assert "Name \\# & Share \\\\" in latex
+    assert "R\\&D & 5\\% \\\\" in latex
+    assert "a\\_b & 1 \\\\" in latex
+    assert "".join(table.iter_latex()) == latex
+    assert "".join(cell.to_latex() for cell in table.rows[0]) == "R\\&D5\\%"
+
+
+def test_escaping_happens_before_formatters():
+    table = Table([["a_b"]])
+    table.rows[0][0].add_formatters(bold)
+    assert "\\textbf{a\\_b}" in table.to_latex()
+
+
+def test_opt_out_per_table_column_and_cell():
+    table = Table([["$x$", "$y$"], ["$z$", "50%"]])
+    table.headers = ["$\\alpha$", "b_1"]
+
+    table.columns[0].escape = False
+    table.rows[1][1].escape = False
+    latex = table.to_latex()
+    assert "$\\alpha$ & b\\_1 \\\\" in latex
+    assert "$x$ & \\$y\\$ \\\\" in latex
+    assert "$z$ & 50% \\\\" in latex
+    assert not table.columns[0].escape and table.columns[1].escape
+    assert not table.rows[1][1].escape and table.rows[0][1].escape
+
+    table.escape = False
+    latex = table.to_latex()
+    assert "$\\alpha$ & b_1 \\\\" in latex
+    assert "$x$ & $y$ \\\\" in latex
+    assert not table.rows[0][1].escape
+
+
+def test_number_formats_are_not_escaped():
+    table = Table([[0.5, "a_b"]])
+    table.columns[0].number_format = NumberFormat(decimals=0, notation="percent")
+    table.rows[0][0].escape = False
+
+    assert "50\\% & a\\_b \\\\" in table.to_latex()
+
+
+def test_text_in_number_formatted_columns_is_escaped():
+    table = Table([[1234.5], ["R&D"], ["n/a_1"]])
+    table.columns[0].number_format = NumberFormat(decimals=1, thousands=",")
+    table.rows[2][0].escape = False
+
+    assert table.columns[0].escape
+    assert table.rows[1][0].to_latex() == "R\\&D"
+    latex = table.to_latex()
+    assert "1,234.5 \\\\" in latex
+    assert "R\\&D \\\\" in latex
+    assert "n/a_1 \\\\" in latex
+
+
+def test_standalone_cell_escaping():
+    cell = Cell("a&b")
+    assert cell.to_latex() == "a\\&b"
+    cell.escape = False
+    assert cell.to_latex() == "a&b"
+    assert str(cell) == "a&b"
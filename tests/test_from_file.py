@@ -0,0 +1,78 @@
+import pytest
+
+from texable import Table
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("name,count,score\na,1,0.5\nb,2,1.5\nc,3,x\n")
+    return str(path)
+
+
+def test_from_file_reads_strings(csv_file):
+    table = Table.from_file(csv_file)
+
+    assert table.num_rows == 4
+    assert table.num_columns == 3
+    assert table.rows[1][1].value == "1"
+
+
+def test_from_file_header_and_max_rows(csv_file):
+    table = Table.from_file(csv_file, has_header=True, max_rows=2)
+
+    assert table.headers.headers == ["name", "count", "score"]
+    assert table.num_rows == 2
+    assert table.rows[-1][0].value == "b"
+
+
+def test_from_file_infers_dtypes(csv_file):
+    table = Table.from_file(csv_file, has_header=True, infer_dtypes=True)
+
+    assert [row[1].value for row in table.rows] == [1, 2, 3]
+    assert table.rows[0][2].value == "0.5"  # "x" keeps the column as text
+
+
+def test_from_file_explicit_dtypes(csv_file):
+    table = Table.from_file(csv_file, has_header=True, max_rows=2, dtypes={2: float})
+
+    assert [row[2].value for row in table.rows] == [0.5, 1.5]
+
+
+def test_from_file_dialect(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a;b\nc;d\n")
+    table = Table.from_file(str(path), dialect="excel", max_rows=1)
+    assert table.num_columns == 1
+
+    class Semicolon:
+        delimiter = ";"
+        quotechar = '"'
+        doublequote = True
+        skipinitialspace = False
+        lineterminator = "\r\n"
+        quoting = 0
+
+    table = Table.from_file(str(path), dialect=Semicolon)
+    assert table.num_columns == 2
+
+
+def test_from_file_inconsistent_rows(tmp_path):
+    path = tmp_path / "data.tsv"
+    path.write_text("a\tb\nc\n")
+
+    with pytest.raises(ValueError, match="row 2"):
+        Table.from_file(str(path))
+
+
+def test_from_file_stream_matches_loaded(csv_file, tmp_path):
+    loaded = Table.from_file(csv_file, has_header=True, infer_dtypes=True)
+    streamed = Table.from_file(csv_file, has_header=True, infer_dtypes=True, stream=True)
+    for table in (loaded, streamed):
+        table.horizontal_borders.all()
+
+    assert streamed.num_rows == 3
+    assert streamed.to_latex() == loaded.to_latex()
+
+    with pytest.raises(TypeError):
+        _ = streamed.rows
@@ -0,0 +1,50 @@
+import pytest
+
+from texable.grid import Grid
+from texable.row import Row
+
+
+def wrap_bold(s: str) -> str:
+    return f"\\textbf{{{s}}}"
+
+
+def test_indexing_returns_row_of_cells():
+    grid = Grid([[1, 2], [3, 4]])
+
+    row = grid[1]
+    assert isinstance(row, Row)
+    assert [cell.value for cell in row] == [3, 4]
+    assert grid[1][0] == 3
+    assert grid[-1][1] == 4
+
+    with pytest.raises(IndexError):
+        _ = grid[2]
+
+
+def test_cell_value_writes_through():
+    grid = Grid([[1, 2], [3, 4]])
+    grid[0][1].value = 20
+
+    assert grid[0][1].value == 20
+    assert list(grid.iter_row_values()) == [(1, 20), (3, 4)]
+
+
+def test_formatters_are_stored_per_cell():
+    grid = Grid([["a", "b"], ["c", "d"]])
+    grid[1].add_formatters(wrap_bold, selector=lambda cell: cell == "d")
+
+    assert grid[1][1].to_latex() == "\\textbf{d}"
+    assert grid[1][0].to_latex() == "c"
+    assert grid[0][1].to_latex() == "b"
+
+
+def test_iter_latex_rows_matches_row_to_latex():
+    grid = Grid([["a", 1], ["b", 2]])
+    grid[0][0].add_formatters(wrap_bold)
+
+    assert list(grid.iter_latex_rows()) == [row.to_latex() for row in grid.rows]
+
+
+def test_inconsistent_rows_raise():
+    with pytest.raises(ValueError):
+        Grid([[1, 2], [3]])
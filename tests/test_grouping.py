@@ -0,0 +1,130 @@
+import pytest
+
+from texable import Table
+from texable.headers import HeaderGroup
+from texable.spans import Span
+
+
+def tabular_lines(table: Table) -> list[str]:
+    lines = table.to_latex().splitlines()
+    start = next(i for i, line in enumerate(lines) if "begin{tabular}" in line)
+    return [line.strip() for line in lines[start + 1 : -3]]
+
+
+def test_multi_level_headers():
+    table = Table([["cnn", "mnist", 0.99, 3]])
+    table.headers = ["Model", "Dataset", "Accuracy", "Latency"]
+    table.headers.add_group("Metrics & cost", 2, 3)
+    table.headers.add_group("Setup", 0, 1)
+    table.headers.add_group("Results", 0, 3, level=1)
+    table.vertical_borders.outer()
+
+    assert tabular_lines(table)[:5] == [
+        r"\multicolumn{4}{|c|}{Results} \\",
+        r"\cline{1-4}",
+        r"\multicolumn{2}{|c}{Setup} & \multicolumn{2}{c|}{Metrics \& cost} \\",
+        r"\cline{1-2}\cline{3-4}",
+        r"Model & Dataset & Accuracy & Latency \\",
+    ]
+    assert table.headers.groups == [
+        [HeaderGroup("Setup", 0, 1), HeaderGroup("Metrics & cost", 2, 3)],
+        [HeaderGroup("Results", 0, 3)],
+    ]
+
+    table.headers.group_rule = "cmidrule"
+    assert tabular_lines(table)[3] == r"\cmidrule(lr){1-2}\cmidrule(lr){3-4}"
+    assert "\\usepackage{booktabs}" in table.to_latex()
+
+    table.headers.clear_groups()
+    assert tabular_lines(table)[0] == r"Model & Dataset & Accuracy & Latency \\"
+    assert "booktabs" not in table.to_latex()
+
+
+def test_invalid_header_groups():
+    table = Table([["cnn", "mnist", 0.99, 3]])
+    table.headers = ["Model", "Dataset", "Accuracy", "Latency"]
+    headers = table.headers
+    headers.add_group("Metrics", 2, 3)
+    with pytest.raises(ValueError):
+        headers.add_group("Overlap", 3, 3)
+    with pytest.raises(ValueError):
+        headers.add_group("Skipped", 0, 1, level=2)
+    with pytest.raises(ValueError):
+        headers.add_group("Backwards", 1, 0)
+    with pytest.raises(IndexError):
+        headers.add_group("Outside", 0, 4)
+    with pytest.raises(ValueError):
+        headers.group_rule = "toprule"  # type: ignore[assignment]
+
+
+def test_group_labels_follow_escaping():
+    table = Table([["cnn", "mnist", 0.99, 3]])
+    table.headers = ["Model", "Dataset", "Accuracy", "Latency"]
+    table.escape = False
+    table.headers.add_group(r"\textbf{Metrics}", 2, 3)
+    assert r"\multicolumn{2}{c}{\textbf{Metrics}}" in table.to_latex()
+
+
+def test_group_by_collapses_runs():
+    table = Table(
+        [
+            ["cnn", "mnist", 0.99, 3],
+            ["cnn", "cifar", 0.8, 4],
+            ["vit", "cifar", 0.9, 9],
+            ["vit", "mnist", 0.97, 8],
+            ["cnn", "svhn", 0.95, 3],
+        ]
+    )
+    table.headers = ["Model", "Dataset", "Accuracy", "Latency"]
+    table.horizontal_borders.all()
+    assert table.group_by("Model") == [range(0, 2), range(2, 4), range(4, 5)]
+    assert table.spans == [Span(0, 0, 2, 1), Span(2, 0, 2, 1)]
+
+    assert tabular_lines(table)[3:10] == [
+        r"\multirow{2}{*}{cnn} & mnist & 0.99 & 3 \\",
+        r"\cline{2-4}",
+        r"& cifar & 0.8 & 4 \\",
+        r"\hline",
+        r"\multirow{2}{*}{vit} & cifar & 0.9 & 9 \\",
+        r"\cline{2-4}",
+        r"& mnist & 0.97 & 8 \\",
+    ]
+    with pytest.raises(ValueError):
+        table.group_by(0)
+
+
+def test_group_by_on_a_sorted_view():
+    table = Table(
+        [
+            ["cnn", "mnist", 0.99, 3],
+            ["cnn", "cifar", 0.8, 4],
+            ["vit", "cifar", 0.9, 9],
+            ["vit", "mnist", 0.97, 8],
+            ["cnn", "svhn", 0.95, 3],
+        ]
+    )
+    table.headers = ["Model", "Dataset", "Accuracy", "Latency"]
+    table.headers.add_group("Metrics", 2, 3)
+    report = table.sort_by("Model")
+    assert report.group_by("Model", rules=False) == [range(0, 3), range(3, 5)]
+    assert report.horizontal_borders.borders == [""] * 6
+    latex = report.to_latex()
+    assert r"\multirow{3}{*}{cnn} & mnist" in latex
+    assert r"\multicolumn{2}{c}{Metrics}" in latex
+    # The original table is left alone, and other columns lose the groups
+    assert table.spans == []
+    assert table.select(columns=[0, 2]).headers.groups == []
+
+
+def test_group_by_adds_rules_between_groups():
+    table = Table([[1, "a"], [1, "b"], [2, "c"], [3, "d"]])
+    assert table.group_by(0) == [range(0, 2), range(2, 3), range(3, 4)]
+    assert table.horizontal_borders.borders == ["", "", "\\hline", "\\hline", ""]
+
+
+def test_group_by_leaves_the_bottom_border_alone():
+    table = Table([["a", 1], ["a", 2], ["a", 3], ["b", 4]])
+    table.headers = ["key", "value"]
+    table.group_by("key")
+    assert table.horizontal_borders.borders == ["", "", "", "", ""]
+    assert "\\hline" not in table.to_latex()
@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+import pytest
+
+import texable
+
+
+def run_python(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def test_import_is_lazy_and_leaves_logging_alone():
+    output = run_python(
+        "import logging, sys\n"
+        "root = logging.getLogger()\n"
+        "handlers, level = list(root.handlers), root.level\n"
+        "import texable\n"
+        "print('texable.table' in sys.modules, root.handlers == handlers, root.level == level)\n"
+    )
+    assert output == "False True True"
+
+
+def test_public_names_resolve_lazily():
+    from texable.custom_types import Alignment
+    from texable.table import Table
+
+    assert texable.Table is Table
+    assert texable.Alignment is Alignment
+    assert set(texable.__all__) <= set(dir(texable))
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError, match="does_not_exist"):
+        texable.does_not_exist
@@ -0,0 +1,133 @@
+import pickle
+
+import pytest
+
+from texable import Table
+from texable.formatters import bold, italic
+from texable.grid import Grid
+from texable.number_format import NumberFormat
+
+
+def fresh_latex(table: Table) -> str:
+    table.clear_cache()
+    table.incremental = False
+    latex = table.to_latex()
+    table.incremental = True
+    return latex
+
+
+@pytest.fixture
+def rendered_rows(monkeypatch):
+    rendered = []
+    render_row = Grid.render_row
+
+    def counting_render_row(self, index, spans=None):
+        rendered.append(index)
+        return render_row(self, index, spans)
+
+    monkeypatch.setattr(Grid, "render_row", counting_render_row)
+    return rendered
+
+
+def test_render_row_matches_iter_latex_rows():
+    grid = Grid([[1, "x"], [2, "y"], [3, "z"]])
+    grid._add_cell_formatters(1, 0, [bold])
+    grid.add_column_formatters(1, [italic])
+
+    assert [grid.render_row(i) for i in range(3)] == list(grid.iter_latex_rows())
+    with pytest.raises(IndexError):
+        grid.render_row(3)
+
+
+def test_only_dirty_rows_are_rerendered(rendered_rows):
+    table = Table([[i, i * 0.5, f"r{i}"] for i in range(50)])
+    table.incremental = True
+    table.to_latex()
+    assert rendered_rows == []
+
+    table.rows[3][0].value = 99
+    table.rows[40][2].add_formatters(bold)
+    latex = table.to_latex()
+
+    assert sorted(rendered_rows) == [3, 40]
+    assert "99 & 1.5 & r3" in latex
+    assert latex == fresh_latex(table)
+
+
+def test_region_formatters_rerender_their_rows(rendered_rows):
+    table = Table([[i, i * 0.5, f"r{i}"] for i in range(50)])
+    table.incremental = True
+    table.to_latex()
+
+    table.add_formatters(bold, rows=slice(10, 12), columns=[0])
+    latex = table.to_latex()
+
+    assert sorted(rendered_rows) == [10, 11]
+    assert latex == fresh_latex(table)
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda t: t.columns[0].add_formatters(bold),
+        lambda t: setattr(t.columns[1], "number_format", NumberFormat(decimals=2)),
+    ],
+)
+def test_column_wide_changes_rerender_everything(rendered_rows, mutate):
+    table = Table([[i, i * 0.5, f"r{i}"] for i in range(50)])
+    table.incremental = True
+    table.to_latex()
+
+    mutate(table)
+    latex = table.to_latex()
+
+    assert rendered_rows == []  # Rebuilt in bulk, not row by row
+    assert latex == fresh_latex(table)
+
+
+def test_non_data_changes_reuse_all_rows(rendered_rows):
+    table = Table([[i, i * 0.5, f"r{i}"] for i in range(50)])
+    table.incremental = True
+    table.to_latex()
+
+    table.caption = "Caption"
+    table.horizontal_borders.at(5)
+    latex = table.to_latex()
+
+    assert rendered_rows == []
+    assert latex == fresh_latex(table)
+
+
+def test_streaming_still_yields_lines():
+    table = Table([[i, i * 0.5, f"r{i}"] for i in range(50)])
+    table.incremental = True
+    table.to_latex()
+    table.rows[0][1].value = "changed"
+
+    lines = list(table.iter_latex())
+    assert all("\n" not in line[:-1] for line in lines)
+    assert "".join(lines) == fresh_latex(table)
+
+
+def test_incremental_survives_pickling():
+    table = Table([[i, i * 0.5, f"r{i}"] for i in range(50)])
+    table.incremental = True
+    table.to_latex()
+
+    copy = pickle.loads(pickle.dumps(table))
+    copy.rows[2][0].value = -1
+
+    assert copy.incremental
+    assert "-1 & 1.0 & r2" in copy.to_latex()
+    assert copy.to_latex() == fresh_latex(copy)
+
+
+def test_changing_the_indent_reindents_cached_rows():
+    table = Table([[i, i * 0.5, f"r{i}"] for i in range(5)])
+    table.headers = ["a", "b", "c"]
+    table.incremental = True
+    table.horizontal_borders.all()
+    table.to_latex()
+
+    table.indent = "\t"
+    assert table.to_latex() == fresh_latex(table)
@@ -0,0 +1,100 @@
+import json
+import logging
+
+import pytest
+
+from texable import Table
+from texable.formatters import bold, italic
+from texable.instrumentation import (
+    add_listener,
+    enabled,
+    instrument,
+    log_stats,
+    remove_listener,
+)
+
+
+def test_disabled_by_default():
+    assert not enabled()
+    with instrument():
+        assert enabled()
+    assert not enabled()
+
+
+def test_to_latex_records_phases_and_counts():
+    table = Table([[i, f"row {i}"] for i in range(10)])
+    table.columns[1].add_formatters(bold)
+    table.rows[2][0].add_formatters(italic, bold)
+    table.add_formatters(italic, rows=slice(0, 3), columns=[0])
+    with instrument() as stats:
+        latex = table.to_latex()
+
+    assert len(stats) == 1
+    record = stats[0]
+    assert record.operation == "to_latex"
+    assert not record.cache_hit
+    assert record.rows == 10 and record.cells == 20
+    # 10 column formatter calls, 2 cell formatter calls, 3 region formatter calls
+    assert record.formatter_calls == 15
+    assert record.output_bytes == len(latex.encode("utf-8"))
+    assert {"convert", "formatters", "layout", "total"} <= record.phases.keys()
+    assert sum(v for k, v in record.phases.items() if k != "total") == pytest.approx(
+        record.phases["total"]
+    )
+
+
+def test_cache_hits_render_no_rows():
+    table = Table([[i, f"row {i}"] for i in range(10)])
+    table.to_latex()
+    with instrument() as stats:
+        table.to_latex()
+
+    assert stats[0].cache_hit
+    assert stats[0].rows == 0
+
+
+def test_write_to_file_is_one_operation(tmp_path):
+    table = Table([[i, f"row {i}"] for i in range(10)])
+    table.columns[1].add_formatters(bold)
+    path = tmp_path / "table.tex"
+    with instrument() as stats:
+        table.write_to_file(str(path))
+
+    assert [record.operation for record in stats] == ["write_to_file"]
+    assert stats[0].phases["write"] > 0
+    assert stats[0].output_bytes == path.stat().st_size
+
+
+def test_construction_is_measured():
+    with instrument() as stats:
+        Table([[1, 2]])
+    assert [record.operation for record in stats] == ["construct"]
+
+
+def test_to_dict_is_json_serializable():
+    table = Table([[i, f"row {i}"] for i in range(10)])
+    with instrument() as stats:
+        table.to_latex()
+    data = json.loads(json.dumps(stats[-1].to_dict()))
+    assert data["operation"] == "to_latex"
+    assert data["rows"] == 10
+
+
+def test_listeners_and_logging(caplog):
+    received = []
+    add_listener(received.append)
+    add_listener(log_stats)
+    try:
+        with caplog.at_level(logging.INFO, logger="texable.instrumentation"):
+            table = Table([[i, f"row {i}"] for i in range(10)])
+            table.columns[1].add_formatters(bold)
+            table.rows[2][0].add_formatters(italic, bold)
+            table.add_formatters(italic, rows=slice(0, 3), columns=[0])
+            table.to_latex()
+    finally:
+        remove_listener(received.append)
+        remove_listener(log_stats)
+
+    assert [record.operation for record in received] == ["construct", "to_latex"]
+    assert "to_latex took" in caplog.text
+    assert "10 rows, 20 cells, 15 formatter calls" in caplog.text
@@ -0,0 +1,94 @@
+import datetime
+
+import pytest
+
+from texable import Table
+
+np = pytest.importorskip("numpy")
+
+
+def test_from_ndarray_shares_memory():
+    array = np.arange(6, dtype=np.int64).reshape(3, 2)
+    table = Table.from_ndarray(array, headers=["a", "b"])
+
+    assert table.headers.headers == ["a", "b"]
+    assert table.column_alignments.alignments == ["r", "r"]
+    assert "4 & 5 \\\\" in table.to_latex()
+
+    array[2, 0] = 40
+    assert table.rows[2][0].value == 40
+
+
+def test_from_ndarray_copy_and_fallback_on_incompatible_value():
+    array = np.array([[1.5, 2.5]])
+    table = Table.from_ndarray(array, copy=True)
+
+    table.rows[0][0].value = "n/a"
+    assert table.rows[0][0].value == "n/a"
+    assert array[0, 0] == 1.5
+    assert "n/a & 2.5 \\\\" in table.to_latex()
+
+
+def test_from_ndarray_requires_two_dimensions():
+    with pytest.raises(ValueError):
+        Table.from_ndarray(np.arange(3))
+
+
+def test_from_dataframe():
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame({"name": ["x", "y"], "score": [0.5, 1.25]})
+    df.index.name = "id"
+    table = Table.from_dataframe(df, index=True)
+
+    assert table.headers.headers == ["id", "name", "score"]
+    assert table.column_alignments.alignments == ["r", "c", "r"]
+    assert "0 & x & 0.5 \\\\" in table.to_latex()
+
+
+def test_from_arrow():
+    pa = pytest.importorskip("pyarrow")
+    data = pa.table({"n": [1, None, 3], "s": ["a", "b", "c"]})
+    table = Table.from_arrow(data)
+
+    assert table.headers.headers == ["n", "s"]
+    assert table.column_alignments.alignments == ["r", "c"]
+    assert "\n     & b \\\\" in table.to_latex()
+
+
+def test_from_dataframe_datetimes_and_missing_values():
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame(
+        {
+            "day": pd.to_datetime(["2024-01-02", None]),
+            "name": ["x", None],
+            "label": pd.array([None, "y"], dtype="string"),
+        }
+    )
+
+    latex = Table.from_dataframe(df).to_latex()
+    assert "2024-01-02 & x &  \\\\" in latex
+    assert "\n     &  & y \\\\" in latex
+
+    latex = Table.from_dataframe(df, missing="--").to_latex()
+    assert "-- & -- & y \\\\" in latex
+    assert "nan" not in latex and "NaT" not in latex
+
+
+def test_from_ndarray_datetimes():
+    array = np.array([["2024-01-02T03:04", "NaT"]], dtype="datetime64[s]")
+    table = Table.from_ndarray(array, missing="n/a")
+    assert table.rows[0][0].value == "2024-01-02T03:04"
+    assert "2024-01-02T03:04 & n/a \\\\" in table.to_latex()
+
+
+def test_from_arrow_datetimes_and_missing_values():
+    pa = pytest.importorskip("pyarrow")
+    data = pa.table(
+        {
+            "day": [datetime.date(2024, 1, 2), None],
+            "s": ["a", None],
+        }
+    )
+    latex = Table.from_arrow(data, missing="--").to_latex()
+    assert "2024-01-02 & a \\\\" in latex
+    assert "-- & -- \\\\" in latex
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from texable import Table
+from texable.number_format import NumberFormat
+
+
+@pytest.mark.parametrize(
+    "number_format, value, expected",
+    [
+        (NumberFormat(decimals=2), 3.14159, "3.14"),
+        (NumberFormat(decimals=1, thousands=","), 1234567.89, "1,234,567.9"),
+        (NumberFormat(thousands=" ", decimal_mark=","), 1234.5, "1 234,5"),
+        (NumberFormat(significant=3), 0.0123456, "0.0123"),
+        (NumberFormat(significant=2), 12345, "12000"),
+        (NumberFormat(decimals=1, notation="percent"), 0.1234, "12.3\\%"),
+        (NumberFormat(decimals=2, notation="scientific"), 12345.0, "$1.23 \\times 10^{4}$"),
+        (NumberFormat(decimals=1, notation="scientific"), 0.000999, "$1.0 \\times 10^{-3}$"),
+        (NumberFormat(decimals=1, notation="engineering"), 12345.0, "$12.3 \\times 10^{3}$"),
+        (NumberFormat(decimals=2, siunitx="num"), 2.5, "\\num{2.50}"),
+        (NumberFormat(decimals=1, notation="scientific", siunitx="S"), 1500, "1.5e3"),
+        (NumberFormat(decimals=2), "n/a", "n/a"),
+        (NumberFormat(decimals=2), True, "True"),
+        (NumberFormat(decimals=2), float("nan"), "nan"),
+    ],
+)
+def test_format(number_format, value, expected):
+    assert number_format.format(value) == expected
+
+
+def test_invalid_options():
+    with pytest.raises(ValueError):
+        NumberFormat(decimals=2, significant=2)
+    with pytest.raises(ValueError):
+        NumberFormat(notation="roman")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    "number_format",
+    [
+        NumberFormat(decimals=3),
+        NumberFormat(decimals=1, notation="percent", decimal_mark=","),
+        NumberFormat(siunitx="num"),
+    ],
+)
+def test_format_many_matches_format(number_format):
+    values = [i * 1.37 - 50 for i in range(1000)] + [7, None]
+    ints = list(range(-500, 500))
+
+    assert number_format.format_many(values) == [number_format.format(v) for v in values]
+    assert number_format.format_many(ints) == [number_format.format(v) for v in ints]
+
+
+@pytest.mark.parametrize(
+    "number_format",
+    [
+        NumberFormat(decimals=3),
+        NumberFormat(decimals=1, notation="percent"),
+        NumberFormat(decimals=1, notation="percent", siunitx="num"),
+    ],
+)
+def test_format_many_matches_format_for_non_finite_values(number_format):
+    values = [0.5, float("nan"), float("inf"), -float("inf")]
+    expected = [number_format.format(v) for v in values]
+
+    assert number_format.format_many(values) == expected
+    assert number_format.format_many(np.array(values)) == expected
+
+
+def test_nan_in_percent_column():
+    table = Table([[0.25], [float("nan")]])
+    table.columns[0].number_format = NumberFormat(decimals=0, notation="percent")
+    latex = table.to_latex()
+    assert "25\\% \\\\" in latex
+    assert "nan \\\\" in latex
+    assert table.rows[1][0].to_latex() == "nan"
+
+
+def test_column_number_format_in_table():
+    table = Table([["a", 1234.5], ["b", 0.25]])
+    table.headers = ["Name", "Value"]
+    table.columns[1].number_format = NumberFormat(decimals=2, siunitx="S")
+
+    latex = table.to_latex()
+    assert "\\begin{tabular}{cS}" in latex
+    assert "Name & {Value} \\\\" in latex
+    assert "a & 1234.50 \\\\" in latex
+    assert table.rows[1][1].to_latex() == "0.25"
+    assert "\\usepackage{siunitx}" in latex
+
+    table.columns[1].number_format = None
+    assert "a & 1234.5 \\\\" in table.to_latex()
@@ -0,0 +1,90 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from texable import Table
+from texable.formatters import cell_color, text_color
+from texable.packages import (
+    PackageSet,
+    package_scope,
+    require_package,
+    required_packages,
+)
+
+
+def colored_table(color: str) -> Table:
+    table = Table([["a", "b"]])
+    table.rows[0][0].add_formatters(text_color(color))
+    return table
+
+
+def test_packages_do_not_leak_between_tables():
+    colored_table("red").to_latex()
+    assert Table([["a", "b"]]).to_latex().startswith("\\begin{table}")
+
+
+def test_render_returns_packages():
+    table = colored_table("red")
+    table.rows[0][1].add_formatters(cell_color("blue"))
+    table.require_package("booktabs")
+
+    latex, packages = table.render()
+    assert latex.startswith("\\begin{table}")
+    assert [str(pkg) for pkg in packages] == [
+        "\\usepackage{booktabs}",
+        "\\usepackage[table]{xcolor}",
+    ]
+    assert table.to_latex().startswith(
+        "\\usepackage{booktabs}\n\\usepackage[table]{xcolor}\n" + "%" * 20 + "\n"
+    )
+
+
+def test_package_scope_collects_and_propagates():
+    before = set(required_packages)
+    with package_scope() as outer:
+        require_package("amsmath")
+        with package_scope() as inner:
+            require_package("xcolor", ["table"])
+        with package_scope(propagate=False):
+            require_package("hyperref")
+        colored_table("red").to_latex()
+
+    assert [pkg.name for pkg in inner] == ["xcolor"]
+    assert [(pkg.name, pkg.options) for pkg in outer] == [
+        ("amsmath", set()),
+        ("xcolor", {"table"}),
+    ]
+    assert required_packages == before
+
+
+def test_package_set_merges_options():
+    packages = PackageSet()
+    packages.add("xcolor")
+    packages.add("xcolor", ["table"])
+    packages.add("xcolor", ["dvipsnames"])
+
+    assert len(packages) == 1
+    assert "xcolor" in packages
+    assert packages.to_latex() == "\\usepackage[dvipsnames,table]{xcolor}\n"
+
+
+def test_concurrent_renders_from_threads():
+    tables = [colored_table("red") if i % 2 else Table([["x"]]) for i in range(40)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda table: table.render(), tables))
+
+    for i, (_, packages) in enumerate(results):
+        assert ("xcolor" in packages) == bool(i % 2)
+
+
+def test_concurrent_scopes_in_asyncio_tasks():
+    async def collect(name: str) -> list[str]:
+        with package_scope() as packages:
+            require_package(name)
+            await asyncio.sleep(0)
+            require_package(name + "-extra")
+        return [pkg.name for pkg in packages]
+
+    async def main():
+        return await asyncio.gather(collect("a"), collect("b"))
+
+    assert asyncio.run(main()) == [["a", "a-extra"], ["b", "b-extra"]]
@@ -0,0 +1,129 @@
+import pytest
+
+from texable import Pagination, Table
+from texable.packages import package_scope
+
+
+def test_default_output_is_unchanged():
+    table = Table([[i, i * 2] for i in range(5)])
+    table.caption = "Caption"
+    latex = table.to_latex()
+
+    table.pagination = Pagination.NONE
+    assert table.to_latex() == latex
+    assert latex.count("\\begin{table}") == 1
+
+
+def test_longtable_repeats_the_head_and_requires_longtable():
+    table = Table([[i, i * 2] for i in range(5)])
+    table.headers = ["a", "b"]
+    table.caption = "Caption"
+    table.label = "tab:x"
+    table.horizontal_borders.outer()
+    table.horizontal_borders.at(1)
+    table.pagination = Pagination.LONGTABLE
+
+    with package_scope() as packages:
+        latex = table.to_latex()
+
+    assert "longtable" in packages
+    assert latex == (
+        "\\usepackage{longtable}\n"
+        "%%%%%%%%%%%%%%%%%%%%\n"
+        "\\begin{longtable}[c]{cc}\n"
+        "  \\caption{Caption}\\label{tab:x} \\\\\n"
+        "  \\hline\n"
+        "  a & b \\\\\n"
+        "  \\hline\n"
+        "  \\endfirsthead\n"
+        "  \\hline\n"
+        "  a & b \\\\\n"
+        "  \\hline\n"
+        "  \\endhead\n"
+        "  \\hline\n"
+        "  \\endfoot\n"
+        "  0 & 0 \\\\\n"
+        "  1 & 2 \\\\\n"
+        "  2 & 4 \\\\\n"
+        "  3 & 6 \\\\\n"
+        "  \\hline\n"
+        "  4 & 8 \\\\\n"
+        "\\end{longtable}\n"
+    )
+
+
+def test_longtable_without_caption_or_borders():
+    table = Table([["x"], ["y"]])
+    table.pagination = Pagination.LONGTABLE
+    table.table_alignment = table.table_alignment.LEFT
+
+    assert table.to_latex().endswith(
+        "\\begin{longtable}[l]{c}\n  x \\\\\n  y \\\\\n\\end{longtable}\n"
+    )
+
+
+def test_chunks_split_rows_and_repeat_the_head():
+    table = Table([[i, i * 2] for i in range(5)])
+    table.headers = ["a", "b"]
+    table.caption = "Caption"
+    table.horizontal_borders.all()
+    table.pagination = Pagination.CHUNKS
+    table.rows_per_chunk = 2
+
+    latex = table.to_latex()
+    chunks = latex.split("\\end{table}\n")[:-1]
+
+    assert len(chunks) == 3
+    assert latex.count("\\caption{Caption}") == 1
+    for chunk, rows in zip(chunks, [("0 & 0", "1 & 2"), ("2 & 4", "3 & 6"), ("4 & 8",)]):
+        lines = [line.strip() for line in chunk.splitlines()]
+        body = lines[lines.index("\\begin{tabular}{cc}") + 1 : lines.index("\\end{tabular}")]
+        expected = ["\\hline", "a & b \\\\", "\\hline"]
+        for row in rows:
+            expected += [row + " \\\\", "\\hline"]
+        assert body == expected
+
+
+def test_chunk_boundaries_drop_the_border_between_them():
+    table = Table([[i] for i in range(4)])
+    table.horizontal_borders.at(2)
+    table.pagination = Pagination.CHUNKS
+    table.rows_per_chunk = 2
+
+    latex = table.to_latex()
+    assert "\\hline" not in latex
+    assert latex.count("\\begin{tabular}") == 2
+
+
+@pytest.mark.parametrize("pagination", [Pagination.LONGTABLE, Pagination.CHUNKS])
+def test_streaming_and_incremental_output_match(pagination):
+    table = Table([[i, i * 2] for i in range(12)])
+    table.headers = ["a", "b"]
+    table.horizontal_borders.all()
+    table.pagination = pagination
+    table.rows_per_chunk = 5
+    table.incremental = True
+    table.to_latex()
+
+    table.rows[7][1].value = "changed"
+    latex = table.to_latex()
+
+    assert "7 & changed" in latex
+    assert "".join(table.iter_latex()) == latex
+
+
+def test_pagination_setters_validate_and_invalidate_the_cache():
+    table = Table([[i, i * 2] for i in range(5)])
+    table.caption = "Caption"
+    latex = table.to_latex()
+
+    table.pagination = Pagination.CHUNKS
+    assert table.to_latex() == latex  # A single chunk
+
+    table.rows_per_chunk = 1
+    assert table.to_latex() != latex
+
+    with pytest.raises(TypeError):
+        table.pagination = "longtable"
+    with pytest.raises(ValueError):
+        table.rows_per_chunk = 0
@@ -0,0 +1,61 @@
+from texable import Table
+
+
+def test_preview_shows_head_and_tail():
+    table = Table([[i, f"<{i}> & co"] for i in range(1000)])
+    table.headers = ["n", "name"]
+    lines = table.preview(2, 2).splitlines()
+    assert lines == [
+        "n   | name      ",
+        "0   | <0> & co  ",
+        "1   | <1> & co  ",
+        "... | ...       ",
+        "998 | <998> & co",
+        "999 | <999> & co",
+        "(996 rows omitted)",
+    ]
+
+
+def test_preview_of_short_table_shows_everything():
+    table = Table([[i, f"<{i}> & co"] for i in range(3)])
+    table.headers = ["n", "name"]
+    assert table.preview() == table.to_text()
+
+
+def test_repr_html():
+    table = Table([[i, f"<{i}> & co"] for i in range(100)])
+    table.headers = ["n", "name"]
+    html = table._repr_html_()
+    assert "<th>name</th>" in html
+    assert "<td>&lt;0&gt; &amp; co</td>" in html
+    assert "<td>99</td>" in html and "<td>50</td>" not in html
+    assert html.endswith("<p>(90 rows omitted)</p>\n")
+
+
+def test_repr_latex_of_short_table_matches_tabular():
+    table = Table([[i, f"<{i}> & co"] for i in range(4)])
+    table.headers = ["n", "name"]
+    table.horizontal_borders.all()
+    # The tabular is nested one level deeper inside the table environment
+    nested = "".join(table.indent + line for line in table._repr_latex_().splitlines(True))
+    assert nested in table.to_latex()
+
+
+def test_repr_latex_elides_rows():
+    latex = Table([[i, f"<{i}> & co"] for i in range(100)])._repr_latex_()
+    assert r"\multicolumn{2}{c}{$\vdots$ (90 rows omitted)} \\" in latex
+    assert r"99 & <99> \& co \\" in latex
+    assert "50 &" not in latex
+
+
+def test_reprs_only_render_shown_rows():
+    calls = []
+
+    def count(text: str) -> str:
+        calls.append(text)
+        return text
+
+    table = Table([[i, f"<{i}> & co"] for i in range(100_000)])
+    table.columns[0].add_formatters(count)
+    table._repr_latex_()
+    assert len(calls) == 10
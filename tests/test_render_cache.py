@@ -0,0 +1,108 @@
+import pickle
+
+import pytest
+
+from texable import Alignment, Table
+from texable.formatters import bold, text_color
+from texable.number_format import NumberFormat
+from texable.packages import package_scope, required_packages
+
+
+def test_repeated_renders_hit_the_cache():
+    table = Table([[1, 2.5], [3, 4.5]])
+    first = table.to_latex()
+
+    assert table.to_latex() is first
+    assert table.cache_info() == (1, 1)
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda t: setattr(t.rows[0][0], "value", 10),
+        lambda t: t.rows[1].add_formatters(bold),
+        lambda t: t.columns[1].add_formatters(bold),
+        lambda t: t.add_formatters(bold, rows=slice(0, 1)),
+        lambda t: setattr(t.columns[1], "number_format", NumberFormat(decimals=2)),
+        lambda t: t.headers.__setitem__(0, "x"),
+        lambda t: t.column_alignments.__setitem__(1, Alignment.LEFT),
+        lambda t: t.horizontal_borders.at(0),
+        lambda t: t.vertical_borders.outer(),
+        lambda t: setattr(t, "caption", "Caption"),
+        lambda t: setattr(t, "label", "tab:x"),
+        lambda t: setattr(t, "indent", "    "),
+        lambda t: setattr(t, "table_alignment", Alignment.LEFT),
+        lambda t: t.require_package("booktabs"),
+    ],
+)
+def test_mutations_invalidate_the_cache(mutate):
+    table = Table([[1, 2.5], [3, 4.5]])
+    table.headers = ["a", "b"]
+    fresh = Table([[1, 2.5], [3, 4.5]])
+    fresh.headers = ["a", "b"]
+    before = table.to_latex()
+    mutate(table)
+    mutate(fresh)
+    after = table.to_latex()
+
+    assert after != before
+    assert after == fresh.to_latex()
+    assert table.cache_info() == (0, 2)
+
+
+def test_cache_hit_reports_packages_and_returns_copies():
+    table = Table([[1, 2.5], [3, 4.5]])
+    table.rows[0][0].add_formatters(text_color("red"))
+    table.render()
+
+    latex, packages = table.render()
+    packages.add("booktabs")
+    assert table.cache_info().hits == 1
+    assert [pkg.name for pkg in table.render().packages] == ["xcolor"]
+    assert table.to_latex().startswith("\\usepackage{xcolor}\n")
+
+
+def test_clear_cache_and_pickle():
+    table = Table([[1, 2.5], [3, 4.5]])
+    table.to_latex()
+    table.clear_cache()
+    table.to_latex()
+    assert table.cache_info() == (0, 2)
+
+    clone = pickle.loads(pickle.dumps(table))
+    assert clone._render_cache is None
+    assert clone.to_latex() == table.to_latex()
+
+
+def test_layout_is_compiled_again_only_after_layout_changes():
+    table = Table([[1, 2.5], [3, 4.5]])
+    table.horizontal_borders.all()
+    table.to_latex()
+    layout = table._compiled_layout()
+
+    table.rows[0][0].value = 10
+    table.to_latex()
+    assert table._compiled_layout() is layout
+
+    table.vertical_borders.all()
+    assert table._compiled_layout().column_arg == "|c|c|"
+    table.columns[1].number_format = NumberFormat(decimals=2, siunitx="S")
+    assert table._compiled_layout().column_arg == "|c|S|"
+
+
+def test_cache_hits_leave_required_packages_unchanged():
+    table = Table([[1, 2.5], [3, 4.5]])
+    table.rows[0].add_formatters(text_color("red"))
+    before = set(required_packages)
+    table.to_latex()
+    table.to_latex()
+    assert required_packages == before
+
+
+def test_cache_hits_report_packages_to_the_enclosing_scope():
+    table = Table([[1, 2.5], [3, 4.5]])
+    table.rows[0].add_formatters(text_color("red"))
+    table.to_latex()
+    with package_scope() as packages:
+        table.to_latex()
+    assert "xcolor" in {package.name for package in packages}
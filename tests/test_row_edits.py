@@ -0,0 +1,142 @@
+import numpy as np
+import pytest
+
+from texable import Table
+from texable.formatters import bold, italic
+
+
+ROWS = [[i, f"row {i}"] for i in range(6)]
+
+
+def test_appended_table_matches_table_built_at_once(bordered_table):
+    table = bordered_table(ROWS[:2], "all", with_headers=True)
+    table.columns[1].add_formatters(italic)
+    table.append_row(ROWS[2])
+    table.extend_rows(iter(ROWS[3:]))
+    expected = bordered_table(ROWS, "all", with_headers=True)
+    expected.columns[1].add_formatters(italic)
+    assert table.num_rows == 6
+    assert table.to_latex() == expected.to_latex()
+
+
+def test_outer_borders_stay_outside():
+    table = Table(ROWS[:2])
+    table.horizontal_borders.outer()
+    table.extend_rows(ROWS[2:])
+    table.insert_row(0, ["first", ""])
+    expected = Table([["first", ""]] + ROWS)
+    expected.horizontal_borders.outer()
+    assert table.to_latex() == expected.to_latex()
+
+
+def test_insert_and_delete_move_formatters_with_rows():
+    table = Table([list(row) for row in ROWS])
+    table.rows[3][0].add_formatters(bold)
+    table.add_formatters(italic, rows=slice(1, 5), columns=[1])
+
+    table.insert_row(2, ["new", "new"])
+    assert table.rows[4][0].to_latex() == r"\textbf{3}"
+    assert table.rows[2][1].to_latex() == "new"
+    assert table.rows[5][1].to_latex() == r"\textit{row 4}"
+
+    table.delete_rows([0, 4, -1])
+    assert [row[0].value for row in table.rows] == [1, "new", 2, 4]
+    assert [row[1].to_latex() for row in table.rows] == [
+        r"\textit{row 1}",
+        "new",
+        r"\textit{row 2}",
+        r"\textit{row 4}",
+    ]
+
+
+def test_delete_rows_with_slice_and_borders(bordered_table):
+    table = bordered_table(ROWS, "all", with_headers=True)
+    table.delete_rows(slice(1, 4))
+    expected = bordered_table([ROWS[0], ROWS[4], ROWS[5]], "all", with_headers=True)
+    assert table.to_latex() == expected.to_latex()
+    table.delete_rows(slice(None))
+    assert table.num_rows == 0
+
+
+def test_incremental_rendering_after_edits(bordered_table):
+    table = bordered_table(ROWS[:3], "all", with_headers=True)
+    table.incremental = True
+    table.to_latex()
+    table.extend_rows(ROWS[3:])
+    assert table.to_latex() == bordered_table(ROWS, "all", with_headers=True).to_latex()
+    table.delete_rows(0)
+    assert table.to_latex() == bordered_table(ROWS[1:], "all", with_headers=True).to_latex()
+
+
+def test_invalid_rows_raise():
+    table = Table([[1, 2]])
+    with pytest.raises(ValueError):
+        table.append_row([1])
+    with pytest.raises(TypeError):
+        table.append_row("ab")
+    with pytest.raises(IndexError):
+        table.insert_row(3, [1, 2])
+    with pytest.raises(IndexError):
+        table.delete_rows([1])
+
+    # Rows before an invalid one stay appended, and borders follow
+    with pytest.raises(ValueError):
+        table.extend_rows([[3, 4], [5]])
+    assert table.num_rows == 2
+    assert len(table.horizontal_borders) == 3
+
+
+def test_numpy_table_grows():
+    table = Table.from_ndarray(np.array([[1.5, 2.5]]))
+    table.append_row([3.5, 4.5])
+    assert [row[0].value for row in table.rows] == [1.5, 3.5]
+
+
+def test_views_and_streamed_tables_cannot_grow(tmp_path):
+    with pytest.raises(TypeError):
+        Table(ROWS).head(2).append_row([1, "x"])
+    path = tmp_path / "data.csv"
+    path.write_text("1,2\n")
+    with pytest.raises(TypeError):
+        Table.from_file(str(path), stream=True).delete_rows(0)
+
+
+# A single row has no inner border to continue, so edits start from two rows
+EDITS = [(num_rows, index) for num_rows in range(2, 5) for index in range(num_rows + 1)]
+
+
+@pytest.mark.parametrize("with_headers", [False, True])
+@pytest.mark.parametrize("style", ["all", "inner", "outer"])
+@pytest.mark.parametrize("num_rows, index", EDITS)
+def test_insert_row_matches_table_built_at_once(
+    bordered_table, style, with_headers, num_rows, index
+):
+    new = ["new", "new"]
+    table = bordered_table(ROWS[:num_rows], style, with_headers)
+    table.insert_row(index, new)
+    rows = ROWS[:index] + [new] + ROWS[index:num_rows]
+    assert table.to_latex() == bordered_table(rows, style, with_headers).to_latex()
+
+
+@pytest.mark.parametrize("with_headers", [False, True])
+@pytest.mark.parametrize("style", ["all", "inner", "outer"])
+@pytest.mark.parametrize("num_rows", range(2, 5))
+def test_append_row_matches_table_built_at_once(
+    bordered_table, style, with_headers, num_rows
+):
+    table = bordered_table(ROWS[:num_rows], style, with_headers)
+    table.append_row(ROWS[num_rows])
+    expected = bordered_table(ROWS[: num_rows + 1], style, with_headers)
+    assert table.to_latex() == expected.to_latex()
+
+
+@pytest.mark.parametrize("with_headers", [False, True])
+@pytest.mark.parametrize("style", ["all", "inner", "outer"])
+@pytest.mark.parametrize("num_rows, index", [(n, i) for n, i in EDITS if i < n])
+def test_delete_row_matches_table_built_at_once(
+    bordered_table, style, with_headers, num_rows, index
+):
+    table = bordered_table(ROWS[:num_rows], style, with_headers)
+    table.delete_rows(index)
+    rows = ROWS[:index] + ROWS[index + 1 : num_rows]
+    assert table.to_latex() == bordered_table(rows, style, with_headers).to_latex()
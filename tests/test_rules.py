@@ -0,0 +1,102 @@
+import pickle
+
+import pytest
+
+from texable import Table
+from texable.formatters import cell_color, italic, text_color
+from texable.rules import ColorScale, HighlightMax, HighlightMin, Matches, Threshold
+
+
+def column_latex(table: Table, col: int) -> list:
+    rows = table.grid.iter_latex_rows()
+    return [row.removesuffix(" \\\\\n").split(" & ")[col] for row in rows]
+
+
+def test_highlight_max_and_min():
+    table = Table([[3], [9], [1], [9], ["n/a"]])
+    table.columns[0].add_rules(HighlightMax(), HighlightMin(italic))
+    assert column_latex(table, 0) == ["3", r"\textbf{9}", r"\textit{1}", r"\textbf{9}", "n/a"]
+
+
+def test_threshold():
+    table = Table([[-2], [0], [5], [11]])
+    table.columns[0].add_rules(Threshold(text_color("red"), below=0), Threshold(above=0, below=10))
+    assert column_latex(table, 0) == [r"\textcolor{red}{-2}", "0", r"\textbf{5}", "11"]
+    with pytest.raises(ValueError):
+        Threshold()
+
+
+def test_matches():
+    table = Table([["TODO: x"], ["done"], ["todo"]])
+    table.columns[0].add_rules(Matches("^todo", italic, flags=2))
+    assert column_latex(table, 0) == [r"\textit{TODO: x}", "done", r"\textit{todo}"]
+
+
+def test_color_scale_uses_percentile_ranks():
+    table = Table([[1], [1000], [10], [100], [None]])
+    table.columns[0].add_rules(ColorScale("white", "green", steps=3, command="textcolor"))
+    assert column_latex(table, 0) == [
+        r"\textcolor{green!0!white}{1}",
+        r"\textcolor{green!100!white}{1000}",
+        r"\textcolor{green!33!white}{10}",
+        r"\textcolor{green!67!white}{100}",
+        "None",
+    ]
+
+
+def test_packages_are_required_once():
+    table = Table([[i, i] for i in range(50)])
+    table.columns[0].add_rules(ColorScale(), HighlightMax(cell_color("yellow")))
+    table.columns[1].add_rules(Threshold(text_color("red"), above=10))
+    assert table.to_latex().count("xcolor") == 1
+    assert r"\usepackage[table]{xcolor}" in table.to_latex()
+
+
+def test_rules_follow_value_changes():
+    table = Table([[1], [5], [3]])
+    table.incremental = True
+    table.columns[0].add_rules(HighlightMax())
+    assert r"\textbf{5}" in table.to_latex()
+    table.rows[2][0].value = 8
+    latex = table.to_latex()
+    assert r"\textbf{8}" in latex and r"\textbf{5}" not in latex
+
+
+def test_rules_apply_to_cells_and_views():
+    table = Table([[1, "a"], [5, "b"], [3, "c"]])
+    table.columns[0].add_rules(HighlightMax())
+    assert table.rows[1][0].to_latex() == r"\textbf{5}"
+    # Rules are evaluated on the whole column, also in views
+    assert r"\textbf" not in table[[0, 2]].to_latex()
+    assert table[1:].columns[0].rules == table.columns[0].rules
+
+
+def test_clear_rules():
+    table = Table([[1], [2]])
+    table.columns[0].add_rules(HighlightMax())
+    table.to_latex()
+    table.columns[0].clear_rules()
+    assert r"\textbf" not in table.to_latex()
+    assert table.columns[0].rules == []
+
+
+def test_rules_on_streamed_table(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("3\n7\n5\n")
+    table = Table.from_file(str(path), stream=True, infer_dtypes=True)
+    table.columns[0].add_rules(HighlightMin())
+    assert r"\textbf{3}" in table.to_latex()
+    path.write_text("3\n7\n2\n")
+    assert r"\textbf{2}" in table.to_latex()
+
+
+def test_only_rules_are_accepted():
+    with pytest.raises(TypeError):
+        Table([[1]]).columns[0].add_rules(italic)  # type: ignore[arg-type]
+
+
+def test_tables_with_rules_can_be_pickled():
+    table = Table([[1], [2]])
+    table.columns[0].add_rules(Matches("1"), ColorScale())
+    table.to_latex()
+    assert pickle.loads(pickle.dumps(table)).to_latex() == table.to_latex()
@@ -0,0 +1,64 @@
+import pytest
+
+from texable import Table
+from texable.formatters import bold
+
+
+def names(table: Table) -> list:
+    return [row[0].value for row in table.rows]
+
+
+def test_sort_by():
+    table = Table([["b", 3], ["a", 1], ["c", 3], ["d", 2]])
+    table.headers = ["name", "score"]
+    assert names(table.sort_by("score")) == ["a", "d", "b", "c"]
+    assert names(table.sort_by(1, reverse=True)) == ["b", "c", "d", "a"]
+    assert names(table.sort_by("name", key=lambda name: -ord(name))) == ["d", "c", "b", "a"]
+    assert names(table) == ["b", "a", "c", "d"]
+
+
+def test_filter():
+    table = Table([["b", 3], ["a", 1], ["c", 3], ["d", 2]])
+    table.headers = ["name", "score"]
+    assert names(table.filter("score", lambda score: score == 3)) == ["b", "c"]
+    assert table.filter(1, lambda score: score > 10).num_rows == 0
+
+
+def test_top_k():
+    table = Table([["b", 3], ["a", 1], ["c", 3], ["d", 2]])
+    table.headers = ["name", "score"]
+    assert names(table.top_k("score", 2)) == ["b", "c"]
+    assert names(table.top_k("score", 2, largest=False)) == ["a", "d"]
+    assert names(table.top_k("score", 10)) == ["b", "c", "d", "a"]
+    with pytest.raises(ValueError):
+        table.top_k("score", -1)
+
+
+def test_formatters_and_borders_follow_rows():
+    table = Table([["b", 3], ["a", 1], ["c", 3], ["d", 2]])
+    table.headers = ["name", "score"]
+    table.rows[1][0].add_formatters(bold)  # "a"
+    table.horizontal_borders.at(3, "double")  # Above "c", with headers set
+    latex = table.sort_by("name").to_latex()
+    body = latex[latex.index("name & score") :].splitlines()
+    assert body[1:5] == [
+        r"    \textbf{a} & 1 \\",
+        r"    b & 3 \\",
+        r"    \hline\hline",
+        r"    c & 3 \\",
+    ]
+
+
+def test_chained_operations():
+    table = Table([[i, i % 7] for i in range(100)])
+    view = table.filter(1, lambda value: value == 0).sort_by(0, reverse=True).head(3)
+    assert [row[0].value for row in view.rows] == [98, 91, 84]
+
+
+def test_bad_column_raises():
+    table = Table([["b", 3], ["a", 1], ["c", 3], ["d", 2]])
+    table.headers = ["name", "score"]
+    with pytest.raises(ValueError):
+        table.sort_by("missing")
+    with pytest.raises(TypeError):
+        table.sort_by([0])  # type: ignore[arg-type]
@@ -0,0 +1,120 @@
+import random
+
+import pytest
+
+from texable import Alignment, Table
+from texable.formatters import bold
+from texable.spans import Span, Spans
+
+
+def body(table: Table) -> list[str]:
+    lines = table.to_latex().splitlines()
+    return [line.strip() for line in lines[lines.index("    Group & a & b & c \\\\") + 2 : -3]]
+
+
+def test_merged_rows_and_columns():
+    table = Table([["g", 1, 2, 3], ["", 4, 5, 6], ["", 7, 8, 9], ["h", 1, 1, 1]])
+    table.headers = ["Group", "a", "b", "c"]
+    table.horizontal_borders.all()
+    table.vertical_borders.all()
+    table.merge(0, 0, 2, 0)
+    table.merge(3, 1, 3, 3)
+    table.merge(1, 2, 2, 3)
+    table.rows[1][2].add_formatters(bold)
+
+    assert body(table) == [
+        r"\multirow{3}{*}{g} & 1 & 2 & 3 \\",
+        r"\cline{2-4}",
+        r"& 4 & \multicolumn{2}{c|}{\multirow{2}{*}{\textbf{5}}} \\",
+        r"\cline{2-2}",
+        r"& 7 & \multicolumn{2}{c|}{} \\",
+        r"\hline",
+        r"h & \multicolumn{3}{c|}{1} \\",
+    ]
+    assert table.to_latex().startswith("\\usepackage{multirow}\n")
+    assert table.spans == [Span(0, 0, 3, 1), Span(1, 2, 2, 2), Span(3, 1, 1, 3)]
+
+
+def test_multicolumn_keeps_the_left_border_of_the_first_column():
+    table = Table([[1, 2, 3]])
+    table.vertical_borders.outer()
+    table.merge(0, 0, 0, 1)
+    assert r"\multicolumn{2}{|c}{1} & 3 \\" in table.to_latex()
+    assert "multirow" not in table.to_latex()
+
+
+def test_invalid_merges():
+    table = Table([["g", 1, 2, 3], ["", 4, 5, 6], ["", 7, 8, 9], ["h", 1, 1, 1]])
+    table.merge(1, 1, 2, 2)
+    with pytest.raises(ValueError):
+        table.merge(2, 2, 3, 3)
+    with pytest.raises(ValueError):
+        table.merge(0, 0, 0, 0)
+    with pytest.raises(ValueError):
+        table.merge(2, 0, 1, 0)
+    with pytest.raises(IndexError):
+        table.merge(0, 0, 4, 0)
+    with pytest.raises(ValueError):
+        table.unmerge(0, 0)
+
+    table.unmerge(2, 2)
+    assert table.spans == []
+    table.merge(-2, -2, -1, -1)
+    assert table.spans == [Span(2, 2, 2, 2)]
+
+
+def test_lookups_match_a_full_scan():
+    rng = random.Random(0)
+    spans = Spans()
+    for _ in range(500):
+        span = Span(rng.randrange(1000), rng.randrange(20), rng.randint(1, 6), rng.randint(1, 3))
+        if not spans.overlapping(span):
+            spans.add(span)
+    added = list(spans)
+    for _ in range(2000):
+        i, j = rng.randrange(1010), rng.randrange(24)
+        expected = [span for span in added if i in span.rows and j in span.cols]
+        assert spans.at(i, j) == (expected[0] if expected else None)
+
+    spans.remove(added[0])
+    assert spans.at(added[0].row, added[0].col) is None
+    assert len(spans) == len(added) - 1
+
+
+def test_spans_follow_inserted_and_deleted_rows():
+    table = Table([[i, i] for i in range(6)])
+    table.merge(1, 0, 3, 0)
+    table.merge(4, 0, 5, 1)
+
+    table.insert_row(2, ["x", "x"])
+    assert table.spans == [Span(1, 0, 4, 1), Span(5, 0, 2, 2)]
+
+    # The first span is left with a single cell
+    table.delete_rows([1, 2, 3, 6])
+    assert table.spans == [Span(2, 0, 1, 2)]
+    table.delete_rows(0)
+    assert table.spans == [Span(1, 0, 1, 2)]
+    table.delete_rows(1)
+    assert table.spans == []
+
+
+def test_merging_invalidates_caches():
+    table = Table([["g", 1, 2, 3], ["", 4, 5, 6], ["", 7, 8, 9], ["h", 1, 1, 1]])
+    table.vertical_borders.all()
+    table.incremental = True
+    table.to_latex()
+    table.merge(0, 1, 0, 2)
+    assert r"\multicolumn{2}{c|}{1}" in table.to_latex()
+
+    table.rows[0][1].value = 10
+    table.column_alignments[1] = Alignment.LEFT
+    assert r"\multicolumn{2}{l|}{10}" in table.to_latex()
+    table.unmerge(0, 2)
+    assert "multicolumn" not in table.to_latex()
+
+
+def test_views_do_not_keep_spans():
+    table = Table([["g", 1, 2, 3], ["", 4, 5, 6], ["", 7, 8, 9], ["h", 1, 1, 1]])
+    table.merge(0, 0, 2, 0)
+    assert table[:2].spans == []
+    assert "multirow" not in table.sort_by(1).to_latex()
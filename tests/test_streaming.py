@@ -0,0 +1,78 @@
+import io
+
+from texable import Table
+from texable.formatters import bold, text_color
+from texable.packages import require_package, required_packages
+
+
+def test_iter_latex_matches_to_latex():
+    table = Table(
+        [
+            ["a", 1, 2.5],
+            ["b", 2, 3.5],
+            ["multi\nline", 3, 4.5],
+        ]
+    )
+    table.headers = ["Name", "Count", "Value"]
+    table.caption = "Streaming"
+    table.label = "tab:streaming"
+    table.horizontal_borders.outer()
+    table.vertical_borders.all("double")
+    table.rows[0].add_formatters(bold)
+    table.rows[1][2].add_formatters(text_color("red"))
+
+    assert "".join(table.iter_latex()) == table.to_latex()
+
+
+def test_iter_latex_yields_lines():
+    table = Table([["a", 1], ["multi\nline", 2]])
+    table.headers = ["Name", "Count"]
+    table.caption = "Streaming"
+    table.horizontal_borders.all()
+    table.rows[0][1].add_formatters(text_color("red"))
+
+    lines = list(table.iter_latex())
+    assert all(line.endswith("\n") for line in lines)
+    assert all("\n" not in line[:-1] for line in lines)
+
+
+def test_iter_latex_includes_declared_packages():
+    table = Table([["x"]])
+    table.rows[0][0].add_formatters(text_color("blue"))
+    preamble = next(iter(table.iter_latex()))
+    assert preamble.startswith("\\usepackage") and "{xcolor}" in preamble
+
+
+def test_write_to_stream():
+    table = Table([["a", 1], ["b", 2]])
+    table.headers = ["Name", "Count"]
+    table.rows[0].add_formatters(bold)
+    stream = io.StringIO()
+    table.write_to(stream)
+    assert stream.getvalue() == table.to_latex()
+
+
+def test_write_to_file(tmp_path):
+    table = Table([["a", 1], ["b", 2]])
+    table.caption = "Streaming"
+    table.rows[1][1].add_formatters(text_color("red"))
+    path = tmp_path / "table.tex"
+    table.write_to_file(str(path))
+    assert path.read_text() == table.to_latex()
+
+
+def undeclared_color(text: str) -> str:
+    require_package("xcolor", ["table"])
+    return f"\\textcolor{{red}}{{{text}}}"
+
+
+def test_write_to_file_includes_packages_required_while_rendering(tmp_path):
+    table = Table([["a", 1], ["b", 2]])
+    table.headers = ["Name", "Count"]
+    table.rows[1].add_formatters(undeclared_color)
+    before = set(required_packages)
+    path = tmp_path / "table.tex"
+    table.write_to_file(str(path))
+    assert required_packages == before
+    assert "\\usepackage[table]{xcolor}" in path.read_text()
+    assert path.read_text() == table.to_latex()
@@ -0,0 +1,103 @@
+import io
+
+import pytest
+
+from texable import Table
+from texable.readers import StreamedGrid
+
+
+def old_to_text(rows, headers=None):
+    # The implementation `str(table)` had before the text renderer
+    rows = ([headers] if headers is not None else []) + rows
+    widths = [max(len(str(row[j])) for row in rows) for j in range(len(rows[0]))]
+    return "\n".join(
+        " | ".join(f"{str(value):<{widths[j]}}" for j, value in enumerate(row))
+        for row in rows
+    ).strip()
+
+
+ROWS = [[1, "alpha", 2.5], [22, "b", None], [333, "", -1.25]]
+
+
+def test_str_is_unchanged():
+    assert str(Table(ROWS)) == old_to_text(ROWS)
+    table = Table(ROWS)
+    table.headers = ["n", "name", "a long header"]
+    assert str(table) == old_to_text(ROWS, ["n", "name", "a long header"])
+
+
+def test_plain():
+    table = Table(ROWS)
+    table.headers = ["n", "name", "x"]
+    assert table.to_text() == (
+        "n   | name  | x    \n"
+        "1   | alpha | 2.5  \n"
+        "22  | b     | None \n"
+        "333 |       | -1.25"
+    )
+
+
+def test_markdown():
+    table = Table([[1, "a|b"], [10, "c"]])
+    assert table.to_text("markdown") == (
+        "|     |      |\n"
+        "| --- | ---- |\n"
+        "| 1   | a\\|b |\n"
+        "| 10  | c    |"
+    )
+
+
+def test_grid():
+    table = Table([[1, "ab"]])
+    table.headers = ["n", "name"]
+    assert table.to_text("grid") == (
+        "+---+------+\n"
+        "| n | name |\n"
+        "+===+======+\n"
+        "| 1 | ab   |\n"
+        "+---+------+"
+    )
+
+
+def test_head_and_tail():
+    table = Table([[i, i * i] for i in range(1000)])
+    assert table.to_text(head=2, tail=1) == (
+        "0   | 0     \n"
+        "1   | 1     \n"
+        "... | ...   \n"
+        "999 | 998001\n"
+        "(997 rows omitted)"
+    )
+    assert table.to_text(head=1).splitlines() == ["0   | 0  ", "... | ...", "(999 rows omitted)"]
+    assert table.to_text(tail=1).splitlines() == ["... | ...   ", "999 | 998001", "(999 rows omitted)"]
+
+
+def test_head_and_tail_covering_all_rows():
+    table = Table(ROWS)
+    assert table.to_text(head=2, tail=1) == table.to_text()
+    assert table.to_text(head=10) == table.to_text()
+
+
+def test_negative_head_raises():
+    with pytest.raises(ValueError):
+        Table(ROWS).to_text(head=-1)
+
+
+def test_unknown_style_raises():
+    with pytest.raises(ValueError):
+        Table(ROWS).to_text("html")  # type: ignore[arg-type]
+
+
+def test_write_text():
+    table = Table(ROWS)
+    stream = io.StringIO()
+    table.write_text(stream, "grid", head=1)
+    assert stream.getvalue() == table.to_text("grid", head=1) + "\n"
+
+
+def test_streamed_grid_head_and_tail(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("".join(f"{i},{i + 1}\n" for i in range(10_000)))
+    streamed = Table.from_file(str(path), stream=True)
+    assert isinstance(streamed._grid, StreamedGrid)
+    assert streamed.to_text(head=2, tail=2) == Table.from_file(str(path)).to_text(head=2, tail=2)
@@ -0,0 +1,207 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from texable import Table
+from texable.formatters import bold, italic
+from texable.instrumentation import instrument
+
+
+def test_head_matches_table_built_from_sliced_data():
+    table = Table([[i, f"name {i}", i * 10] for i in range(10)])
+    table.headers = ["id", "name", "score"]
+    table.columns[1].add_formatters(bold)
+    table.rows[1][0].add_formatters(italic)
+    table.caption = "Scores"
+
+    expected = Table([[i, f"name {i}", i * 10] for i in range(3)])
+    expected.headers = ["id", "name", "score"]
+    expected.columns[1].add_formatters(bold)
+    expected.rows[1][0].add_formatters(italic)
+    expected.caption = "Scores"
+
+    assert table.head(3).to_latex() == expected.to_latex()
+
+
+def test_getitem_with_rows_and_columns():
+    table = Table([[i, f"name {i}", i * 10] for i in range(10)])
+    table.headers = ["id", "name", "score"]
+    view = table[2:4, ["score", 0]]
+    assert view.num_rows == 2 and view.num_columns == 2
+    assert view.headers.headers == ["score", "id"]
+    assert [row[0].value for row in view.rows] == [20, 30]
+    assert "score & id" in view.to_latex()
+
+
+def test_row_index_sequences_and_negative_indices():
+    table = Table([[i, f"name {i}", i * 10] for i in range(10)])
+    table.headers = ["id", "name", "score"]
+    assert [row[0].value for row in table[[9, 0, -2]].rows] == [9, 0, 8]
+    assert [row[0].value for row in table[::-3].rows] == [9, 6, 3, 0]
+    assert [row[0].value for row in table.tail(2).rows] == [8, 9]
+
+
+def test_views_of_views_select_from_the_table():
+    table = Table([[i, f"name {i}", i * 10] for i in range(10)])
+    table.headers = ["id", "name", "score"]
+    view = table[::2][1:3, 1:]
+    assert view.grid.base is table.grid
+    assert [row[0].value for row in view.rows] == ["name 2", "name 4"]
+
+
+def test_views_share_values_and_formatters():
+    table = Table([[i, f"name {i}", i * 10] for i in range(10)])
+    table.headers = ["id", "name", "score"]
+    view = table[5:8]
+    table.rows[6][0].value = "changed"
+    table.rows[5][1].add_formatters(italic)
+    latex = view.to_latex()
+    assert "changed" in latex
+    assert r"\textit{name 5}" in latex
+
+    view.rows[0][2].value = -1
+    view.columns[0].add_formatters(bold)
+    assert table.rows[5][2].value == -1
+    assert r"\textbf{5}" in table.to_latex()
+    assert r"\textbf{4}" not in table.to_latex()
+
+
+def test_view_settings_are_independent():
+    table = Table([[i, f"name {i}", i * 10] for i in range(10)])
+    table.headers = ["id", "name", "score"]
+    table.label = "tab:scores"
+    view = table.head(2)
+    view.headers = ["a", "b", "c"]
+    assert table.headers.headers == ["id", "name", "score"]
+    assert view.label is None
+
+
+def test_borders_are_remapped():
+    table = Table([[i, f"name {i}", i * 10] for i in range(10)])
+    table.headers = ["id", "name", "score"]
+    table.vertical_borders.at(2)
+    table.horizontal_borders.outer()
+    table.horizontal_borders.at(1)
+    view = table.select(columns=[1, 2], rows=slice(4, 6))
+    assert view.vertical_borders.borders == ["", "|", ""]
+    assert view.horizontal_borders.borders == [r"\hline", r"\hline", r"\hline"]
+
+
+@pytest.mark.parametrize("with_headers", [False, True])
+@pytest.mark.parametrize("style", ["all", "inner", "outer"])
+@pytest.mark.parametrize(
+    "select, indexes",
+    [
+        (lambda t: t.sort_by(0, reverse=True), [3, 2, 1, 0]),
+        (lambda t: t.tail(2), [2, 3]),
+        (lambda t: t.tail(3), [1, 2, 3]),
+        (lambda t: t.select(rows=[2, 0, 3]), [2, 0, 3]),
+        (lambda t: t.select(rows=slice(1, 3)), [1, 2]),
+    ],
+)
+def test_uniform_borders_match_table_built_from_selected_rows(
+    bordered_table, style, with_headers, select, indexes
+):
+    rows = [[i, f"name {i}"] for i in range(4)]
+    view = select(bordered_table(rows, style, with_headers))
+    expected = bordered_table([rows[i] for i in indexes], style, with_headers)
+    assert view.to_latex() == expected.to_latex()
+
+
+def test_inner_borders_never_become_outer_borders():
+    table = Table([[1], [2], [3]])
+    table.horizontal_borders.inner()
+    lines = table.sort_by(0, reverse=True).to_latex().splitlines()
+    assert lines[3:8] == [r"    3 \\", r"    \hline", r"    2 \\", r"    \hline", r"    1 \\"]
+
+
+def test_views_are_out_of_date_after_deleting_rows():
+    table = Table([[i, f"name {i}", i * 10] for i in range(10)])
+    table.headers = ["id", "name", "score"]
+    view = table.sort_by(0, reverse=True)
+    table.delete_rows([0, 1, 2])
+
+    with pytest.raises(ValueError, match="out of date"):
+        view.to_latex()
+    with pytest.raises(ValueError, match="out of date"):
+        view.head(2)
+    # New views see the remaining rows
+    assert [row[0].value for row in table.sort_by(0, reverse=True).rows][-1] == 3
+
+
+def test_views_are_out_of_date_after_inserting_rows():
+    table = Table([[i, f"name {i}", i * 10] for i in range(10)])
+    table.headers = ["id", "name", "score"]
+    view = table[1:3]
+    table.insert_row(0, [99, "new", 0])
+
+    with pytest.raises(ValueError, match="out of date"):
+        view.to_latex()
+    with pytest.raises(ValueError, match="out of date"):
+        view.rows[0][0].value
+    assert [row[0].value for row in table[1:3].rows] == [0, 1]
+
+
+def test_views_stay_current_after_appending_rows():
+    table = Table([[i, f"name {i}", i * 10] for i in range(10)])
+    table.headers = ["id", "name", "score"]
+    view = table[1:3]
+    latex = view.to_latex()
+    table.append_row([10, "name 10", 100])
+    assert view.to_latex() == latex
+
+
+def test_unknown_header_and_bad_index_raise():
+    table = Table([[i, f"name {i}", i * 10] for i in range(10)])
+    table.headers = ["id", "name", "score"]
+    with pytest.raises(ValueError):
+        table.select(columns=["missing"])
+    with pytest.raises(IndexError):
+        table[10]
+    with pytest.raises(TypeError):
+        table[1, 2, 3]
+    with pytest.raises(ValueError):
+        table.head(-1)
+
+
+def test_view_renders_only_selected_cells():
+    table = Table([[i, i] for i in range(100_000)])
+    view = table[10:20, [1]]
+    with instrument() as stats:
+        view.to_latex()
+    assert stats[0].rows == 10 and stats[0].cells == 10
+
+
+def test_view_of_numpy_table():
+    table = Table.from_ndarray(np.arange(12).reshape(4, 3))
+    assert [row[0].value for row in table[[3, 1], 2].rows] == [11, 5]
+    assert "11 \\\\" in table[[3, 1], 2].to_latex()
+
+
+def test_incremental_view_rerenders_changed_rows():
+    table = Table([[i, f"name {i}", i * 10] for i in range(10)])
+    table.headers = ["id", "name", "score"]
+    view = table[[1, 3, 5]]
+    view.incremental = True
+    view.to_latex()
+    table.rows[3][1].value = "new"
+    table.rows[4][1].value = "not shown"
+    assert "new" in view.to_latex()
+    assert "not shown" not in view.to_latex()
+
+
+def test_view_of_streamed_table(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("".join(f"{i},{i * i}\n" for i in range(100)))
+    streamed = Table.from_file(str(path), stream=True)
+    assert streamed[95:97].to_text() == "95 | 9025\n96 | 9216"
+    with pytest.raises(TypeError):
+        streamed[[1, 2]]
+
+
+def test_views_can_be_pickled():
+    table = Table([[i, f"name {i}", i * 10] for i in range(10)])
+    table.headers = ["id", "name", "score"]
+    view = table[1:3]
+    assert pickle.loads(pickle.dumps(view)).to_latex() == view.to_latex()